@@ -0,0 +1,21 @@
+"""
+Benchmarks
+
+Performans ölçüm senaryoları:
+
+    python -m benchmarks.e2e               # mesaj → Notion güncelleme hattı (yerel stand-in)
+    python -m benchmarks.parser_bench      # parser ve satır eşleştirici (sentetik Türkçe veri)
+    python benchmarks/transport_bench.py   # Selenium / CDP okuma yolları (çevrimdışı fikstür)
+
+Sonuçlar benchmarks/results/ altına JSON olarak yazılır.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
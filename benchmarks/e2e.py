@@ -0,0 +1,207 @@
+"""
+End-to-end Benchmark
+
+Gerçek MessageParser → Updater → NotionClient hattını yerel Notion stand-in
+sunucusuna karşı çalıştırır; throughput, p50/p99 gecikme ve mesaj başına API
+çağrısı sayısını raporlar.
+
+Kullanım:
+    python -m benchmarks.e2e                         # tüm senaryolar
+    python -m benchmarks.e2e --scenario backlog --latency 0.02
+    python -m benchmarks.e2e --compare benchmarks/results/e2e_<eski>.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from benchmarks import RESULTS_DIR, ROOT
+
+from core.message_parser import MessageParser
+from core.notion_client import NotionClient
+from core.updater import Updater
+from utils.metrics import get_metrics
+from utils.notion_standin import NotionStandIn
+
+# ad → (açıklama, database satır sayısı, mesaj sayısı, 429 olasılığı)
+SCENARIOS = {
+    "single": ("50 satırlık DB'ye tek mesaj", 50, 1, 0.0),
+    "backlog": ("5.000 satırlık DB'ye 500 mesajlık birikim", 5000, 500, 0.0),
+    "burst_429": ("429'lu 100 durum değişikliği", 500, 100, 0.2),
+}
+
+STATUS_WORDS = ["gidildi", "iptal", "kaldı"]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Sıralı olmayan listeden yüzdelik (en yakın sıra) hesaplar.
+
+    Args:
+        values: Değerler
+        q: 0-100 arası yüzdelik
+
+    Returns:
+        float: Yüzdelik değeri
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def _quiet_logger() -> logging.Logger:
+    # NotionClient kendi logger'ını kullanır; 429 uyarıları ölçümü kirletmesin
+    for name in ("benchmark.e2e", "WhatsAppNotionBot"):
+        logger = logging.getLogger(name)
+        logger.handlers = [logging.NullHandler()]
+        logger.propagate = False
+    return logger
+
+
+def run_scenario(name: str, latency: float = 0.0, seed: int = 42,
+                 repeat: int = 1) -> Dict[str, Any]:
+    """
+    Bir senaryoyu yeni bir stand-in üzerinde çalıştırır.
+
+    Args:
+        name: SCENARIOS anahtarı
+        latency: Stand-in istek gecikmesi (saniye)
+        seed: Rastgelelik tohumu
+        repeat: Tek mesajlık senaryolarda tekrar sayısı (gecikme dağılımı için)
+
+    Returns:
+        Dict[str, Any]: Senaryo sonuçları
+    """
+    description, rows, messages, rate_limit = SCENARIOS[name]
+    standin = NotionStandIn(latency=latency, rate_limit_probability=rate_limit,
+                            retry_after=0.05, seed=seed).start()
+    try:
+        _, db_id = standin.add_date_page(date.today(), [])
+        for n in range(rows):
+            standin.add_row(db_id, f"Müşteri {n + 1:05d}")
+        names = standin.row_names(db_id)
+
+        client = NotionClient("secret_benchmark", standin.parent_page_id, base_url=standin.base_url)
+        client.max_retries = 10
+        updater = Updater(client, MessageParser(), _quiet_logger())
+        texts = [
+            f"{standin.random.choice(names)} {STATUS_WORDS[i % len(STATUS_WORDS)]}"
+            for i in range(messages * max(1, repeat))
+        ]
+
+        standin.reset_counters()
+        metrics = get_metrics()
+        metrics.reset()
+        latencies = []
+        start = time.perf_counter()
+        for text in texts:
+            message_start = time.perf_counter()
+            updater.process_text(text, db_id)
+            latencies.append(time.perf_counter() - message_start)
+        elapsed = time.perf_counter() - start
+
+        outcomes = {
+            labels.get("outcome", ""): value
+            for labels, value in _counter_values(metrics.snapshot(), "updater_messages_total")
+        }
+        return {
+            "description": description,
+            "rows": rows,
+            "messages": len(texts),
+            "latency_s": latency,
+            "seconds": round(elapsed, 4),
+            "throughput_msg_s": round(len(texts) / elapsed, 2) if elapsed else None,
+            "p50_ms": round(statistics.median(latencies) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "api_calls": standin.total_requests,
+            "api_calls_per_message": round(standin.total_requests / len(texts), 2),
+            "api_calls_by_endpoint": dict(standin.requests),
+            "rate_limited": standin.requests.get("rate_limited", 0),
+            "outcomes": outcomes,
+        }
+    finally:
+        standin.stop()
+
+
+def _counter_values(snapshot: Dict[str, Any], name: str):
+    for entry in snapshot.get("counters", {}).get(name, []):
+        yield entry.get("labels", {}), entry.get("value", 0)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """
+    İki çalıştırmanın senaryo sonuçlarını yan yana yazdırır.
+
+    Args:
+        current: Yeni sonuç
+        previous: Eski sonuç
+    """
+    print(f"\nKarşılaştırma: {previous.get('commit')} → {current.get('commit')}")
+    for name, result in current["scenarios"].items():
+        old = previous.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        for key in ("throughput_msg_s", "p50_ms", "p99_ms", "api_calls_per_message"):
+            before, after = old.get(key), result.get(key)
+            if before:
+                change = (after - before) / before * 100
+                print(f"  {name:<10} {key:<22} {before:>10} → {after:<10} ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesaj → Notion güncelleme hattı benchmark'ı")
+    parser.add_argument("--scenario", choices=list(SCENARIOS) + ["all"], default="all")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in istek gecikmesi (saniye)")
+    parser.add_argument("--repeat", type=int, default=20, help="Tek mesaj senaryosunun tekrar sayısı")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Sonuç JSON yolu (varsayılan benchmarks/results/e2e_<zaman>_<commit>.json)")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki sonuç JSON'u")
+    args = parser.parse_args()
+
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    result = {
+        "benchmark": "e2e",
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+    for name in names:
+        repeat = args.repeat if SCENARIOS[name][2] == 1 else 1
+        scenario = run_scenario(name, latency=args.latency, seed=args.seed, repeat=repeat)
+        result["scenarios"][name] = scenario
+        print(f"{name:<10} {scenario['messages']:>5} mesaj  {scenario['throughput_msg_s']:>8} msg/s  "
+              f"p50={scenario['p50_ms']:.1f}ms  p99={scenario['p99_ms']:.1f}ms  "
+              f"API/mesaj={scenario['api_calls_per_message']}  429={scenario['rate_limited']}")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = args.output or RESULTS_DIR / f"e2e_{datetime.now():%Y%m%d_%H%M%S}_{result['commit'] or 'local'}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"\nSonuç yazıldı: {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(result, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Parser / Matcher Benchmark
+
+MessageParser.parse_message ve satır eşleştirici (core.row_matcher.match_row)
+için sentetik Türkçe veriyle mikro benchmark. Mesaj/saniye, tracemalloc tepe
+belleği ve kalıcı bellek bloklarını raporlar; eşik veya önceki sonuçtan belirgin
+yavaşlamada sıfırdan farklı kodla çıkar.
+
+Kullanım:
+    python -m benchmarks.parser_bench                         # 10k ve 100k mesaj
+    python -m benchmarks.parser_bench --sizes 10000 1000000 --rows 2000
+    python -m benchmarks.parser_bench --check                 # GUARDS eşikleri
+    python -m benchmarks.parser_bench --baseline benchmarks/results/parser_<eski>.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from benchmarks import RESULTS_DIR
+from benchmarks.e2e import git_commit
+from benchmarks.turkish_data import generate_messages, generate_names, iter_messages, make_rows
+
+from core.message_parser import MessageParser
+from core.row_matcher import match_row
+
+# Yavaş bir makinede bile aşılması gereken alt sınırlar (işlem/saniye) ve
+# tek çağrının geçici bellek tepesi için üst sınır; aşılırsa sıcak yol bozulmuş demektir
+GUARDS = {
+    "parse_msg_s": 30000,
+    "match_lookups_s": 300,
+    "parse_peak_bytes": 4096,
+}
+
+# --baseline ile karşılaştırılan metrikler (yüksek olan iyi)
+THROUGHPUT_KEYS = ("parse_msg_s", "match_lookups_s")
+
+
+def measure(func: Callable[[Any], Any], items: List[Any]) -> float:
+    """
+    Fonksiyonu tüm öğeler için çalıştırıp saniyedeki işlem sayısını döndürür.
+
+    Args:
+        func: Tek öğe alan fonksiyon
+        items: Öğeler
+
+    Returns:
+        float: İşlem/saniye
+    """
+    gc.collect()
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    return len(items) / elapsed if elapsed else float("inf")
+
+
+def allocations(func: Callable[[Any], Any], items: List[Any]) -> Dict[str, float]:
+    """
+    tracemalloc ile tepe ve kalıcı bellek kullanımını ölçer.
+
+    Args:
+        func: Tek öğe alan fonksiyon
+        items: Öğeler
+
+    Returns:
+        Dict[str, float]: peak_bytes (tek çağrının en yüksek geçici belleği), retained_kb,
+            retained_blocks (döngüden sonra kalan yeni bellek blokları)
+    """
+    gc.collect()
+    tracemalloc.start()
+    worst = 0
+    try:
+        before = tracemalloc.take_snapshot()
+        base_current, _ = tracemalloc.get_traced_memory()
+        for item in items:
+            call_start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func(item)
+            worst = max(worst, tracemalloc.get_traced_memory()[1] - call_start)
+        current, _ = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return {
+        "peak_bytes": worst,
+        "retained_kb": round((current - base_current) / 1024, 2),
+        "retained_blocks": sum(stat.count_diff for stat in stats if stat.count_diff > 0),
+    }
+
+
+def run(size: int, rows: int, seed: int, match_limit: int) -> Dict[str, Any]:
+    """
+    Bir veri boyutu için parser ve eşleştirici ölçümlerini yapar.
+
+    Args:
+        size: Mesaj sayısı
+        rows: Database satır sayısı
+        seed: Rastgelelik tohumu
+        match_limit: Eşleştiricide kullanılacak en fazla mesaj (satır sayısıyla çarpılır)
+
+    Returns:
+        Dict[str, Any]: Sonuçlar
+    """
+    names = generate_names(rows, seed=seed)
+    # 1M mesajda Sample listesi tutulmaz; aynı tohumla ilk match_limit mesaj aynıdır
+    texts = [sample.text for sample in iter_messages(names, size, seed=seed)]
+    samples = generate_messages(names, min(size, match_limit), seed=seed)
+    parser = MessageParser()
+
+    parse_rate = measure(parser.parse_message, texts)
+    parse_alloc = allocations(parser.parse_message, texts[:min(size, 20000)])
+
+    # Eşleştirici: satır sayısına göre doğrusal, bu yüzden mesajlar sınırlanır
+    table = make_rows(names)
+    lookups = [(sample, parser.parse_message(sample.text)["name"])
+               for sample in samples if sample.status]
+    match_rate = measure(lambda lookup: match_row(table, lookup[1]), lookups)
+    match_alloc = allocations(lambda lookup: match_row(table, lookup[1]), lookups[:2000])
+
+    # Yazım biçimine göre eşleşme kalitesi (doğru / yanlış satır / bulunamadı)
+    expected = {name: row["id"] for name, row in zip(names, table)}
+    quality = Counter()
+    for sample, name in lookups:
+        row = match_row(table, name)
+        outcome = "miss" if row is None else ("ok" if row["id"] == expected[sample.name] else "wrong")
+        quality[f"{sample.style}:{outcome}"] += 1
+
+    return {
+        "messages": size,
+        "rows": rows,
+        "parse_msg_s": round(parse_rate, 1),
+        "parse_peak_bytes": parse_alloc["peak_bytes"],
+        "parse_retained_kb": parse_alloc["retained_kb"],
+        "parse_retained_blocks": parse_alloc["retained_blocks"],
+        "match_lookups": len(lookups),
+        "match_lookups_s": round(match_rate, 1),
+        "match_peak_bytes": match_alloc["peak_bytes"],
+        "match_quality": dict(sorted(quality.items())),
+    }
+
+
+def check_guards(results: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Sonuçları GUARDS eşikleriyle karşılaştırır.
+
+    Args:
+        results: Boyut → sonuç
+
+    Returns:
+        List[str]: İhlaller
+    """
+    failures = []
+    for size, result in results.items():
+        for key in THROUGHPUT_KEYS:
+            if result[key] < GUARDS[key]:
+                failures.append(f"{size}: {key}={result[key]} < {GUARDS[key]}")
+        if result["parse_peak_bytes"] > GUARDS["parse_peak_bytes"]:
+            failures.append(f"{size}: parse_peak_bytes={result['parse_peak_bytes']} > {GUARDS['parse_peak_bytes']}")
+    return failures
+
+
+def compare_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+                     tolerance: float) -> List[str]:
+    """
+    Throughput metriklerini önceki sonuçla karşılaştırır.
+
+    Args:
+        results: Boyut → sonuç
+        baseline: Önceki çalıştırmanın JSON'u
+        tolerance: İzin verilen göreli yavaşlama (0.2 = %20)
+
+    Returns:
+        List[str]: Toleransı aşan yavaşlamalar
+    """
+    failures = []
+    for size, result in results.items():
+        old = baseline.get("sizes", {}).get(size)
+        if not old:
+            continue
+        for key in THROUGHPUT_KEYS:
+            before, after = old.get(key), result.get(key)
+            if not before:
+                continue
+            change = (after - before) / before
+            print(f"  {size:>8} {key:<18} {before:>12} → {after:<12} ({change * 100:+.1f}%)")
+            if change < -tolerance:
+                failures.append(f"{size}: {key} %{-change * 100:.0f} yavaşladı")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser ve satır eşleştirici mikro benchmark'ı")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="Mesaj sayıları")
+    parser.add_argument("--rows", type=int, default=500, help="Database satır sayısı")
+    parser.add_argument("--match-limit", type=int, default=20000, help="Eşleştiricide en fazla mesaj")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--check", action="store_true", help="GUARDS eşiklerinin altında kalırsa başarısız ol")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç JSON'u")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Baseline'a göre izin verilen yavaşlama")
+    parser.add_argument("--output", help="Sonuç JSON yolu (varsayılan benchmarks/results/parser_<zaman>_<commit>.json)")
+    args = parser.parse_args()
+
+    result = {
+        "benchmark": "parser",
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": {},
+    }
+    for size in args.sizes:
+        run_result = run(size, args.rows, args.seed, args.match_limit)
+        result["sizes"][str(size)] = run_result
+        print(f"{size:>8} mesaj  parse={run_result['parse_msg_s']:>10.0f} msg/s "
+              f"(tepe {run_result['parse_peak_bytes']} B)  "
+              f"match={run_result['match_lookups_s']:>8.0f} arama/s ({args.rows} satır)")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = args.output or RESULTS_DIR / f"parser_{datetime.now():%Y%m%d_%H%M%S}_{result['commit'] or 'local'}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"\nSonuç yazıldı: {output}")
+
+    failures = check_guards(result["sizes"]) if args.check else []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            print(f"\nBaseline: {args.baseline}")
+            failures += compare_baseline(result["sizes"], json.load(f), args.tolerance)
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
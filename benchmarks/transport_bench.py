@@ -0,0 +1,97 @@
+"""
+Transport Benchmark
+
+Çevrimdışı sohbet fikstürü üzerinde mesaj satırı okuma yollarını karşılaştırır:
+
+  legacy    - satır başına find_elements + .text (eski get_messages_by_date döngüsü)
+  selenium  - tek execute_script ile toplu okuma (SeleniumTransport)
+  cdp       - Runtime.evaluate ile toplu okuma, chromedriver atlanır (CDPTransport)
+
+Kullanım:
+    python benchmarks/transport_bench.py --days 5 --per-day 200 --iterations 20
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from core.page_transport import CDPTransport, SeleniumTransport
+
+FIXTURE = ROOT / "benchmarks" / "fixtures" / "chat_fixture.html"
+
+
+def legacy_extract(driver):
+    rows = driver.find_elements(By.CSS_SELECTOR, "div[role='row']")
+    result = []
+    for row in rows:
+        raw = row.text.strip()
+        spans = row.find_elements(By.CSS_SELECTOR, ".selectable-text span")
+        result.append({"raw": raw, "text": spans[-1].text.strip() if spans else raw})
+    return result
+
+
+def measure(name, func, iterations):
+    timings = []
+    count = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        count = len(func())
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{name:<10} satır={count:<6} medyan={statistics.median(timings) * 1000:8.1f}ms "
+          f"p95={p95 * 1000:8.1f}ms")
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Selenium / CDP okuma yolu karşılaştırması")
+    parser.add_argument("--days", type=int, default=5, help="Fikstürdeki gün sayısı")
+    parser.add_argument("--per-day", type=int, default=200, help="Gün başına mesaj sayısı")
+    parser.add_argument("--iterations", type=int, default=20, help="Yol başına tekrar sayısı")
+    parser.add_argument("--skip-legacy", action="store_true", help="Satır başına okuma yolunu atla (büyük fikstürlerde yavaş)")
+    args = parser.parse_args()
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    driver = webdriver.Chrome(options=options)
+    logger = logging.getLogger("transport_bench")
+    logging.basicConfig(level=logging.INFO)
+
+    cdp = None
+    try:
+        driver.get(f"{FIXTURE.as_uri()}?days={args.days}&per_day={args.per_day}")
+        selenium_transport = SeleniumTransport(driver)
+        cdp = CDPTransport(driver, logger).connect()
+
+        results = {}
+        if not args.skip_legacy:
+            results["legacy"] = measure("legacy", lambda: legacy_extract(driver), args.iterations)
+        results["selenium"] = measure("selenium", selenium_transport.extract_rows, args.iterations)
+        results["cdp"] = measure("cdp", cdp.extract_rows, args.iterations)
+
+        baseline = results.get("legacy", results["selenium"])
+        for name, value in results.items():
+            print(f"{name:<10} hızlanma: x{baseline / value:.1f}")
+
+        # Kaydırma komutu: chromedriver ActionChains vs Input.dispatchKeyEvent
+        measure("scroll-sel", lambda: [selenium_transport.page_up()], args.iterations)
+        measure("scroll-cdp", lambda: [cdp.page_up()], args.iterations)
+    finally:
+        if cdp:
+            cdp.close()
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
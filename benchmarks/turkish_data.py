@@ -0,0 +1,219 @@
+"""
+Turkish Data
+
+Parser ve satır eşleştirici benchmark'ları / property testleri için sentetik
+Türkçe isim ve mesaj üreteci. Aynı tohumla her zaman aynı veriyi üretir.
+
+İsimler Türkçe karakterli (ç, ğ, ı, İ, ö, ş, ü) ve bileşik ad içerebilir
+("Yüksel Can Aydın"); mesajlar farklı şablon ve yazımlarla (normal, küçük harf,
+Türkçe BÜYÜK HARF, harf hatası, Türkçe karaktersiz) üretilir.
+"""
+
+import random
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+FIRST_NAMES = [
+    "Ahmet", "Ayşe", "Mehmet", "Fatma", "Mustafa", "Emine", "Ali", "Hatice", "Hüseyin", "Zeynep",
+    "Hasan", "Elif", "İbrahim", "Şükrü", "Özlem", "Gülşen", "Çağrı", "Ömer", "Ümit", "Songül",
+    "Yüksel", "Aynur", "Selma", "İlker", "Işıl", "Doğan", "Gökhan", "Şeyma", "Büşra", "Tuğba",
+    "Can", "Nur", "Cem", "Ece", "Oğuz", "Sevgi", "Ilgın", "Ağah", "Görkem", "Çiğdem",
+]
+
+# Bileşik adların ikinci parçası ("Yüksel Can", "Ayşe Nur")
+SECOND_NAMES = ["Can", "Nur", "Su", "Naz", "Ali", "Efe", "Gül", "Deniz", "Kaan", "Sena"]
+
+SURNAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+    "Polat", "Öz", "Güneş", "Işık", "Erdoğan", "Acar", "Uçar", "Tekin", "Bulut", "Ünal",
+]
+
+# (şablon, parser'ın döndürmesi beklenen durum)
+STATUS_TEMPLATES = [
+    ("{name} {iptal}", "iptal"),
+    ("{name} {ertelendi}", "kaldı"),
+    ("{name} {kaldı}", "kaldı"),
+    ("{name} {kaldi}", "kaldı"),
+    ("{name} {gidildi}", "gidildi"),
+    ("{name}  {iptal} ", "iptal"),
+]
+
+NOISE_TEMPLATES = [
+    "{name} merhaba",
+    "Günaydın",
+    "{name} yarın aranacak",
+    "Teşekkürler 🙏",
+    "{name} adres değişti",
+]
+
+KEYWORDS = ["iptal", "ertelendi", "kaldı", "kaldi", "gidildi"]
+
+# Yazım biçimleri ve ağırlıkları
+STYLES = ["normal", "lower", "upper", "typo", "ascii"]
+STYLE_WEIGHTS = [60, 10, 15, 10, 5]
+
+_ASCII_MAP = str.maketrans("çğıİöşüÇĞÖŞÜ", "cgiIosuCGOSU")
+
+
+class Sample(NamedTuple):
+    """
+    Üretilmiş mesaj ve beklenen parse sonucu.
+    """
+    text: str
+    name: Optional[str]          # satırdaki asıl isim (gürültü mesajında None)
+    status: Optional[str]        # beklenen durum
+    style: str                   # yazım biçimi
+
+
+def turkish_upper(text: str) -> str:
+    """
+    Türkçe kurallarıyla büyük harfe çevirir (i → İ, ı → I).
+
+    Args:
+        text: Metin
+
+    Returns:
+        str: Büyük harfli metin
+    """
+    return text.replace("i", "İ").upper()
+
+
+def turkish_lower(text: str) -> str:
+    """
+    Türkçe kurallarıyla küçük harfe çevirir (İ → i, I → ı).
+    """
+    return text.replace("İ", "i").replace("I", "ı").lower()
+
+
+def make_typo(text: str, rng: random.Random) -> str:
+    """
+    Metinde bir harf hatası yapar (komşu harfleri değiştirme, harf düşürme veya tekrarlama).
+
+    Args:
+        text: Metin
+        rng: Rastgele sayı üreteci
+
+    Returns:
+        str: Hatalı metin
+    """
+    positions = [i for i, ch in enumerate(text[:-1]) if ch.isalpha() and text[i + 1].isalpha()]
+    if not positions:
+        return text
+    i = rng.choice(positions)
+    kind = rng.randrange(3)
+    if kind == 0:
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if kind == 1:
+        return text[:i] + text[i + 1:]
+    return text[:i] + text[i] + text[i:]
+
+
+def generate_names(count: int, seed: int = 42, compound_ratio: float = 0.2) -> List[str]:
+    """
+    Benzersiz Türkçe ad soyad listesi üretir.
+
+    Args:
+        count: İsim sayısı
+        seed: Rastgelelik tohumu
+        compound_ratio: Bileşik ad oranı
+
+    Returns:
+        List[str]: İsimler
+    """
+    rng = random.Random(seed)
+    names, seen = [], set()
+    # Kombinasyonlar tükenirse ikinci soyad eklenir
+    while len(names) < count:
+        first = rng.choice(FIRST_NAMES)
+        if rng.random() < compound_ratio:
+            second = rng.choice(SECOND_NAMES)
+            if second != first:
+                first = f"{first} {second}"
+        surname = rng.choice(SURNAMES)
+        if len(seen) > len(FIRST_NAMES) * len(SURNAMES) // 2:
+            surname = f"{surname} {rng.choice(SURNAMES)}"
+        name = f"{first} {surname}"
+        if turkish_lower(name) in seen:
+            continue
+        seen.add(turkish_lower(name))
+        names.append(name)
+    return names
+
+
+def _keyword_forms(style: str) -> Dict[str, str]:
+    if style == "upper":
+        return {keyword: turkish_upper(keyword) for keyword in KEYWORDS}
+    if style == "normal":
+        return {keyword: keyword.capitalize() if keyword == "gidildi" else keyword for keyword in KEYWORDS}
+    return {keyword: keyword for keyword in KEYWORDS}
+
+
+def _styled_name(name: str, style: str, rng: random.Random) -> str:
+    if style == "lower":
+        return turkish_lower(name)
+    if style == "upper":
+        return turkish_upper(name)
+    if style == "typo":
+        return make_typo(name, rng)
+    if style == "ascii":
+        return name.translate(_ASCII_MAP)
+    return name
+
+
+def iter_messages(names: List[str], count: int, seed: int = 42,
+                  noise_ratio: float = 0.1) -> Iterator[Sample]:
+    """
+    İsim listesinden mesaj üretir.
+
+    Args:
+        names: İsimler (generate_names çıktısı)
+        count: Mesaj sayısı
+        seed: Rastgelelik tohumu
+        noise_ratio: Durum içermeyen mesaj oranı
+
+    Returns:
+        Iterator[Sample]: Mesajlar
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        name = rng.choice(names)
+        style = rng.choices(STYLES, STYLE_WEIGHTS)[0]
+        written = _styled_name(name, style, rng)
+        if rng.random() < noise_ratio:
+            yield Sample(rng.choice(NOISE_TEMPLATES).format(name=written), name, None, style)
+            continue
+        template, status = rng.choice(STATUS_TEMPLATES)
+        yield Sample(template.format(name=written, **_keyword_forms(style)), name, status, style)
+
+
+def generate_messages(names: List[str], count: int, seed: int = 42,
+                      noise_ratio: float = 0.1) -> List[Sample]:
+    """
+    iter_messages'in liste hali.
+    """
+    return list(iter_messages(names, count, seed, noise_ratio))
+
+
+def make_rows(names: List[str], status_type: str = "status") -> List[Dict]:
+    """
+    İsimlerden databases.query sonucu biçiminde satırlar üretir.
+
+    Args:
+        names: İsimler
+        status_type: Durum alanı tipi
+
+    Returns:
+        List[Dict]: Satırlar
+    """
+    rows = []
+    for index, name in enumerate(names):
+        rows.append({
+            "object": "page",
+            "id": f"row-{index:07d}",
+            "properties": {
+                "Durum": {"type": status_type, status_type: None},
+                "Ad Soyad": {"type": "title", "title": [{"plain_text": name, "text": {"content": name}}]},
+                "Not": {"type": "rich_text", "rich_text": []},
+            },
+        })
+    return rows
@@ -1,4 +1,7 @@
+import argparse
+import os
 import re
+import sys
 import time
 from collections import defaultdict
 from selenium import webdriver
@@ -153,4 +156,27 @@ def test_pazar_to_sali(group_name: str, max_scrolls: int = 300):
 
 # Doğrudan çalıştırma
 if __name__ == "__main__":
-    test_pazar_to_sali("Takip Grubu", max_scrolls=300)
+    arg_parser = argparse.ArgumentParser(description="Pazar → Salı kaydırma testi")
+    arg_parser.add_argument("--group", default="Takip Grubu", help="Grup adı")
+    arg_parser.add_argument("--max-scrolls", type=int, default=300)
+    arg_parser.add_argument(
+        "--profile", type=int, nargs="?", const=1, default=None, metavar="N",
+        help="Taramayı N kez çalıştırıp profili logs/ altına yaz"
+    )
+    cli_args = arg_parser.parse_args()
+
+    if cli_args.profile:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+        from utils.profiler import ScanProfiler
+
+        profiler = ScanProfiler("scroll_test")
+        for _ in range(cli_args.profile):
+            profiler.enable()
+            test_pazar_to_sali(cli_args.group, max_scrolls=cli_args.max_scrolls)
+            profiler.disable()
+        prof_path, summary_path = profiler.write_report()
+        with open(summary_path, encoding="utf-8") as f:
+            print("\n".join(f.read().splitlines()[:6]))
+        print(f"📝 Profil yazıldı: {prof_path}")
+    else:
+        test_pazar_to_sali(cli_args.group, max_scrolls=cli_args.max_scrolls)
@@ -0,0 +1,115 @@
+"""
+Archive CLI
+
+Yerel mesaj arşivinde (utils.message_archive) WhatsApp Web'i açmadan arama yapar.
+
+Kullanım:
+    python src/archive_cli.py search "ahmet iptal" [--chat "Grup"] [--from 01.09.2025] [--to 27.09.2025]
+    python src/archive_cli.py search 'ahmet NOT kaldi' --raw
+    python src/archive_cli.py stats [--db data/message_archive.sqlite]
+    python src/archive_cli.py mirror --from 21.09.2025 [--to 27.09.2025] [--group "Grup"]
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import time
+
+from utils.config_loader import ConfigLoader
+from utils.date_utils import date_range, format_date, parse_date
+from utils.message_archive import MessageArchive
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Yerel WhatsApp mesaj arşivinde arama")
+    parser.add_argument("--db", help="Arşiv dosyası (varsayılan: konfigürasyondaki archive.path)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Tam metin araması")
+    search.add_argument("query", help="Aranacak kelimeler (hepsi geçmeli, son kelime önek olarak aranır)")
+    search.add_argument("--chat", help="Sadece bu grup")
+    search.add_argument("--sender", help="Gönderen adında geçen metin")
+    search.add_argument("--from", dest="start_date", help="Başlangıç tarihi (gg.aa.yyyy)")
+    search.add_argument("--to", dest="end_date", help="Bitiş tarihi (gg.aa.yyyy)")
+    search.add_argument("--limit", type=int, default=50, help="En fazla sonuç")
+    search.add_argument("--raw", action="store_true", help="Sorguyu FTS5 sözdizimiyle olduğu gibi kullan")
+
+    commands.add_parser("stats", help="Grup başına mesaj sayısı ve tarih aralığı")
+
+    mirror = commands.add_parser("mirror", help="Arşivlenen günlük mesajları Notion tarih sayfalarına ekle")
+    mirror.add_argument("--from", dest="start_date", required=True, help="Başlangıç tarihi (gg.aa.yyyy)")
+    mirror.add_argument("--to", dest="end_date", help="Bitiş tarihi (gg.aa.yyyy, varsayılan başlangıç)")
+    mirror.add_argument("--group", help="Grup adı (varsayılan: konfigürasyondaki ilk grup)")
+    return parser.parse_args()
+
+
+def mirror_days(config: ConfigLoader, archive: MessageArchive, args) -> int:
+    """
+    Tarih aralığındaki günleri Notion'a aktarır (kaldığı yerden devam eder).
+
+    Args:
+        config: ConfigLoader instance
+        archive: MessageArchive
+        args: mirror komutunun argümanları
+
+    Returns:
+        int: Eklenen mesaj sayısı
+    """
+    from core.day_mirror import DayMirror
+    from core.notion_client import NotionClient
+
+    groups = config.get_groups()
+    group = next((g for g in groups if g["name"] == args.group), None) if args.group else groups[0]
+    if not group:
+        raise ValueError(f"Grup konfigürasyonda yok: {args.group}")
+    notion_client = NotionClient(config.get_notion_token(), group["parent_page_id"],
+                                 base_url=config.get_notion_base_url())
+    mirror = DayMirror(notion_client, archive, logging.getLogger("WhatsAppNotionBot"), group["name"])
+    total = 0
+    for day in date_range(parse_date(args.start_date), parse_date(args.end_date or args.start_date)):
+        added = mirror.mirror(format_date(day))
+        print(f"{format_date(day)}: {added} mesaj eklendi "
+              f"(son data-id: {archive.mirror_cursor(group['name'], format_date(day)) or '-'})")
+        total += added
+    return total
+
+
+def main():
+    args = parse_args()
+    config = ConfigLoader()
+    archive = MessageArchive(args.db or config.get_archive_config()["path"])
+    try:
+        if args.command == "mirror":
+            try:
+                mirror_days(config, archive, args)
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(2)
+            return
+
+        if args.command == "stats":
+            for row in archive.stats():
+                print(f"{row['chat']}: {row['messages']} mesaj ({row['first_date']} → {row['last_date']})")
+            return
+
+        start = time.perf_counter()
+        try:
+            results = archive.search(args.query, chat=args.chat, sender=args.sender,
+                                     start_date=args.start_date, end_date=args.end_date,
+                                     limit=args.limit, raw=args.raw)
+        except (ValueError, sqlite3.OperationalError) as e:
+            # Geçersiz tarih veya FTS5 sözdizimi
+            print(f"❌ {e}")
+            sys.exit(2)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for result in results:
+            print(f"{result['date']} {result['time'] or '--:--'}  [{result['chat']}] "
+                  f"{result['sender'] or '?'}: {result['snippet']}")
+        print(f"\n{len(results)} sonuç, {elapsed_ms:.1f} ms")
+    finally:
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Backfill
+
+Geçmiş bir tarih aralığındaki mesajları tek kaydırma geçişiyle toplayıp
+her günü kendi tarih database'ine işleyen giriş noktası.
+
+Kullanım:
+    python src/backfill.py --from 21.09.2025 --to 27.09.2025 [--group "Grup adı"]
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from utils.config_loader import ConfigLoader
+from utils.date_utils import format_date, parse_date
+from utils.logger import setup_logger
+from utils.message_archive import MessageArchive
+from core.message_parser import MessageParser
+from core.notion_client import NotionClient
+from core.whatsapp_listener import WhatsAppListener
+from core.updater import Updater
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="WhatsApp → Notion geçmiş mesaj aktarımı")
+    parser.add_argument("--from", dest="start_date", required=True, help="Başlangıç tarihi (gg.aa.yyyy)")
+    parser.add_argument("--to", dest="end_date", help="Bitiş tarihi (gg.aa.yyyy, varsayılan bugün)")
+    parser.add_argument("--group", help="Grup adı (varsayılan: konfigürasyondaki ilk grup)")
+    parser.add_argument("--max-scrolls", type=int, default=300, help="Maksimum kaydırma sayısı")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    config = ConfigLoader()
+    logging_config = config.get_logging_config()
+    logger = setup_logger(
+        level=logging_config["level"],
+        async_mode=logging_config["async"],
+        json_format=logging_config["json"],
+        dedup_window=logging_config["dedup_window"],
+        dedup_summary_interval=logging_config["dedup_summary_interval"],
+        log_dir=logging_config["log_dir"]
+    )
+
+    end_date = args.end_date or format_date(datetime.now().date())
+    try:
+        if parse_date(args.start_date) > parse_date(end_date):
+            logger.error("Başlangıç tarihi bitişten sonra: %s > %s", args.start_date, end_date)
+            sys.exit(1)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    groups = config.get_groups()
+    group = next((g for g in groups if g["name"] == args.group), None) if args.group else groups[0]
+    if not group:
+        logger.error("Grup konfigürasyonda yok: %s", args.group)
+        sys.exit(1)
+
+    notion_client = NotionClient(config.get_notion_token(), group["parent_page_id"], base_url=config.get_notion_base_url())
+    parser = MessageParser()
+    updater = Updater(notion_client, parser, logger)
+    listener = WhatsAppListener(config, logger)
+
+    logger.info("=== WhatsApp → Notion Backfill Başladı ===")
+    logger.info("WhatsApp Grup: %s", group["name"])
+    logger.info("Tarih Aralığı: %s → %s", args.start_date, end_date)
+
+    try:
+        logger.info("WhatsApp'a giriş yapılıyor...")
+        if not listener.login_to_whatsapp():
+            logger.error("WhatsApp'a giriş yapılamadı.")
+            sys.exit(1)
+
+        if not listener.open_group(group["name"]):
+            logger.error("Grup açılamadı, çıkılıyor.")
+            sys.exit(1)
+
+        records = listener.get_message_records_by_date_range(
+            args.start_date, end_date, max_scrolls=args.max_scrolls
+        )
+
+        # Geçmiş mesajların tamamı yerel arşive de yazılır
+        archive_config = config.get_archive_config()
+        if archive_config["enabled"]:
+            archive = MessageArchive(archive_config["path"])
+            added = archive.add_records(group["name"], (record for day in records.values() for record in day))
+            archive.close()
+            logger.info("🗄️ Arşive %s yeni mesaj yazıldı", added)
+        buckets = {
+            date_str: list(dict.fromkeys(record["text"] for record in day))
+            for date_str, day in records.items()
+        }
+
+        # Her günü kendi database'ine işle
+        for date_str, messages in buckets.items():
+            if not messages:
+                continue
+            db_id = notion_client.get_database_by_date(date_str)
+            if not db_id:
+                logger.warning("Tarih için database bulunamadı, atlanıyor: %s (%s mesaj)", date_str, len(messages))
+                continue
+            logger.info("📥 %s: %s mesaj işleniyor → DB: %s", date_str, len(messages), db_id)
+            for msg in messages:
+                updater.process_text(msg, db_id)
+
+        logger.info("✅ Backfill tamamlandı")
+    finally:
+        listener.close()
+
+
+if __name__ == "__main__":
+    main()
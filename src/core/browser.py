@@ -4,10 +4,37 @@ Browser Configuration
 Chrome WebDriver configuration and setup utilities.
 """
 
+import os
+import urllib.request
 from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Sadece metin okunduğu için indirilmesine gerek olmayan kaynaklar
+TEXT_ONLY_BLOCKED_URLS = [
+    "*mmg.whatsapp.net*",   # medya (fotoğraf, video, sticker, ses)
+    "*pps.whatsapp.net*",   # profil fotoğrafları
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*",
+    "*.mp4*", "*.webm*", "*.ogg*", "*.opus*",
+    "*.woff*", "*.woff2*", "*.ttf*",
+]
+
+TEXT_ONLY_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--force-prefers-reduced-motion",
+    "--media-cache-size=1",
+]
+
 
 class BrowserConfig:
     """
@@ -24,6 +51,8 @@ class BrowserConfig:
         """
         self.config_loader = config_loader
         self.logger = logger
+        self.attached = False
+        self.driver_from_cache = False
     
     def create_chrome_options(self):
         """
@@ -33,12 +62,30 @@ class BrowserConfig:
             ChromeOptions: Configured Chrome options
         """
         options = webdriver.ChromeOptions()
+        browser_config = self.config_loader.get_browser_config()
         
         # Basic Chrome arguments
         options.add_argument(f"--user-data-dir={self.config_loader.get_session_path()}")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         
+        # Debug portu açık başlatılan Chrome, bot yeniden başladığında attach edilebilir
+        if browser_config["remote_debugging_port"]:
+            options.add_argument(f"--remote-debugging-port={browser_config['remote_debugging_port']}")
+        if browser_config["keep_browser_open"]:
+            options.add_experimental_option("detach", True)
+        
+        # Sadece metin profili: görsel/medya/font yükleme ve GPU kapalı, önbellek sınırlı
+        if browser_config["text_only"]:
+            for argument in TEXT_ONLY_ARGUMENTS:
+                options.add_argument(argument)
+            options.add_argument(f"--disk-cache-size={int(browser_config['disk_cache_mb']) * 1024 * 1024}")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+                "profile.default_content_setting_values.media_stream": 2,
+            })
+        
         # Headless mode
         if self.config_loader.get_headless():
             options.add_argument("--headless=new")
@@ -53,19 +100,160 @@ class BrowserConfig:
         self.logger.info("Chrome options configured")
         return options
     
+    def _debugger_address(self):
+        """
+        Attach edilecek debugger adresini belirler.
+        
+        Returns:
+            str: "host:port" veya boş string
+        """
+        browser_config = self.config_loader.get_browser_config()
+        if browser_config["debugger_address"]:
+            return browser_config["debugger_address"]
+        if browser_config["remote_debugging_port"]:
+            return f"127.0.0.1:{browser_config['remote_debugging_port']}"
+        return ""
+    
+    @staticmethod
+    def _is_debugger_alive(address: str) -> bool:
+        """
+        Verilen adreste DevTools endpoint'i cevap veriyor mu kontrol eder.
+        
+        Args:
+            address: "host:port"
+        
+        Returns:
+            bool: Çalışan bir Chrome var mı
+        """
+        try:
+            with urllib.request.urlopen(f"http://{address}/json/version", timeout=1):
+                return True
+        except Exception:
+            return False
+    
+    def resolve_driver_path(self, refresh: bool = False):
+        """
+        Chromedriver yolunu ağ erişimi gerektirmeden çözmeye çalışır.
+        Sıra: sabitlenmiş yol → önbellekteki yol → ChromeDriverManager (sonucu önbelleğe yazılır).
+        
+        Args:
+            refresh: True ise önbellekteki yol silinir ve ChromeDriverManager'dan yeniden alınır
+                (Chrome güncellenip eski chromedriver uyumsuz kaldığında)
+        
+        Returns:
+            Optional[str]: Chromedriver yolu; bulunamazsa None (Selenium Manager'a bırakılır)
+        """
+        browser_config = self.config_loader.get_browser_config()
+        
+        pinned = browser_config["chromedriver_path"]
+        if pinned:
+            if os.path.isfile(pinned):
+                return pinned
+            self.logger.warning("Sabitlenmiş chromedriver bulunamadı: %s", pinned)
+        
+        cache_file = browser_config["driver_cache_file"]
+        if refresh and cache_file and os.path.isfile(cache_file):
+            os.remove(cache_file)
+        self.driver_from_cache = False
+        if cache_file and os.path.isfile(cache_file):
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = f.read().strip()
+            if cached and os.path.isfile(cached):
+                self.driver_from_cache = True
+                return cached
+        
+        try:
+            path = ChromeDriverManager().install()
+        except Exception as e:
+            self.logger.warning("ChromeDriverManager başarısız (çevrimdışı?): %s", e)
+            return None
+        
+        if cache_file:
+            cache_dir = os.path.dirname(cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                f.write(path)
+        return path
+    
+    def _create_service(self, refresh: bool = False):
+        driver_path = self.resolve_driver_path(refresh)
+        return Service(driver_path) if driver_path else Service()
+    
+    def _start_chrome(self, options):
+        try:
+            return webdriver.Chrome(service=self._create_service(), options=options)
+        except SessionNotCreatedException as e:
+            # Chrome kendini güncellediyse önbellekteki chromedriver uyumsuz kalır: bir kez yenisiyle dene
+            if not self.driver_from_cache:
+                raise
+            self.logger.warning("Önbellekteki chromedriver uyumsuz, yeniden indiriliyor: %s", e.msg)
+            return webdriver.Chrome(service=self._create_service(refresh=True), options=options)
+    
+    def attach_driver(self, address: str):
+        """
+        Çalışan bir Chrome'a debugger adresi üzerinden bağlanır.
+        
+        Args:
+            address: "host:port"
+        
+        Returns:
+            WebDriver: Attach edilmiş WebDriver
+        """
+        options = webdriver.ChromeOptions()
+        options.debugger_address = address
+        driver = self._start_chrome(options)
+        self.attached = True
+        self.logger.info("♻️ Çalışan Chrome'a bağlanıldı (%s)", address)
+        return driver
+    
+    def apply_text_only_profile(self, driver) -> None:
+        """
+        CDP ile görsel, medya ve font isteklerini engeller, animasyonları kısaltır.
+        Attach edilen tarayıcılarda da çalışır (Chrome seçenekleri uygulanamasa bile).
+        
+        Args:
+            driver: WebDriver instance
+        """
+        browser_config = self.config_loader.get_browser_config()
+        if not browser_config["text_only"]:
+            return
+        
+        patterns = TEXT_ONLY_BLOCKED_URLS + list(browser_config["blocked_url_patterns"])
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            driver.execute_cdp_cmd("Emulation.setEmulatedMedia", {
+                "features": [{"name": "prefers-reduced-motion", "value": "reduce"}]
+            })
+            driver.execute_cdp_cmd("Animation.enable", {})
+            driver.execute_cdp_cmd("Animation.setPlaybackRate", {"playbackRate": 100})
+            self.logger.info("🪶 Sadece metin profili uygulandı (%d URL deseni engellendi)", len(patterns))
+        except Exception as e:
+            self.logger.warning("Sadece metin profili uygulanamadı: %s", e)
+    
     def create_driver(self):
         """
         Create and return a configured Chrome WebDriver.
+        Çalışan bir Chrome varsa ona bağlanır, yoksa yeni Chrome başlatır.
         
         Returns:
             WebDriver: Configured Chrome WebDriver
         """
+        address = self._debugger_address()
+        if address and self._is_debugger_alive(address):
+            try:
+                driver = self.attach_driver(address)
+                self.apply_text_only_profile(driver)
+                return driver
+            except Exception as e:
+                self.logger.warning("Chrome'a bağlanılamadı, yeni tarayıcı açılıyor: %s", e)
+        
         options = self.create_chrome_options()
         
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options
-        )
+        driver = self._start_chrome(options)
+        self.attached = False
+        self.apply_text_only_profile(driver)
         
         # Normal modda tam ekran yap (ek güvenlik)
         if not self.config_loader.get_headless():
@@ -73,7 +261,35 @@ class BrowserConfig:
                 driver.maximize_window()
                 self.logger.info("Chrome penceresi tam ekran yapıldı")
             except Exception as e:
-                self.logger.warning(f"Tam ekran yapılamadı: {e}")
+                self.logger.warning("Tam ekran yapılamadı: %s", e)
         
         self.logger.info("Chrome WebDriver created successfully")
         return driver
+    
+    def release_driver(self, driver, quit_browser: bool = False) -> None:
+        """
+        WebDriver'ı kapatır. Attach edilmiş veya açık tutulması istenen
+        Chrome kapatılmaz, sadece chromedriver süreci durdurulur.
+        
+        Args:
+            driver: WebDriver instance
+            quit_browser: True ise Chrome her durumda kapatılır (örn. headless veya
+                profil değiştiğinde; açık kalırsa yeni driver eski Chrome'a attach olur)
+        """
+        keep_open = self.attached or self.config_loader.get_browser_config()["keep_browser_open"]
+        try:
+            if quit_browser:
+                if self.attached:
+                    # Attach edilen Chrome driver.quit() ile kapanmaz
+                    try:
+                        driver.execute_cdp_cmd("Browser.close", {})
+                    except Exception:
+                        pass
+                driver.quit()
+            elif keep_open:
+                driver.service.stop()
+                self.logger.info("Chrome açık bırakıldı (sonraki başlatmada attach edilecek)")
+            else:
+                driver.quit()
+        except Exception as e:
+            self.logger.warning("WebDriver kapatılamadı: %s", e)
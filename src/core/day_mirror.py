@@ -0,0 +1,103 @@
+"""
+Day Mirror
+
+Bir grubun arşivlenmiş günlük mesaj kaydını o günün Notion tarih sayfasına
+paragraf blokları olarak ekleyen sınıf. Mesajlar blocks.children.append ile
+100'lük partiler halinde gönderilir; her partiden sonra arşivde kaldığı yer
+(son data-id) kaydedilir, kesintiden sonra aynı noktadan devam edilir.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from notion_client import APIResponseError
+
+from core.notion_client import MAX_APPEND_BLOCKS
+from utils.metrics import get_metrics
+
+# Notion tek metin nesnesinde en fazla 2000 karakter kabul eder
+MAX_TEXT_LENGTH = 2000
+
+
+def message_block(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Arşiv mesajını Notion paragraf bloğuna çevirir ("14:02 Gönderen: metin").
+
+    Args:
+        message: MessageArchive.pending_mirror() mesajı
+
+    Returns:
+        Dict[str, Any]: Paragraf bloğu
+    """
+    prefix = " ".join(part for part in (message.get("time"), message.get("sender")) if part)
+    rich_text = []
+    if prefix:
+        rich_text.append({"type": "text", "text": {"content": f"{prefix}: "}, "annotations": {"bold": True}})
+    text = message["text"]
+    for start in range(0, len(text), MAX_TEXT_LENGTH):
+        rich_text.append({"type": "text", "text": {"content": text[start:start + MAX_TEXT_LENGTH]}})
+    return {"object": "block", "type": "paragraph", "paragraph": {"rich_text": rich_text}}
+
+
+class DayMirror:
+    """
+    Arşivdeki günlük mesajları Notion tarih sayfasına toplu ekler.
+    """
+
+    def __init__(self, notion_client, archive, logger, chat: str, max_batches: Optional[int] = None):
+        """
+        Aktarıcıyı hazırlar.
+
+        Args:
+            notion_client: Grubun ana sayfasına bağlı NotionClient
+            archive: MessageArchive
+            logger: Logger instance
+            chat: Grup adı (arşivdeki sohbet)
+            max_batches: Bir çalıştırmada en fazla append çağrısı (None: sınırsız);
+                birikmiş günler tarama döngüsünü uzun süre bekletmesin
+        """
+        self.notion_client = notion_client
+        self.archive = archive
+        self.logger = logger
+        self.chat = chat
+        self.max_batches = max_batches
+        self.metrics = get_metrics()
+
+    def mirror(self, date_str: str) -> int:
+        """
+        Günün henüz eklenmemiş mesajlarını Notion sayfasına ekler.
+
+        Args:
+            date_str: Tarih (gg.aa.yyyy)
+
+        Returns:
+            int: Eklenen mesaj sayısı
+        """
+        limit = self.max_batches * MAX_APPEND_BLOCKS if self.max_batches else None
+        pending = self.archive.pending_mirror(self.chat, date_str, limit=limit)
+        if not pending:
+            return 0
+        page_id = self.notion_client.get_page_by_date(date_str)
+        if not page_id:
+            self.logger.warning("Tarih sayfası bulunamadı, mesajlar aktarılmadı: %s (%s mesaj)",
+                                date_str, len(pending))
+            return 0
+
+        start = time.perf_counter()
+        appended = 0
+        for offset in range(0, len(pending), MAX_APPEND_BLOCKS):
+            batch = pending[offset:offset + MAX_APPEND_BLOCKS]
+            try:
+                self.notion_client.append_blocks(page_id, [message_block(message) for message in batch])
+            except APIResponseError as e:
+                # Kalan mesajlar sonraki çalıştırmada son data-id'den devam eder
+                self.logger.warning("Mesajlar Notion'a eklenemedi (%s): %s", date_str, e)
+                break
+            self.archive.mark_mirrored(self.chat, date_str, batch[-1])
+            appended += len(batch)
+
+        self.metrics.inc("mirror_messages_total", appended, group=self.chat)
+        self.metrics.observe("mirror_seconds", time.perf_counter() - start, group=self.chat)
+        if appended:
+            self.logger.info("🗒️ %s: %s mesaj Notion sayfasına eklendi", date_str, appended)
+        return appended
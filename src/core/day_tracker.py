@@ -0,0 +1,80 @@
+"""
+Day Tracker
+
+Gün değişimini takip edip izlenecek tarihleri ve database'lerini belirleyen sınıf.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from utils.date_utils import format_date
+
+
+class DayTracker:
+    """
+    Bot gece yarısını geçtiğinde yeni günün database'ine geçer,
+    geç gelen raporlar için dünü bir süre daha izlemeye devam eder.
+    """
+
+    def __init__(self, notion_client, logger, fixed_date: Optional[str] = None,
+                 late_report_hours: float = 6):
+        """
+        Day Tracker'ı başlatır.
+
+        Args:
+            notion_client: NotionClient instance
+            logger: Logger instance
+            fixed_date: Sabit hedef tarih (gg.aa.yyyy); verilirse gün değişimi izlenmez
+            late_report_hours: Gece yarısından sonra dünün izlenmeye devam edeceği süre (saat)
+        """
+        self.notion_client = notion_client
+        self.logger = logger
+        self.fixed_date = fixed_date
+        self.late_report_window = timedelta(hours=late_report_hours)
+        self.current_date: Optional[str] = None
+
+    def watched_dates(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Şu an izlenmesi gereken tarihleri döndürür (eskiden yeniye).
+
+        Args:
+            now: Şu anki zaman (test için)
+
+        Returns:
+            List[str]: Tarihler (gg.aa.yyyy)
+        """
+        if self.fixed_date:
+            return [self.fixed_date]
+
+        now = now or datetime.now()
+        today = format_date(now.date())
+
+        if today != self.current_date:
+            if self.current_date:
+                self.logger.info("📅 Gün değişti: %s → %s", self.current_date, today)
+            self.current_date = today
+
+        midnight = datetime.combine(now.date(), datetime.min.time())
+        if now - midnight < self.late_report_window:
+            return [format_date(now.date() - timedelta(days=1)), today]
+        return [today]
+
+    def watched_databases(self, now: Optional[datetime] = None) -> List[Tuple[str, str]]:
+        """
+        İzlenen tarihleri database ID'leriyle birlikte döndürür.
+        Database'i henüz oluşturulmamış tarihler atlanır.
+
+        Args:
+            now: Şu anki zaman (test için)
+
+        Returns:
+            List[Tuple[str, str]]: (tarih, database ID) çiftleri
+        """
+        watched = []
+        for date_str in self.watched_dates(now):
+            db_id = self.notion_client.get_database_by_date(date_str)
+            if db_id:
+                watched.append((date_str, db_id))
+            else:
+                self.logger.warning("Tarih için database bulunamadı: %s", date_str)
+        return watched
@@ -0,0 +1,126 @@
+"""
+Group Monitor
+
+Tek bir WhatsApp grubunun mesajlarını kendi Notion sayfasına işleyen sınıf.
+"""
+
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from utils.date_utils import parse_date
+from utils.metrics import get_metrics
+
+
+class GroupMonitor:
+    """
+    Bir grubun izlenen günlerini, görülen mesajlarını ve Notion hedefini tutar.
+    """
+
+    def __init__(self, name: str, notion_client, updater, tracker, logger, archive=None, mirror=None):
+        """
+        Grup izleyicisini başlatır.
+
+        Args:
+            name: WhatsApp grup adı
+            notion_client: Grubun ana sayfasına bağlı NotionClient
+            updater: Grubun Updater'ı
+            tracker: Grubun DayTracker'ı
+            logger: Logger instance
+            archive: Okunan tüm mesajların yazılacağı MessageArchive (opsiyonel)
+            mirror: Arşivlenen mesajları tarih sayfalarına ekleyen DayMirror (opsiyonel)
+        """
+        self.name = name
+        self.notion_client = notion_client
+        self.updater = updater
+        self.tracker = tracker
+        self.logger = logger
+        self.archive = archive
+        self.mirror = mirror
+        self.metrics = get_metrics()
+        self.seen_messages: Dict[str, Set[str]] = {}
+        # Son taramada görülen en yeni mesaj (data-id, gg.aa.yyyy); sonraki kaydırma orada durur
+        self.cursor: Optional[Tuple[str, str]] = None
+
+    def scan(self, listener) -> int:
+        """
+        Açık sohbetteki izlenen günlerin mesajlarını okuyup işler.
+        Grup listener'da açılmış olmalıdır.
+
+        Args:
+            listener: WhatsAppListener instance
+
+        Returns:
+            int: Yeni mesaj sayısı
+        """
+        scan_start = time.perf_counter()
+        watched = self.tracker.watched_databases()
+        
+        # Birden fazla gün izleniyorsa (veya imleç varsa) tek kaydırma geçişinde topla
+        if len(watched) > 1 or (watched and self.cursor):
+            records = listener.get_message_records_by_date_range(watched[0][0], watched[-1][0], cursor=self.cursor)
+        elif watched:
+            date_str = watched[0][0]
+            records = {date_str: listener.get_message_records_by_date(date_str)}
+        else:
+            records = {}
+        received_at = time.time()
+        # Kaydırma bütçe/sınır yüzünden kesildiyse eski imleçle yüklenen en eski satır arası okunmadı:
+        # imleç ilerletilirse o mesajlar bir daha hiç taranmaz
+        if getattr(listener, "last_scan_complete", False):
+            self._advance_cursor(records)
+        else:
+            self.metrics.inc("group_truncated_scans_total", group=self.name)
+        
+        # Tüm mesajlar (durum bildirmeyenler de) taramadaki tek işlemle arşive yazılır
+        if self.archive:
+            try:
+                self.archive.add_records(self.name, (record for day in records.values() for record in day))
+            except Exception as e:
+                self.logger.warning("Mesajlar arşive yazılamadı: %s", e)
+        if self.archive and self.mirror:
+            for date_str, _ in watched:
+                try:
+                    self.mirror.mirror(date_str)
+                except Exception as e:
+                    self.logger.warning("Mesajlar Notion'a aktarılamadı (%s): %s", date_str, e)
+        buckets = {
+            date_str: list(dict.fromkeys(record["text"] for record in day))
+            for date_str, day in records.items()
+        }
+        
+        # Artık izlenmeyen günlerin kayıtlarını bırak
+        watched_dates = {date_str for date_str, _ in watched}
+        for date_str in list(self.seen_messages):
+            if date_str not in watched_dates:
+                del self.seen_messages[date_str]
+        
+        new_count = 0
+        for date_str, db_id in watched:
+            messages = buckets.get(date_str, [])
+            seen = self.seen_messages.setdefault(date_str, set())
+            new_messages = [msg for msg in messages if msg not in seen]
+            new_count += len(new_messages)
+            for msg in new_messages:
+                # İsim günün tablosunda yoksa son günlerin tabloları da aynı anda aranır (sabit tarihte aranmaz).
+                # Yazılamayan mesaj görülmüş sayılmaz, sonraki döngüde tekrar denenir.
+                outcome = self.updater.process_text(msg, db_id, received_at=received_at,
+                                                    fallback=not self.tracker.fixed_date)
+                if outcome != "failed":
+                    seen.add(msg)
+        
+        self.metrics.observe("group_scan_seconds", time.perf_counter() - scan_start, group=self.name)
+        self.metrics.inc("group_new_messages_total", new_count, group=self.name)
+        return new_count
+
+    def _advance_cursor(self, records: Dict[str, list]) -> None:
+        """
+        İmleci en yeni günün son data-id'li mesajına taşır (tarihi bilinmeyen kayıtlar atlanır).
+
+        Args:
+            records: Tarih → kayıtlar
+        """
+        for date_str in sorted(records, key=parse_date, reverse=True):
+            for record in reversed(records[date_str]):
+                if record.get("id") and record.get("date"):
+                    self.cursor = (record["id"], record["date"])
+                    return
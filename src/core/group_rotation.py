@@ -0,0 +1,80 @@
+"""
+Group Rotation
+
+Birden fazla WhatsApp grubu izlenirken hangi sohbetlere geçileceğine karar veren sınıf.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+class GroupRotation:
+    """
+    Sohbet listesindeki okunmamış rozetlerine göre tarama sırasını belirler.
+
+    Açık olan sohbete gelen mesajlar rozet oluşturmadığı için açık grup her
+    döngüde (geçiş maliyeti olmadan) taranır. Diğer gruplara sadece rozetleri
+    varsa geçilir; rozeti kaçırılan (örn. liste dışında kalan) gruplar
+    revisit_interval dolunca yine de taranır.
+    """
+
+    def __init__(self, group_names: Iterable[str], logger=None, revisit_interval: float = 900):
+        """
+        Rotasyonu başlatır.
+
+        Args:
+            group_names: İzlenen grup adları
+            logger: Logger instance (opsiyonel)
+            revisit_interval: Rozet görülmese de bir grubun taranacağı en uzun aralık (saniye)
+        """
+        self.group_names = list(group_names)
+        self.logger = logger
+        self.revisit_interval = revisit_interval
+        self.last_scanned: Dict[str, float] = {}
+
+    def plan(self, unread_counts: Dict[str, int], current_group: Optional[str],
+             now: Optional[float] = None) -> List[str]:
+        """
+        Bu döngüde taranacak grupları sırasıyla döndürür.
+
+        Args:
+            unread_counts: Grup adı → okunmamış mesaj sayısı (sohbet listesinden)
+            current_group: Şu an açık olan grup
+            now: Şu anki zaman (time.monotonic)
+
+        Returns:
+            List[str]: Taranacak gruplar (önce açık grup, sonra rozetliler, sonra süresi dolanlar)
+        """
+        now = time.monotonic() if now is None else now
+        plan = []
+
+        if current_group in self.group_names:
+            plan.append(current_group)
+
+        unread = sorted(
+            (name for name in self.group_names if unread_counts.get(name, 0) > 0),
+            key=lambda name: -unread_counts[name]
+        )
+        plan.extend(name for name in unread if name not in plan)
+
+        overdue = sorted(
+            (name for name in self.group_names
+             if now - self.last_scanned.get(name, float("-inf")) >= self.revisit_interval),
+            key=lambda name: self.last_scanned.get(name, float("-inf"))
+        )
+        plan.extend(name for name in overdue if name not in plan)
+
+        if self.logger and len(self.group_names) > 1:
+            skipped = len(self.group_names) - len(plan)
+            self.logger.debug("Grup planı: %s (%d grup atlandı)", plan, skipped)
+        return plan
+
+    def mark_scanned(self, group_name: str, now: Optional[float] = None) -> None:
+        """
+        Grubun tarandığını kaydeder.
+
+        Args:
+            group_name: Grup adı
+            now: Şu anki zaman (time.monotonic)
+        """
+        self.last_scanned[group_name] = time.monotonic() if now is None else now
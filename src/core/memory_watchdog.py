@@ -0,0 +1,103 @@
+"""
+Memory Watchdog
+
+WhatsApp Web sekmesinin JS heap ve DOM düğüm sayısını CDP ile izleyen sınıf.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from utils.metrics import get_metrics
+
+# Eşik aşıldığında sırayla denenen temizleme adımları (ucuzdan pahalıya)
+TRIM_ACTIONS = ["scroll_to_bottom", "reopen_chat", "recycle_tab"]
+
+
+class MemoryWatchdog:
+    """
+    Performance.getMetrics ile renderer belleğini izler ve eşik aşılınca
+    hangi temizleme adımının uygulanacağına karar verir.
+    """
+
+    def __init__(self, driver, logger, config: Dict[str, Any]):
+        """
+        Watchdog'u başlatır.
+
+        Args:
+            driver: WebDriver instance
+            logger: Logger instance
+            config: ConfigLoader.get_watchdog_config() çıktısı
+        """
+        self.driver = driver
+        self.logger = logger
+        self.max_heap_mb = float(config.get("max_heap_mb", 400))
+        self.max_dom_nodes = int(config.get("max_dom_nodes", 150000))
+        self.check_interval = float(config.get("check_interval", 60))
+        self.metrics = get_metrics()
+
+        self._enabled_on = None
+        self._last_check = 0.0
+        # Üst üste eşik aşımında bir sonraki (daha pahalı) adıma geçilir
+        self._escalation = 0
+
+    def _ensure_enabled(self) -> None:
+        # Driver yeniden oluşturulmuş olabilir (sekme/tarayıcı yenileme)
+        if self._enabled_on is not self.driver:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            self._enabled_on = self.driver
+
+    def sample(self) -> Dict[str, float]:
+        """
+        Anlık renderer metriklerini okur.
+
+        Returns:
+            Dict[str, float]: heap_mb, heap_total_mb, dom_nodes, listeners
+        """
+        self._ensure_enabled()
+        result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        values = {m["name"]: m["value"] for m in result.get("metrics", [])}
+        sample = {
+            "heap_mb": values.get("JSHeapUsedSize", 0) / (1024 * 1024),
+            "heap_total_mb": values.get("JSHeapTotalSize", 0) / (1024 * 1024),
+            "dom_nodes": values.get("Nodes", 0),
+            "listeners": values.get("JSEventListeners", 0),
+        }
+        self.metrics.set_gauge("browser_js_heap_bytes", values.get("JSHeapUsedSize", 0))
+        self.metrics.set_gauge("browser_dom_nodes", sample["dom_nodes"])
+        return sample
+
+    def check(self, now: Optional[float] = None) -> Optional[str]:
+        """
+        Kontrol zamanı geldiyse metrikleri okur ve gerekiyorsa bir temizleme adımı önerir.
+
+        Args:
+            now: Şu anki zaman (time.monotonic)
+
+        Returns:
+            Optional[str]: Uygulanacak adım (TRIM_ACTIONS) veya None
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._last_check < self.check_interval:
+            return None
+        self._last_check = now
+
+        try:
+            sample = self.sample()
+        except Exception as e:
+            self.logger.debug("Bellek metrikleri okunamadı: %s", e)
+            return None
+
+        over_heap = sample["heap_mb"] > self.max_heap_mb
+        over_dom = sample["dom_nodes"] > self.max_dom_nodes
+        if not (over_heap or over_dom):
+            self._escalation = 0
+            return None
+
+        action = TRIM_ACTIONS[min(self._escalation, len(TRIM_ACTIONS) - 1)]
+        self._escalation += 1
+        self.logger.warning(
+            "🧠 Bellek eşiği aşıldı: heap=%.0fMB (limit %.0f), DOM=%d (limit %d) → %s",
+            sample["heap_mb"], self.max_heap_mb, sample["dom_nodes"], self.max_dom_nodes, action
+        )
+        self.metrics.inc("browser_memory_trims_total", action=action)
+        return action
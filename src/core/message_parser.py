@@ -4,7 +4,39 @@ Message Parser
 WhatsApp mesajlarını parse ederek Notion için uygun formata çeviren sınıf.
 """
 
-from typing import Dict
+import time
+from typing import Dict, List, Optional
+from utils.metrics import get_metrics
+
+# Varsayılan durum kuralları: durum → anahtar kelimeler; sıra önceliktir
+# (hem "iptal" hem "gidildi" geçen mesaj iptal sayılır). config.json "status_rules" ile değiştirilebilir.
+DEFAULT_STATUS_RULES = {
+    "iptal": ["iptal"],
+    "kaldı": ["ertelendi", "kaldı", "kaldi"],
+    "gidildi": ["gidildi"],
+}
+
+STATUS_KEYWORDS = [keyword for keywords in DEFAULT_STATUS_RULES.values() for keyword in keywords]
+
+
+def _turkish_upper(text: str) -> str:
+    return text.replace("i", "İ").upper()
+
+
+def _lower(text: str) -> str:
+    # "İ".lower() birleşik nokta üretir ("i̇ptal"); önce düz i'ye çevrilir
+    return text.replace("İ", "i").lower()
+
+
+def _keyword_variants(keywords: List[str]) -> List[str]:
+    # İsimden çıkarılacak yazımlar: küçük, baş harfi büyük, tamamı büyük (ASCII ve Türkçe İ ile)
+    variants = []
+    for keyword in keywords:
+        for variant in (keyword, keyword.capitalize(), keyword.upper(),
+                        _turkish_upper(keyword[0]) + keyword[1:], _turkish_upper(keyword)):
+            if variant not in variants:
+                variants.append(variant)
+    return variants
 
 
 class MessageParser:
@@ -12,6 +44,29 @@ class MessageParser:
     WhatsApp mesajlarını parse eden sınıf.
     """
     
+    def __init__(self, status_rules: Optional[Dict[str, List[str]]] = None):
+        """
+        Parser'ı başlatır.
+        
+        Args:
+            status_rules: Durum → anahtar kelimeler (sıra önceliktir); varsayılan DEFAULT_STATUS_RULES
+        """
+        self.metrics = get_metrics()
+        self.set_status_rules(status_rules)
+        
+    def set_status_rules(self, status_rules: Optional[Dict[str, List[str]]] = None) -> None:
+        """
+        Durum kurallarını değiştirir (çalışırken konfigürasyon yenilendiğinde).
+        
+        Args:
+            status_rules: Durum → anahtar kelimeler; None ise varsayılan kurallar
+        """
+        rules = status_rules or DEFAULT_STATUS_RULES
+        compiled = tuple((status, tuple(_lower(keyword) for keyword in keywords)) for status, keywords in rules.items())
+        keywords = [keyword for _, rule_keywords in compiled for keyword in rule_keywords]
+        # Tek atamayla değişir; aynı anda parse edilen mesaj eski ya da yeni kuralları tam görür
+        self._rules = (compiled, tuple(_keyword_variants(keywords)))
+    
     def parse_message(self, text: str) -> Dict:
         """
         Mesajı parse eder ve status belirler.
@@ -22,23 +77,26 @@ class MessageParser:
         Returns:
             Dict: Parse edilmiş mesaj verisi
         """
-        text_lower = text.lower()
-        
-        # Status belirleme
-        if "iptal" in text_lower:
-            status = "iptal"
-        elif "ertelendi" in text_lower or "kaldı" in text_lower or "kaldi" in text_lower:
-            status = "kaldı"
-        elif "gidildi" in text_lower:
-            status = "gidildi"
-        else:
-            status = None
+        start = time.perf_counter()
+        rules, variants = self._rules
+        text_lower = _lower(text)
+        
+        # Status belirleme: ilk eşleşen kural
+        status = None
+        for rule_status, keywords in rules:
+            for keyword in keywords:
+                if keyword in text_lower:
+                    status = rule_status
+                    break
+            if status:
+                break
         
         # Name: orijinal metinden anahtar kelimeler çıkarılmış hali
         name = text
-        for keyword in ["iptal", "ertelendi", "kaldı", "kaldi", "gidildi"]:
-            name = name.replace(keyword, "").replace(keyword.capitalize(), "").replace(keyword.upper(), "")
+        for variant in variants:
+            name = name.replace(variant, "")
         
         name = name.strip()
         
+        self.metrics.observe("parser_parse_seconds", time.perf_counter() - start)
         return {"name": name, "status": status}
@@ -4,10 +4,19 @@ Notion Client
 Notion API ile etkileşim kuran sınıf.
 """
 
-from typing import List, Optional
-from notion_client import Client
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from notion_client import Client, APIResponseError
 from datetime import datetime, timedelta
 import logging
+import re
+import threading
+import time
+from utils.metrics import get_metrics
+from core.row_matcher import match_row_exact, property_value
+
+# blocks.children.append tek çağrıda en fazla 100 blok kabul eder
+MAX_APPEND_BLOCKS = 100
 
 
 class NotionClient:
@@ -15,18 +24,118 @@ class NotionClient:
     Notion API ile etkileşim kuran sınıf.
     """
     
-    def __init__(self, token: str, parent_page_id: str):
+    def __init__(self, token: str, parent_page_id: str, rate_limiter=None,
+                 base_url: Optional[str] = None, client=None, recorder=None, cache=None):
         """
         Notion Client'ı başlatır.
         
         Args:
             token: Notion API token
             parent_page_id: Ana sayfa ID'si
+            rate_limiter: acquire() metodu olan hız sınırlayıcı (opsiyonel, süreçler arası paylaşılabilir)
+            base_url: API adresi (varsayılan https://api.notion.com; test/benchmark için yerel stand-in)
+            client: Hazır API istemcisi (örn. kayıttan oynatma için ReplayNotionAPI)
+            recorder: Çağrıları ve yanıtları kaydeden SessionRecorder (opsiyonel)
+            cache: Tarih eşlemesi, şema ve satırlar için kalıcı NotionMetadataCache (opsiyonel)
         """
-        self.client = Client(auth=token)
+        if client is not None:
+            self.client = client
+        else:
+            self.client = Client(auth=token, base_url=base_url) if base_url else Client(auth=token)
+        self.recorder = recorder
+        self.cache = cache
+        self._known_rows: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Paralel arama thread'leri ve ana thread aynı anda yazar
+        self._known_rows_lock = threading.Lock()
+        self.known_rows_limit = 5000
+        # Yazma atlama kararı sadece bu kadar saniye içinde Notion'dan okunan değere göre verilir
+        # (Notion'da elle değiştirilen satır eski önbellek değeri yüzünden atlanmasın)
+        self.known_row_max_age = 10.0
+        self._synced_at: Dict[str, float] = {}
         self.parent_page_id = parent_page_id
         self.logger = logging.getLogger("WhatsAppNotionBot")
         
+        # Tarih → database ID önbelleği: (db_id, zaman damgası)
+        # Bulunamayan tarihler kısa süre sonra tekrar aranır (sayfa sonradan açılabilir)
+        self._database_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self._page_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self.negative_cache_ttl = 300
+        
+        self.metrics = get_metrics()
+        self.max_retries = 3
+        self.rate_limiter = rate_limiter
+        
+    def _call(self, method: str, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        Notion API çağrısını süre ölçümü ve 429 (rate limit) yeniden denemesiyle yapar.
+        
+        Args:
+            method: Metrik etiketi olarak kullanılacak API metodu adı
+            func: Çağrılacak notion_client metodu
+            **kwargs: Metoda geçilecek argümanlar
+            
+        Returns:
+            Any: API yanıtı
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                waited = self.rate_limiter.acquire()
+                if waited:
+                    self.metrics.observe("notion_rate_limit_wait_seconds", waited, method=method)
+            start = time.perf_counter()
+            try:
+                result = func(**kwargs)
+                self.metrics.observe("notion_request_seconds", time.perf_counter() - start, method=method)
+                if self.recorder:
+                    self.recorder.record_notion(method, kwargs, result=result)
+                return result
+            except APIResponseError as e:
+                self.metrics.observe("notion_request_seconds", time.perf_counter() - start, method=method)
+                if self.recorder:
+                    self.recorder.record_notion(method, kwargs, error={
+                        "status": e.status, "code": getattr(e.code, "value", e.code), "message": str(e),
+                        "retry_after": e.headers.get("retry-after") if e.headers else None
+                    })
+                if e.status != 429 or attempt >= self.max_retries:
+                    self.metrics.inc("notion_errors_total", method=method, status=e.status)
+                    raise
+                self.metrics.inc("notion_rate_limited_total", method=method)
+                self.metrics.inc("notion_retries_total", method=method)
+                retry_after = e.headers.get("retry-after") if e.headers else None
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                self.logger.warning("Notion rate limit (%s), %.1fs sonra tekrar denenecek", method, delay)
+                time.sleep(delay)
+                attempt += 1
+            except Exception:
+                self.metrics.observe("notion_request_seconds", time.perf_counter() - start, method=method)
+                self.metrics.inc("notion_errors_total", method=method, status="exception")
+                raise
+        
+    def _paginate(self, method: str, func: Callable[..., Any], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Sayfalı bir liste endpoint'inin tüm sonuçlarını toplar (start_cursor / has_more).
+        
+        Args:
+            method: Metrik etiketi olarak kullanılacak API metodu adı
+            func: Çağrılacak notion_client metodu
+            **kwargs: Metoda geçilecek argümanlar
+            
+        Returns:
+            List[Dict[str, Any]]: Tüm sayfalardaki sonuçlar
+        """
+        results = []
+        kwargs.setdefault("page_size", 100)
+        while True:
+            response = self._call(method, func, **kwargs)
+            results.extend(response.get("results", []))
+            if not response.get("has_more") or not response.get("next_cursor"):
+                return results
+            kwargs["start_cursor"] = response["next_cursor"]
+        
     def get_today_and_yesterday_databases(self) -> List[str]:
         """
         Bugünün ve dünün tarihli sayfalarındaki database ID'lerini getirir.
@@ -35,7 +144,7 @@ class NotionClient:
             List[str]: Database ID'leri
         """
         # Parent page altındaki child blokları listele
-        children = self.client.blocks.children.list(block_id=self.parent_page_id)
+        children = self._paginate("blocks.children.list", self.client.blocks.children.list, block_id=self.parent_page_id)
         
         # Bugün ve dünün tarihlerini hazırla
         today = datetime.now()
@@ -72,7 +181,7 @@ class NotionClient:
         
         database_ids = []
         
-        for child in children.get('results', []):
+        for child in children:
             if child.get('type') == 'child_page':
                 title = child.get('child_page', {}).get('title', '')
                 # Başlığı normalize et (küçük harf, boşluk temizle)
@@ -83,18 +192,43 @@ class NotionClient:
                     if date_format in title_normalized:
                         # Sayfa içindeki database'leri bul
                         page_id = child['id']
-                        page_children = self.client.blocks.children.list(block_id=page_id)
+                        page_children = self._paginate("blocks.children.list", self.client.blocks.children.list, block_id=page_id)
                         
-                        for page_child in page_children.get('results', []):
+                        for page_child in page_children:
                             if page_child.get('type') == 'child_database':
                                 database_id = page_child['id']
                                 database_ids.append(database_id)
-                                self.logger.info(f"Tarih sayfası bulundu: {title} → DB: {database_id}")
+                                self.logger.info("Tarih sayfası bulundu: %s → DB: %s", title, database_id)
                         break
         
         return database_ids
         
     def get_database_by_date(self, date_str: str) -> Optional[str]:
+        """
+        Belirli bir tarih için database ID'sini önbellekten veya Notion'dan getirir.
+        
+        Args:
+            date_str: Tarih (gg.aa.yyyy)
+            
+        Returns:
+            Optional[str]: Database ID'si
+        """
+        cached = self._database_cache.get(date_str)
+        if cached:
+            db_id, cached_at = cached
+            if db_id or time.time() - cached_at < self.negative_cache_ttl:
+                return db_id
+        
+        # Kalıcı önbellek: yeniden başlatmada sayfa keşfi yapılmaz (revalidate_cache doğrular)
+        db_id = self.cache.get_database(self.parent_page_id, date_str) if self.cache else None
+        if not db_id:
+            db_id = self._find_database_by_date(date_str)
+            if db_id and self.cache:
+                self.cache.set_database(self.parent_page_id, date_str, db_id)
+        self._database_cache[date_str] = (db_id, time.time())
+        return db_id
+        
+    def _find_database_by_date(self, date_str: str) -> Optional[str]:
         """
         Belirli bir tarih için (gg.aa.yyyy) parent_page_id altındaki tabloyu bulur.
         1) Hem 27.09.2025, 27-09-2025, 27/09/2025 formatlarını hem de Türkçe gün adlarını kontrol eder.
@@ -102,21 +236,17 @@ class NotionClient:
         3) Eğer doğrudan database ise id'yi döndürür.
         4) Eğer sayfa ise içindeki ilk child_database id'sini döndürür.
         """
-        import re
-        d1 = date_str
-        d2 = date_str.replace(".", "-")
-        d3 = date_str.replace(".", "/")
-        pat = re.compile(rf"({re.escape(d1)}|{re.escape(d2)}|{re.escape(d3)})", re.IGNORECASE)
+        pat = self._date_title_pattern(date_str)
 
         # Parent altında arama
-        results = self.client.blocks.children.list(block_id=self.parent_page_id)
-        for r in results.get("results", []):
+        results = self._paginate("blocks.children.list", self.client.blocks.children.list, block_id=self.parent_page_id)
+        for r in results:
             if r["type"] == "child_page":
                 title = r["child_page"]["title"]
                 if pat.search(title):
                     # Çocuk sayfanın içinde database ara
-                    children = self.client.blocks.children.list(block_id=r["id"])
-                    for ch in children.get("results", []):
+                    children = self._paginate("blocks.children.list", self.client.blocks.children.list, block_id=r["id"])
+                    for ch in children:
                         if ch["type"] == "child_database":
                             return ch["id"]
             elif r["type"] == "child_database":
@@ -125,6 +255,62 @@ class NotionClient:
                     return r["id"]
         return None
         
+    @staticmethod
+    def _date_title_pattern(date_str: str) -> "re.Pattern":
+        d1 = date_str
+        d2 = date_str.replace(".", "-")
+        d3 = date_str.replace(".", "/")
+        return re.compile(rf"({re.escape(d1)}|{re.escape(d2)}|{re.escape(d3)})", re.IGNORECASE)
+        
+    def get_page_by_date(self, date_str: str) -> Optional[str]:
+        """
+        Belirli bir tarihin sayfa ID'sini (database'i içeren tarih sayfası) getirir.
+        Database doğrudan ana sayfanın altındaysa sayfa yoktur.
+        
+        Args:
+            date_str: Tarih (gg.aa.yyyy)
+            
+        Returns:
+            Optional[str]: Sayfa ID'si
+        """
+        cached = self._page_cache.get(date_str)
+        if cached:
+            page_id, cached_at = cached
+            if page_id or time.time() - cached_at < self.negative_cache_ttl:
+                return page_id
+        
+        pat = self._date_title_pattern(date_str)
+        page_id = None
+        results = self._paginate("blocks.children.list", self.client.blocks.children.list, block_id=self.parent_page_id)
+        for r in results:
+            if r["type"] == "child_page" and pat.search(r["child_page"]["title"]):
+                page_id = r["id"]
+                break
+        self._page_cache[date_str] = (page_id, time.time())
+        return page_id
+        
+    def append_blocks(self, block_id: str, children: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sayfanın sonuna blok ekler (tek blocks.children.append çağrısı).
+        
+        Args:
+            block_id: Sayfa/blok ID'si
+            children: En fazla MAX_APPEND_BLOCKS blok
+            
+        Returns:
+            List[Dict[str, Any]]: Oluşturulan bloklar
+            
+        Raises:
+            ValueError: Blok sayısı sınırı aşarsa
+            APIResponseError: Notion hatası (429 dışında)
+        """
+        if len(children) > MAX_APPEND_BLOCKS:
+            raise ValueError(f"Tek çağrıda en fazla {MAX_APPEND_BLOCKS} blok eklenebilir: {len(children)}")
+        response = self._call("blocks.children.append", self.client.blocks.children.append,
+                              block_id=block_id, children=children)
+        self.metrics.inc("notion_blocks_appended_total", len(children))
+        return response.get("results", []) if isinstance(response, dict) else []
+        
     def find_row_by_name(self, database_id: str, name: str) -> Optional[str]:
         """
         Database'de name ile eşleşen satırı bulur.
@@ -136,34 +322,128 @@ class NotionClient:
         Returns:
             Optional[str]: Bulunan satırın page_id'si
         """
-        # Database'i query et
-        results = self.client.databases.query(database_id=database_id)
-        name_lower = name.lower()
+        match = self.find_row_match(database_id, name)
+        return match[0] if match else None
         
-        for row in results.get('results', []):
-            properties = row.get('properties', {})
-            
-            # Title veya rich_text alanlarında name ara
-            for prop_name, prop_data in properties.items():
-                if prop_data.get('type') == 'title':
-                    title_text = ''.join([text.get('plain_text', '') for text in prop_data.get('title', [])])
-                    title_lower = title_text.lower()
-                    # Tam eşleşme veya contains kontrolü
-                    if name_lower == title_lower or name_lower in title_lower:
-                        row_id = row['id']
-                        self.logger.info(f"Eşleşen satır bulundu: {name} → {row_id}")
-                        return row_id
-                elif prop_data.get('type') == 'rich_text':
-                    rich_text = ''.join([text.get('plain_text', '') for text in prop_data.get('rich_text', [])])
-                    rich_lower = rich_text.lower()
-                    # Tam eşleşme veya contains kontrolü
-                    if name_lower == rich_lower or name_lower in rich_lower:
-                        row_id = row['id']
-                        self.logger.info(f"Eşleşen satır bulundu: {name} → {row_id}")
-                        return row_id
+    def find_row_match(self, database_id: str, name: str) -> Optional[Tuple[str, bool]]:
+        """
+        Database'de name ile eşleşen satırı ve eşleşmenin tam olup olmadığını bulur.
         
+        Args:
+            database_id: Database ID'si
+            name: Aranacak isim
+            
+        Returns:
+            Optional[Tuple[str, bool]]: (satırın page_id'si, tam eşleşme mi)
+        """
+        if self.cache:
+            # Önce önbellekteki satırlar; tam eşleşme yoksa sadece son değişen satırlar çekilir
+            rows = self.cache.get_rows(database_id)
+            row, exact = match_row_exact(rows, name) if rows is not None else (None, False)
+            fresh = False
+            if not exact:
+                row, exact = match_row_exact(self.sync_rows(database_id), name)
+                fresh = True
+        else:
+            # Database'i query et
+            results = self._paginate("databases.query", self.client.databases.query, database_id=database_id)
+            row, exact = match_row_exact(results, name)
+            fresh = True
+        if row:
+            self.logger.info("Eşleşen satır bulundu: %s → %s", name, row['id'])
+            if fresh:
+                self._remember_row(row)
+            return row['id'], exact
         return None
         
+    def get_recent_databases(self, days: int = 2, today: Optional[datetime] = None) -> List[str]:
+        """
+        Son N günün (bugün, dün, ...) tarih database'lerini getirir; tarih eşlemeleri
+        önbellekten gelir, her mesajda ana sayfa taranmaz.
+        
+        Args:
+            days: Gün sayısı (1 = sadece bugün)
+            today: Bugünün tarihi (test için)
+            
+        Returns:
+            List[str]: Database ID'leri (yeniden eskiye)
+        """
+        today = today or datetime.now()
+        databases = []
+        for offset in range(max(1, days)):
+            db_id = self.get_database_by_date((today - timedelta(days=offset)).strftime("%d.%m.%Y"))
+            if db_id and db_id not in databases:
+                databases.append(db_id)
+        return databases
+        
+    def sync_rows(self, database_id: str) -> List[Dict[str, Any]]:
+        """
+        Önbellekteki satırları Notion'la eşitler: ilk seferde tüm satırlar, sonra
+        sadece su seviyesinden (last_edited_time) sonra değişenler çekilir.
+        
+        Args:
+            database_id: Database ID'si
+            
+        Returns:
+            List[Dict[str, Any]]: Güncel satırlar
+        """
+        watermark = self.cache.watermark(database_id)
+        if not watermark:
+            rows = self._paginate("databases.query", self.client.databases.query, database_id=database_id)
+            self.cache.store_rows(database_id, rows, replace=True)
+            self.metrics.inc("notion_cache_syncs_total", kind="full")
+        else:
+            # Notion zamanları dakika hassasiyetinde: aynı dakikadaki değişiklikler kaçmasın diye on_or_after
+            rows = self._paginate(
+                "databases.query", self.client.databases.query, database_id=database_id,
+                filter={"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": watermark}}
+            )
+            self.cache.store_rows(database_id, rows)
+            self.metrics.inc("notion_cache_syncs_total", kind="incremental")
+        self._synced_at[database_id] = time.monotonic()
+        return self.cache.get_rows(database_id) or []
+        
+    def _get_schema(self, database_id: str) -> Dict[str, Any]:
+        """
+        Database şemasını önbellekten veya Notion'dan getirir.
+        
+        Args:
+            database_id: Database ID'si
+            
+        Returns:
+            Dict[str, Any]: databases.retrieve yanıtı
+        """
+        if self.cache:
+            schema = self.cache.get_schema(database_id)
+            if schema:
+                return schema
+        schema = self._call("databases.retrieve", self.client.databases.retrieve, database_id=database_id)
+        if self.cache:
+            self.cache.set_schema(database_id, schema)
+        return schema
+        
+    def revalidate_cache(self) -> None:
+        """
+        Önbellekteki database'lerin satırlarını ve şemalarını artımlı olarak doğrular;
+        silinmiş database'leri önbellekten çıkarır. CacheRevalidator thread'inden çağrılır.
+        """
+        if not self.cache:
+            return
+        for database_id in self.cache.databases(self.parent_page_id):
+            try:
+                self.cache.set_schema(database_id, self._call(
+                    "databases.retrieve", self.client.databases.retrieve, database_id=database_id
+                ))
+                self.sync_rows(database_id)
+            except APIResponseError as e:
+                if e.status != 404:
+                    raise
+                self.logger.info("Önbellekteki database artık yok, siliniyor: %s", database_id)
+                self.cache.forget_database(database_id)
+                for date_str, (db_id, _) in list(self._database_cache.items()):
+                    if db_id == database_id:
+                        self._database_cache.pop(date_str, None)
+        
     def update_status(self, database_id: str, row_id: str, status: str) -> bool:
         """
         Database satırının status alanını günceller.
@@ -176,9 +456,27 @@ class NotionClient:
         Returns:
             bool: Güncelleme başarılı mı
         """
+        plan = self.plan_status_update(database_id, row_id, status)
+        return bool(plan) and self.apply_status_update(database_id, row_id, plan)
+        
+    def plan_status_update(self, database_id: str, row_id: str, status: str) -> Optional[Dict[str, Any]]:
+        """
+        Status güncellemesinin pages.update gövdesini hazırlar ve satırın bilinen
+        değeriyle (az önce eşitlenen önbellek, son aramada veya son yazmada okunan
+        satır) karşılaştırır. Bilinen değer known_row_max_age'den eskiyse yazılır.
+        
+        Args:
+            database_id: Database ID'si
+            row_id: Satır ID'si
+            status: Yeni status
+            
+        Returns:
+            Optional[Dict[str, Any]]: field, value, properties (güncelleme gövdesi) ve
+                unchanged (satır zaten bu değerde mi); status alanı yoksa veya hata olursa None
+        """
         try:
             # Database şemasını al
-            database = self.client.databases.retrieve(database_id=database_id)
+            database = self._get_schema(database_id)
             properties = database.get('properties', {})
             
             # Status alanını bul
@@ -191,7 +489,7 @@ class NotionClient:
                     break
             
             if not status_field:
-                return False
+                return None
             
             field_data = properties[status_field]
             field_type = field_data.get('type')
@@ -206,56 +504,80 @@ class NotionClient:
             else:
                 notion_value = status
             
-            # Property type'a göre update yap
-            if field_type == 'status':
-                properties = {status_field: {"status": {"name": notion_value}}}
-                self.logger.info(f"Update çağrısı: row={row_id}, kolon={status_field}, değer={notion_value}")
-                self.client.pages.update(page_id=row_id, properties=properties)
-                self.logger.info(f"Update başarılı: {notion_value}")
-                return True
-            elif field_type == 'select':
-                update_data = {
-                    status_field: {
-                        'select': {'name': notion_value}
-                    }
-                }
-                self.logger.info(f"Update çağrısı: row={row_id}, kolon={status_field}, değer={notion_value}")
-                self.client.pages.update(page_id=row_id, properties=update_data)
-                self.logger.info(f"Update başarılı: {notion_value}")
-                return True
+            # Property type'a göre update verisi
+            if field_type in ('status', 'select'):
+                update_data = {status_field: {field_type: {'name': notion_value}}}
             elif field_type == 'multi_select':
-                update_data = {
-                    status_field: {
-                        'multi_select': [{'name': notion_value}]
-                    }
-                }
-                self.logger.info(f"Update çağrısı: row={row_id}, kolon={status_field}, değer={notion_value}")
-                self.client.pages.update(page_id=row_id, properties=update_data)
-                self.logger.info(f"Update başarılı: {notion_value}")
-                return True
+                update_data = {status_field: {'multi_select': [{'name': notion_value}]}}
             elif field_type == 'rich_text':
-                update_data = {
-                    status_field: {
-                        'rich_text': [{'text': {'content': notion_value}}]
-                    }
-                }
-                self.logger.info(f"Update çağrısı: row={row_id}, kolon={status_field}, değer={notion_value}")
-                self.client.pages.update(page_id=row_id, properties=update_data)
-                self.logger.info(f"Update başarılı: {notion_value}")
-                return True
+                update_data = {status_field: {'rich_text': [{'text': {'content': notion_value}}]}}
             elif field_type == 'checkbox':
-                checkbox_value = True if status == "gidildi" else False
-                update_data = {
-                    status_field: {
-                        'checkbox': checkbox_value
-                    }
-                }
-                self.logger.info(f"Update çağrısı: row={row_id}, kolon={status_field}, değer={checkbox_value}")
-                self.client.pages.update(page_id=row_id, properties=update_data)
-                self.logger.info(f"Update başarılı: {checkbox_value}")
-                return True
+                notion_value = True if status == "gidildi" else False
+                update_data = {status_field: {'checkbox': notion_value}}
             else:
-                return False
+                return None
+            
+            row = self._known_row(database_id, row_id)
+            target = property_value({"type": field_type, **update_data[status_field]})
+            unchanged = row is not None and property_value(row.get('properties', {}).get(status_field)) == target
+            return {"field": status_field, "value": notion_value, "properties": update_data, "unchanged": unchanged}
+            
+        except Exception as e:
+            self.logger.debug("Status güncellemesi hazırlanamadı: %s", e)
+            return None
+        
+    def apply_status_update(self, database_id: str, row_id: str, plan: Dict[str, Any]) -> bool:
+        """
+        plan_status_update ile hazırlanan güncellemeyi Notion'a yazar.
+        
+        Args:
+            database_id: Database ID'si
+            row_id: Satır ID'si
+            plan: plan_status_update çıktısı
+            
+        Returns:
+            bool: Güncelleme başarılı mı
+        """
+        try:
+            self.logger.info("Update çağrısı: row=%s, kolon=%s, değer=%s", row_id, plan["field"], plan["value"])
+            try:
+                page = self._call("pages.update", self.client.pages.update, page_id=row_id, properties=plan["properties"])
+            except APIResponseError as e:
+                with self._known_rows_lock:
+                    self._known_rows.pop(row_id, None)
+                if self.cache:
+                    # Önbellekteki şema veya satır eskimiş olabilir; sonraki denemede Notion'dan alınır
+                    self.cache.forget_schema(database_id)
+                    if e.status == 404:
+                        self.cache.forget_row(database_id, row_id)
+                raise
+            if isinstance(page, dict) and page.get('id'):
+                self._remember_row(page)
+                if self.cache:
+                    self.cache.update_row(database_id, page)
+            self.logger.info("Update başarılı: %s", plan["value"])
+            return True
             
         except Exception:
             return False
+        
+    def _remember_row(self, row: Dict[str, Any]) -> None:
+        # Notion'dan az önce okunan / güncellenen satırlar (no-op yazma kontrolü için)
+        entry = {"id": row['id'], "properties": row.get('properties', {}), "fetched_at": time.monotonic()}
+        with self._known_rows_lock:
+            self._known_rows[row['id']] = entry
+            self._known_rows.move_to_end(row['id'])
+            while len(self._known_rows) > self.known_rows_limit:
+                self._known_rows.popitem(last=False)
+        
+    def _known_row(self, database_id: str, row_id: str) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._known_rows_lock:
+            known = self._known_rows.get(row_id)
+            if known and now - known["fetched_at"] <= self.known_row_max_age:
+                return known
+            # Eski değer yazmayı atlatmaz; satır bir sonraki okumada tazelenir
+            self._known_rows.pop(row_id, None)
+        if self.cache and now - self._synced_at.get(database_id, float("-inf")) <= self.known_row_max_age:
+            return self.cache.get_row(database_id, row_id)
+        return None
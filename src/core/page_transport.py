@@ -0,0 +1,359 @@
+"""
+Page Transport
+
+WhatsApp Web sayfasıyla konuşan taşıma katmanları. Selenium taşıması her komutu
+chromedriver'ın HTTP JSON protokolü üzerinden gönderir; CDP taşıması aynı
+komutları Chrome DevTools Protocol websocket'i üzerinden doğrudan sayfaya iletir.
+"""
+
+import itertools
+import json
+import threading
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+
+# Yüklü tüm satırları tek çağrıda okur: ham metin, mesaj metni, data-id ve
+# "[14:02, 27.09.2025] Gönderen: " biçimindeki meta bilgi
+ROW_EXTRACT_JS = r"""
+(() => Array.from(document.querySelectorAll("div[role='row']")).map(row => {
+  const raw = (row.innerText || '').trim();
+  const spans = row.querySelectorAll('.selectable-text span');
+  const text = spans.length ? (spans[spans.length - 1].innerText || '').trim() : raw;
+  const idEl = row.querySelector('[data-id]');
+  const metaEl = row.querySelector('[data-pre-plain-text]');
+  return {
+    raw: raw,
+    text: text,
+    id: idEl ? idEl.getAttribute('data-id') : null,
+    meta: metaEl ? metaEl.getAttribute('data-pre-plain-text') : null
+  };
+}))()
+"""
+
+# Sohbet listesinde görünen sohbetlerin okunmamış rozet sayıları (başlık → sayı)
+CHAT_UNREAD_JS = r"""
+(() => {
+  const pane = document.querySelector('#pane-side') || document;
+  const result = {};
+  for (const item of pane.querySelectorAll("div[role='listitem'], div[role='row']")) {
+    const title = item.querySelector('span[title]');
+    if (!title) continue;
+    let count = 0;
+    for (const badge of item.querySelectorAll('span[aria-label]')) {
+      const label = (badge.getAttribute('aria-label') || '').toLocaleLowerCase('tr');
+      if (label.includes('unread') || label.includes('okunmamış')) {
+        count = parseInt(badge.innerText, 10) || 1;
+        break;
+      }
+    }
+    result[title.getAttribute('title')] = count;
+  }
+  return result;
+})()
+"""
+
+# Yeni eklenen satırları Runtime.addBinding ile açılan fonksiyona iten gözlemci.
+# Sadece sona eklenen düğümler (yeni mesajlar) bildirilir; yukarı kaydırınca başa yüklenen eski satırlar atlanır.
+ROW_OBSERVER_JS = r"""
+(() => {
+  if (window.__wnbObserver) window.__wnbObserver.disconnect();
+  const panel = document.querySelector("div[data-testid='conversation-panel-messages']")
+    || document.querySelector("div.copyable-area");
+  if (!panel) return false;
+  window.__wnbObserver = new MutationObserver(mutations => {
+    const rows = [];
+    for (const m of mutations) {
+      for (const node of m.addedNodes) {
+        if (!(node instanceof HTMLElement) || node.nextElementSibling) continue;
+        const row = node.matches("div[role='row']") ? node : node.querySelector("div[role='row']");
+        if (!row) continue;
+        const spans = row.querySelectorAll('.selectable-text span');
+        const idEl = row.querySelector('[data-id]');
+        rows.push({
+          raw: (row.innerText || '').trim(),
+          text: spans.length ? (spans[spans.length - 1].innerText || '').trim() : (row.innerText || '').trim(),
+          id: idEl ? idEl.getAttribute('data-id') : null
+        });
+      }
+    }
+    if (rows.length) window.__BINDING__(JSON.stringify(rows));
+  });
+  window.__wnbObserver.observe(panel, {childList: true, subtree: true});
+  return true;
+})()
+"""
+
+
+class SeleniumTransport:
+    """
+    chromedriver üzerinden (WebDriver HTTP) çalışan taşıma.
+    """
+
+    name = "selenium"
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+
+    def evaluate(self, expression: str) -> Any:
+        """
+        Sayfada bir JS ifadesini çalıştırıp sonucunu döndürür.
+
+        Args:
+            expression: JS ifadesi
+
+        Returns:
+            Any: JSON'a çevrilebilir sonuç
+        """
+        return self.driver.execute_script("return " + expression.strip() + ";")
+
+    def extract_rows(self) -> List[Dict[str, Any]]:
+        """
+        Yüklü tüm mesaj satırlarını tek çağrıda okur.
+
+        Returns:
+            List[Dict[str, Any]]: raw, text, id, meta alanlı satırlar
+        """
+        return self.evaluate(ROW_EXTRACT_JS) or []
+
+    def page_up(self) -> None:
+        """
+        Odaklanmış mesaj panelini bir sayfa yukarı kaydırır.
+        """
+        ActionChains(self.driver).send_keys(Keys.PAGE_UP).perform()
+
+    def subscribe_new_rows(self, callback: Callable[[List[Dict[str, Any]]], None]) -> bool:
+        """
+        WebDriver HTTP protokolünde push bildirimi yok; tarama döngüsü aralıkla yoklar.
+
+        Returns:
+            bool: Her zaman False
+        """
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+class CDPTransport:
+    """
+    Chrome DevTools Protocol websocket'i üzerinden doğrudan sayfaya bağlanan taşıma.
+    Runtime.evaluate (returnByValue) ile okur, Input.dispatchKeyEvent ile kaydırır,
+    Runtime.addBinding ile yeni satırları push olarak alır.
+    """
+
+    name = "cdp"
+    BINDING_NAME = "__wnbNewRows"
+
+    def __init__(self, driver, logger, timeout: float = 10):
+        """
+        Args:
+            driver: WebDriver instance (debugger adresini bulmak için)
+            logger: Logger instance
+            timeout: Komut başına yanıt bekleme süresi (saniye)
+        """
+        self.driver = driver
+        self.logger = logger
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._ws = None
+        self._reader = None
+        self._closed = threading.Event()
+
+    def _debugger_address(self) -> str:
+        address = (self.driver.capabilities.get("goog:chromeOptions") or {}).get("debuggerAddress")
+        if not address:
+            raise RuntimeError("Chrome debugger adresi bulunamadı")
+        return address
+
+    def _page_websocket_url(self) -> str:
+        """
+        WhatsApp Web sekmesinin websocket debugger URL'ini bulur.
+
+        Returns:
+            str: ws:// URL
+        """
+        address = self._debugger_address()
+        with urllib.request.urlopen(f"http://{address}/json/list", timeout=3) as response:
+            targets = json.loads(response.read().decode("utf-8"))
+        pages = [t for t in targets if t.get("type") == "page" and t.get("webSocketDebuggerUrl")]
+        for target in pages:
+            if "web.whatsapp.com" in target.get("url", ""):
+                return target["webSocketDebuggerUrl"]
+        if pages:
+            return pages[0]["webSocketDebuggerUrl"]
+        raise RuntimeError("CDP sayfa hedefi bulunamadı")
+
+    def connect(self) -> "CDPTransport":
+        """
+        Sayfanın websocket'ine bağlanır ve okuma thread'ini başlatır.
+
+        Returns:
+            CDPTransport: self
+        """
+        import websocket  # selenium bağımlılığı olarak gelir (websocket-client)
+
+        self._ws = websocket.create_connection(
+            self._page_websocket_url(), timeout=self.timeout, suppress_origin=True
+        )
+        self._ws.settimeout(None)
+        self._closed.clear()
+        self._reader = threading.Thread(target=self._read_loop, name="cdp-reader", daemon=True)
+        self._reader.start()
+        self.send("Runtime.enable")
+        return self
+
+    def _read_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                message = json.loads(self._ws.recv())
+            except Exception:
+                if not self._closed.is_set():
+                    self.logger.warning("CDP bağlantısı kapandı")
+                self._fail_pending()
+                return
+
+            if "id" in message:
+                with self._pending_lock:
+                    slot = self._pending.get(message["id"])
+                if slot:
+                    slot["message"] = message
+                    slot["event"].set()
+            elif "method" in message:
+                for handler in self._handlers.get(message["method"], []):
+                    try:
+                        handler(message.get("params", {}))
+                    except Exception as e:
+                        self.logger.warning("CDP olay işleyici hatası (%s): %s", message["method"], e)
+
+    def _fail_pending(self) -> None:
+        with self._pending_lock:
+            for slot in self._pending.values():
+                slot["message"] = {"error": {"message": "CDP bağlantısı kapandı"}}
+                slot["event"].set()
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        CDP komutu gönderip yanıtını bekler.
+
+        Args:
+            method: CDP metodu (örn. Runtime.evaluate)
+            params: Parametreler
+
+        Returns:
+            Dict[str, Any]: Komut sonucu
+
+        Raises:
+            RuntimeError: Komut hata döndürürse veya zaman aşımına uğrarsa
+        """
+        message_id = next(self._ids)
+        slot = {"event": threading.Event(), "message": None}
+        with self._pending_lock:
+            self._pending[message_id] = slot
+        try:
+            self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+            if not slot["event"].wait(self.timeout):
+                raise RuntimeError(f"CDP zaman aşımı: {method}")
+        finally:
+            with self._pending_lock:
+                self._pending.pop(message_id, None)
+
+        message = slot["message"]
+        if "error" in message:
+            raise RuntimeError(f"CDP hatası ({method}): {message['error'].get('message')}")
+        return message.get("result", {})
+
+    def on(self, event: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Bir CDP olayı için işleyici ekler.
+
+        Args:
+            event: Olay adı (örn. Runtime.bindingCalled)
+            handler: params sözlüğünü alan fonksiyon
+        """
+        self._handlers.setdefault(event, []).append(handler)
+
+    def evaluate(self, expression: str) -> Any:
+        """
+        Runtime.evaluate ile JS ifadesini çalıştırır (returnByValue).
+
+        Args:
+            expression: JS ifadesi
+
+        Returns:
+            Any: JSON'a çevrilebilir sonuç
+        """
+        result = self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise RuntimeError(f"JS hatası: {details.get('exception', {}).get('description') or details.get('text')}")
+        return result.get("result", {}).get("value")
+
+    def extract_rows(self) -> List[Dict[str, Any]]:
+        return self.evaluate(ROW_EXTRACT_JS) or []
+
+    def page_up(self) -> None:
+        for event_type in ("rawKeyDown", "keyUp"):
+            self.send("Input.dispatchKeyEvent", {
+                "type": event_type, "key": "PageUp", "code": "PageUp",
+                "windowsVirtualKeyCode": 33, "nativeVirtualKeyCode": 33
+            })
+
+    def subscribe_new_rows(self, callback: Callable[[List[Dict[str, Any]]], None]) -> bool:
+        """
+        Açık sohbete eklenen yeni satırları push olarak almak için gözlemci kurar.
+        Sohbet değiştiğinde veya sayfa yenilendiğinde tekrar çağrılmalıdır.
+
+        Args:
+            callback: Yeni satır listesiyle çağrılacak fonksiyon
+
+        Returns:
+            bool: Gözlemci kuruldu mu (mesaj paneli yoksa False)
+        """
+        def on_binding(params: Dict[str, Any]) -> None:
+            if params.get("name") == self.BINDING_NAME:
+                callback(json.loads(params.get("payload") or "[]"))
+
+        if "Runtime.bindingCalled" not in self._handlers:
+            self.send("Runtime.addBinding", {"name": self.BINDING_NAME})
+            self.on("Runtime.bindingCalled", on_binding)
+        return bool(self.evaluate(ROW_OBSERVER_JS.replace("__BINDING__", self.BINDING_NAME)))
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._ws:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+
+
+def create_transport(driver, logger, name: str = "selenium"):
+    """
+    Konfigürasyondaki taşıma katmanını oluşturur; CDP bağlanamazsa Selenium'a düşer.
+
+    Args:
+        driver: WebDriver instance
+        logger: Logger instance
+        name: "selenium" veya "cdp"
+
+    Returns:
+        SeleniumTransport | CDPTransport: Taşıma katmanı
+    """
+    if name == "cdp":
+        try:
+            transport = CDPTransport(driver, logger).connect()
+            logger.info("⚡ CDP taşıması aktif (chromedriver atlanıyor)")
+            return transport
+        except Exception as e:
+            logger.warning("CDP taşımasına bağlanılamadı, Selenium kullanılacak: %s", e)
+    return SeleniumTransport(driver)
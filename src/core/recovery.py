@@ -0,0 +1,236 @@
+"""
+Recovery
+
+Tarayıcı ve WhatsApp oturumu hatalarını sınıflandırıp en ucuz düzeltmeyi
+uygulayan kurtarma katmanı.
+"""
+
+import time
+from typing import Optional
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSessionIdException,
+    JavascriptException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from utils.metrics import get_metrics
+
+# Hata türleri (ucuzdan pahalıya)
+STALE = "stale"                 # sohbet taşındı / eleman bayatladı → sohbeti yeniden aç
+RELOAD = "reload"               # sayfa takıldı → WhatsApp Web'i yeniden yükle
+LOGGED_OUT = "logged_out"       # oturum kapandı → QR ile girişi bekle
+BROWSER_DEAD = "browser_dead"   # Chrome/chromedriver yanıt vermiyor → aynı profille yeniden başlat
+
+# Bir düzeltme başarısız olursa denenecek sonraki adımlar
+ESCALATION = {
+    STALE: [STALE, RELOAD, BROWSER_DEAD],
+    RELOAD: [RELOAD, BROWSER_DEAD],
+    LOGGED_OUT: [LOGGED_OUT],
+    BROWSER_DEAD: [BROWSER_DEAD],
+}
+
+BROWSER_DEAD_MARKERS = (
+    "chrome not reachable",
+    "disconnected",
+    "no such window",
+    "target window already closed",
+    "session deleted",
+    "invalid session id",
+    "connection refused",
+    "max retries exceeded",
+)
+
+QR_SELECTORS = [
+    "canvas[aria-label*='Scan']",
+    "canvas[aria-label*='QR']",
+    "div[data-ref] canvas",
+]
+
+
+class SessionError(Exception):
+    """
+    Türü bilinen oturum hatası (örn. mesaj paneli bulunamadı).
+    """
+
+    def __init__(self, kind: str, message: str = ""):
+        super().__init__(message or kind)
+        self.kind = kind
+
+
+# Doğrudan kurtarma katmanına gönderilen istisnalar
+BROWSER_ERRORS = (WebDriverException, SessionError)
+
+
+def classify_exception(exc: Optional[BaseException]) -> Optional[str]:
+    """
+    İstisnayı hata türüne çevirir.
+
+    Args:
+        exc: Yakalanan istisna
+
+    Returns:
+        Optional[str]: STALE, RELOAD, BROWSER_DEAD veya belirsizse None
+    """
+    if exc is None:
+        return None
+    if isinstance(exc, SessionError):
+        return exc.kind
+    if isinstance(exc, (InvalidSessionIdException, NoSuchWindowException)):
+        return BROWSER_DEAD
+    if isinstance(exc, (StaleElementReferenceException, NoSuchElementException,
+                        ElementNotInteractableException, ElementClickInterceptedException)):
+        return STALE
+    if isinstance(exc, (TimeoutException, JavascriptException)):
+        return RELOAD
+
+    text = str(exc).lower()
+    if isinstance(exc, (WebDriverException, ConnectionError)) or "urllib3" in type(exc).__module__:
+        if any(marker in text for marker in BROWSER_DEAD_MARKERS):
+            return BROWSER_DEAD
+    return None
+
+
+def is_session_error(exc: BaseException) -> bool:
+    """
+    İstisna tarayıcı oturumunun bozulduğunu mu gösteriyor (yerel yeniden deneme yetmez)?
+
+    Args:
+        exc: Yakalanan istisna
+
+    Returns:
+        bool: Kurtarma katmanına iletilmeli mi
+    """
+    return isinstance(exc, SessionError) or classify_exception(exc) == BROWSER_DEAD
+
+
+class SessionRecovery:
+    """
+    Listener'ı hata türüne göre en ucuz yoldan tekrar çalışır hale getirir.
+    Tarama durumu (görülen mesajlar, Notion önbellekleri, zamanlayıcı) listener
+    dışında tutulduğu için kurtarma sonrası soğuk başlangıç gerekmez.
+    """
+
+    def __init__(self, listener, logger, default_group: Optional[str] = None):
+        """
+        Kurtarma katmanını başlatır.
+
+        Args:
+            listener: WhatsAppListener instance
+            logger: Logger instance
+            default_group: Açık grup bilinmiyorsa açılacak grup
+        """
+        self.listener = listener
+        self.logger = logger
+        self.default_group = default_group
+        self.metrics = get_metrics()
+        self.failures = 0
+
+    def probe(self) -> str:
+        """
+        Sayfanın durumuna bakarak hata türünü tahmin eder.
+
+        Returns:
+            str: STALE, RELOAD, LOGGED_OUT veya BROWSER_DEAD
+        """
+        driver = self.listener.driver
+        try:
+            url = driver.current_url or ""
+        except Exception:
+            return BROWSER_DEAD
+
+        if "web.whatsapp.com" not in url:
+            return RELOAD
+        try:
+            if self.listener._is_chat_list_visible():
+                return STALE
+            for selector in QR_SELECTORS:
+                if driver.find_elements(By.CSS_SELECTOR, selector):
+                    return LOGGED_OUT
+        except Exception:
+            return BROWSER_DEAD
+        return RELOAD
+
+    def _apply(self, kind: str, group: Optional[str]) -> bool:
+        listener = self.listener
+        if kind == STALE:
+            return bool(group) and listener.open_group(group)
+        if kind == RELOAD:
+            return listener.reload_page() and (not group or listener.open_group(group))
+        if kind == LOGGED_OUT:
+            self.logger.error("🔑 WhatsApp oturumu kapanmış, QR kodunun okutulması bekleniyor")
+            return listener.login_to_whatsapp() and (not group or listener.open_group(group))
+        if kind == BROWSER_DEAD:
+            listener.restart_browser()
+            return listener.login_to_whatsapp() and (not group or listener.open_group(group))
+        return False
+
+    def recover(self, exc: Optional[BaseException] = None, group: Optional[str] = None) -> bool:
+        """
+        Hatayı sınıflandırır ve düzeltmeleri ucuzdan pahalıya dener.
+
+        Args:
+            exc: Yakalanan istisna (yoksa sayfa durumu yoklanır)
+            group: Tekrar açılacak grup (varsayılan: açık grup)
+
+        Returns:
+            bool: Listener tekrar kullanılabilir mi
+        """
+        group = group or self.listener.current_group or self.default_group
+        kind = classify_exception(exc) or self.probe()
+        self.logger.warning("🩺 Oturum hatası (%s): %s", kind, exc if exc else "sayfa yoklandı")
+
+        for step in ESCALATION[kind]:
+            start = time.perf_counter()
+            try:
+                ok = self._apply(step, group)
+            except Exception as e:
+                self.logger.warning("Kurtarma adımı başarısız (%s): %s", step, e)
+                ok = False
+            self.metrics.observe("recovery_seconds", time.perf_counter() - start, step=step)
+            self.metrics.inc("recoveries_total", step=step, outcome="ok" if ok else "failed")
+            if ok:
+                self.logger.info("✅ Oturum kurtarıldı (%s, %.1fs)", step, time.perf_counter() - start)
+                self.failures = 0
+                return True
+
+        self.failures += 1
+        self.logger.error("❌ Oturum kurtarılamadı (%s, üst üste %d)", kind, self.failures)
+        return False
+
+    def ensure_session(self, group: str) -> bool:
+        """
+        Giriş yapıp grubu açar; başarısız olursa kurtarma adımlarını uygular.
+
+        Args:
+            group: Açılacak grup
+
+        Returns:
+            bool: Oturum hazır mı
+        """
+        try:
+            if self.listener.login_to_whatsapp() and self.listener.open_group(group):
+                return True
+        except Exception as e:
+            return self.recover(e, group)
+        return self.recover(None, group)
+
+    def backoff(self, failures: Optional[int] = None) -> float:
+        """
+        Üst üste başarısız kurtarmalardan (veya verilen hata sayısından) sonra beklenecek süre.
+
+        Args:
+            failures: Üst üste hata sayısı (varsayılan: başarısız kurtarma sayısı)
+
+        Returns:
+            float: Saniye (5, 10, 20 ... en fazla 300)
+        """
+        failures = self.failures if failures is None else failures
+        return min(300.0, 5.0 * (2 ** max(0, failures - 1))) if failures else 0.0
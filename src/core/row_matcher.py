@@ -0,0 +1,118 @@
+"""
+Row Matcher
+
+Mesajdan çıkarılan ismi Notion database satırlarıyla eşleştiren saf fonksiyonlar.
+NotionClient.find_row_by_name bu modülü kullanır; ağdan bağımsız olduğu için
+benchmark ve property testleri doğrudan buradan çalışır.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+MATCH_PROPERTY_TYPES = ("title", "rich_text")
+
+# "İ".lower() → "i" + U+0307 (birleşik nokta); noktasız ı da i sayılır ("IŞIK" ↔ "Işık" ↔ "ışık")
+_COMBINING_DOT = "\u0307"
+
+
+def normalize_name(text: str) -> str:
+    """
+    Karşılaştırma için küçük harfe çevirir; İ, I ve ı düz i olur.
+
+    Args:
+        text: Metin
+
+    Returns:
+        str: Küçük harfli metin
+    """
+    # str.translate'ten ~8 kat hızlı: harf yoksa replace kopyalamaz
+    return text.lower().replace(_COMBINING_DOT, "").replace("ı", "i")
+
+
+def row_texts(row: Dict[str, Any]) -> Iterator[str]:
+    """
+    Satırın title ve rich_text alanlarının düz metinlerini özellik sırasıyla verir.
+
+    Args:
+        row: databases.query sonucu satır
+
+    Returns:
+        Iterator[str]: Alan metinleri
+    """
+    for prop_data in row.get("properties", {}).values():
+        prop_type = prop_data.get("type")
+        if prop_type in MATCH_PROPERTY_TYPES:
+            yield "".join(text.get("plain_text", "") for text in prop_data.get(prop_type, []))
+
+
+def match_row(rows: Iterable[Dict[str, Any]], name: str) -> Optional[Dict[str, Any]]:
+    """
+    İsmin tam eşleştiği satırı, yoksa ismi içeren ilk satırı bulur
+    ("Can Kaya" mesajı "Yüksel Can Kaya" satırından önce "Can Kaya" satırına gider).
+
+    Args:
+        rows: databases.query sonuç satırları
+        name: Aranacak isim
+
+    Returns:
+        Optional[Dict[str, Any]]: Eşleşen satır (isim boşsa None)
+    """
+    return match_row_exact(rows, name)[0]
+
+
+def match_row_exact(rows: Iterable[Dict[str, Any]], name: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    match_row ile aynı arama; eşleşmenin tam mı (kesin) yoksa içerme mi olduğunu da döndürür.
+
+    Args:
+        rows: databases.query sonuç satırları
+        name: Aranacak isim
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], bool]: (satır, tam eşleşme mi)
+    """
+    name_lower = normalize_name(name).strip()
+    if not name_lower:
+        # Sadece durum kelimesinden oluşan mesaj ("iptal") her satırı "içerir"
+        return None, False
+    partial = None
+    # Sıcak yol: row_texts/normalize_name yerine satır içi döngü (satır başına fonksiyon çağrısı yok)
+    for row in rows:
+        for prop_data in row.get("properties", {}).values():
+            prop_type = prop_data.get("type")
+            if prop_type not in MATCH_PROPERTY_TYPES:
+                continue
+            parts = prop_data.get(prop_type)
+            if not parts:
+                continue
+            text_lower = "".join([part.get("plain_text", "") for part in parts]).lower()
+            text_lower = text_lower.replace(_COMBINING_DOT, "").replace("ı", "i")
+            if name_lower == text_lower:
+                return row, True
+            if partial is None and name_lower in text_lower:
+                partial = row
+    return partial, False
+
+
+def property_value(prop: Optional[Dict[str, Any]]) -> Any:
+    """
+    Bir özelliğin karşılaştırılabilir değerini çıkarır. Hem sayfa yanıtlarını hem
+    pages.update gövdelerini ("text.content") okur.
+
+    Args:
+        prop: Özellik ({"type": ..., <type>: ...})
+
+    Returns:
+        Any: status/select → ad, multi_select → sıralı ad listesi, title/rich_text → düz metin,
+            checkbox → bool; bilinmeyen tip için ham değer
+    """
+    if not prop:
+        return None
+    prop_type = prop.get("type")
+    value = prop.get(prop_type)
+    if prop_type in ("status", "select"):
+        return (value or {}).get("name")
+    if prop_type == "multi_select":
+        return sorted(option.get("name") for option in value or [])
+    if prop_type in MATCH_PROPERTY_TYPES:
+        return "".join(part.get("plain_text") or part.get("text", {}).get("content", "") for part in value or [])
+    return value
@@ -0,0 +1,145 @@
+"""
+Scan Scheduler
+
+Tarama aralığını sohbet aktivitesine ve çalışma saatlerine göre ayarlayan sınıf.
+"""
+
+from datetime import datetime, time as dtime, timedelta
+from typing import Any, Dict, Optional
+
+
+class ScanScheduler:
+    """
+    Uyarlanabilir tarama zamanlayıcısı.
+
+    Mesaj geldikçe aralığı kısaltır, sohbet boştayken üstel olarak uzatır,
+    çalışma saatleri dışında seyrek tarar.
+    """
+
+    def __init__(self, whatsapp_config: Dict[str, Any], logger=None):
+        """
+        Zamanlayıcıyı başlatır.
+
+        Args:
+            whatsapp_config: ConfigLoader.get_whatsapp_config() çıktısı
+            logger: Logger instance (opsiyonel)
+        """
+        self.logger = logger
+        self.base_interval = float(whatsapp_config.get("scan_interval", 5))
+        self.min_interval = float(whatsapp_config.get("min_scan_interval", 2))
+        self.max_interval = float(whatsapp_config.get("max_scan_interval", 120))
+        self.backoff_factor = float(whatsapp_config.get("backoff_factor", 2.0))
+        self.off_hours_interval = float(whatsapp_config.get("off_hours_interval", 600))
+
+        working_hours = whatsapp_config.get("working_hours") or {}
+        self.work_start = self._parse_clock(working_hours.get("start"))
+        self.work_end = self._parse_clock(working_hours.get("end"))
+
+        self.idle_cycles = 0
+        self.current_interval = self.base_interval
+        self.last_decision: Dict[str, Any] = {}
+
+    @staticmethod
+    def _parse_clock(value: Optional[str]) -> Optional[dtime]:
+        """
+        "SS:DD" formatındaki saati parse eder.
+
+        Args:
+            value: Saat metni
+
+        Returns:
+            Optional[time]: Saat veya None
+        """
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%H:%M").time()
+        except ValueError:
+            raise ValueError(f"Geçersiz çalışma saati: {value} (beklenen format SS:DD)")
+
+    def is_working_hours(self, now: datetime) -> bool:
+        """
+        Verilen an çalışma saatleri içinde mi kontrol eder.
+
+        Args:
+            now: Kontrol edilecek an
+
+        Returns:
+            bool: Çalışma saatleri içinde mi (tanımlı değilse her zaman True)
+        """
+        if self.work_start is None or self.work_end is None:
+            return True
+
+        current = now.time()
+        if self.work_start <= self.work_end:
+            return self.work_start <= current < self.work_end
+        # Gece yarısını geçen aralık (örn. 22:00 → 06:00)
+        return current >= self.work_start or current < self.work_end
+
+    def _seconds_until_work_start(self, now: datetime) -> float:
+        """
+        Bir sonraki çalışma saati başlangıcına kalan süreyi hesaplar.
+
+        Args:
+            now: Şu anki zaman
+
+        Returns:
+            float: Kalan saniye
+        """
+        start = datetime.combine(now.date(), self.work_start)
+        if start <= now:
+            start += timedelta(days=1)
+        return (start - now).total_seconds()
+
+    def next_interval(self, new_messages: int, now: Optional[datetime] = None) -> float:
+        """
+        Son taramada gelen yeni mesaj sayısına göre bir sonraki bekleme süresini belirler.
+
+        Args:
+            new_messages: Son taramada görülen yeni mesaj sayısı
+            now: Şu anki zaman (test için)
+
+        Returns:
+            float: Bekleme süresi (saniye)
+        """
+        now = now or datetime.now()
+
+        if new_messages > 0:
+            self.idle_cycles = 0
+        else:
+            self.idle_cycles += 1
+
+        if not self.is_working_hours(now):
+            if new_messages > 0:
+                interval = self.base_interval
+                reason = "mesai dışı, yeni mesaj"
+            else:
+                interval = min(self.off_hours_interval, self._seconds_until_work_start(now))
+                reason = "mesai dışı"
+        elif new_messages > 0:
+            interval = self.min_interval
+            reason = f"{new_messages} yeni mesaj"
+        elif self.idle_cycles <= 1:
+            interval = self.base_interval
+            reason = "boşta"
+        else:
+            interval = self.base_interval * (self.backoff_factor ** (self.idle_cycles - 1))
+            interval = min(self.max_interval, interval)
+            reason = f"boşta ({self.idle_cycles} tur)"
+
+        interval = max(self.min_interval, interval)
+
+        if self.logger and interval != self.current_interval:
+            self.logger.info(
+                "⏱️ Tarama aralığı: %.1fs → %.1fs (%s)", self.current_interval, interval, reason
+            )
+
+        self.current_interval = interval
+        self.last_decision = {
+            "at": now.isoformat(timespec="seconds"),
+            "interval": interval,
+            "new_messages": new_messages,
+            "idle_cycles": self.idle_cycles,
+            "reason": reason,
+        }
+        return interval
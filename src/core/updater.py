@@ -4,7 +4,11 @@ Updater
 Notion veritabanlarını güncelleyen sınıf.
 """
 
-from typing import Dict, List
+import hashlib
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+from utils.metrics import get_metrics
 
 
 class Updater:
@@ -12,7 +16,8 @@ class Updater:
     Notion veritabanlarını güncelleyen sınıf.
     """
     
-    def __init__(self, notion_client, parser, logger):
+    def __init__(self, notion_client, parser, logger, recorder=None,
+                 candidate_days: int = 2, parallel_lookup: bool = True, max_workers: int = 4):
         """
         Updater'ı başlatır.
         
@@ -20,42 +25,171 @@ class Updater:
             notion_client: NotionClient instance
             parser: MessageParser instance
             logger: Logger instance
+            recorder: İşlenen mesajları ve sonuçlarını kaydeden SessionRecorder (opsiyonel)
+            candidate_days: Hedef database verilmediğinde aranacak gün sayısı (bugün, dün, ...)
+            parallel_lookup: Birden fazla aday database aynı anda aransın mı
+            max_workers: Paralel arama thread sayısı
         """
         self.notion_client = notion_client
         self.parser = parser
         self.logger = logger
+        self.recorder = recorder
+        self.candidate_days = candidate_days
+        self.parallel_lookup = parallel_lookup
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.metrics = get_metrics()
         
-    def process_text(self, text: str) -> None:
+    def process_text(self, text: str, database_id: Optional[str] = None,
+                     received_at: Optional[float] = None, message_id: Optional[str] = None,
+                     fallback: bool = False) -> str:
         """
         Metni işler ve Notion'da günceller.
         
         Args:
             text: İşlenecek metin
+            database_id: Aranacak database (verilmezse son candidate_days günün database'leri aranır)
+            received_at: Mesajın WhatsApp'tan okunduğu an (time.time()); uçtan uca süre için
+            message_id: Mesaj kimliği (verilmezse metinden türetilir)
+            fallback: database_id'de hiç eşleşme yoksa son candidate_days günün database'leri
+                aransın mı (isim mesajın gününe değil, örn. düne ait tabloda olabilir)
+            
+        Returns:
+            str: Sonuç (updated, unchanged, failed, not_found, no_status)
+        """
+        start = time.perf_counter()
+        started = time.monotonic()
+        if message_id is None:
+            message_id = hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+        outcome = self._process(text, database_id, message_id, fallback)
+        if self.recorder:
+            self.recorder.record_message(message_id, text, database_id,
+                                         getattr(self.notion_client, "parent_page_id", None),
+                                         outcome, started=started, fallback=fallback)
+        self.metrics.observe("updater_process_seconds", time.perf_counter() - start, outcome=outcome)
+        self.metrics.inc("updater_messages_total", outcome=outcome)
+        if outcome in ("updated", "unchanged") and received_at is not None:
+            self.metrics.observe("updater_e2e_seconds", time.time() - received_at)
+        return outcome
+        
+    def _process(self, text: str, database_id: Optional[str], message_id: str, fallback: bool = False) -> str:
+        """
+        Metni parse edip eşleşen satırı günceller.
+        
+        Args:
+            text: İşlenecek metin
+            database_id: Aranacak database
+            message_id: Mesaj kimliği (yapılandırılmış loglar için)
+            fallback: database_id'de eşleşme yoksa son günlerin database'leri aransın mı
+            
+        Returns:
+            str: Sonuç (updated, unchanged, failed, not_found, no_status)
         """
+        # Aşama süreleri (ms), JSON loglarına eklenir
+        timings: Dict[str, float] = {}
+        log_extra = {"message_id": message_id, "stage_timings": timings}
+        
         # Parser ile mesajı parse et
+        stage_start = time.perf_counter()
         data = self.parser.parse_message(text)
+        timings["parse_ms"] = round((time.perf_counter() - stage_start) * 1000, 3)
         
         # Status None ise uyarı ver ve çık
         if data["status"] is None:
-            self.logger.warning(f"Durum bulunamadı: {text}")
-            return
+            self.logger.warning("Durum bulunamadı: %s", text, extra=log_extra)
+            return "no_status"
+        
+        # Hedef database verilmişse sadece o, yoksa son günlerin database'leri
+        if database_id:
+            databases = [database_id]
+        else:
+            databases = self.notion_client.get_recent_databases(self.candidate_days)
         
-        # Bugünün ve dünün database'lerini al
-        databases = self.notion_client.get_today_and_yesterday_databases()
+        # Aday database'lerde ara
+        stage_start = time.perf_counter()
+        db, row_id = self._find_row(databases, data["name"])
+        if not row_id and database_id and fallback:
+            # Mesajın gününde hiç eşleşme yoksa (kısmi de) diğer günler aranır; o günün
+            # kısmi eşleşmesi başka günün tam eşleşmesine tercih edilir
+            others = [candidate for candidate in self.notion_client.get_recent_databases(self.candidate_days)
+                      if candidate != database_id]
+            if others:
+                self.metrics.inc("updater_fallback_lookups_total")
+                db, row_id = self._find_row(others, data["name"])
+        timings["lookup_ms"] = round((time.perf_counter() - stage_start) * 1000, 3)
         
-        # Her database için kontrol et
-        for db in databases:
-            row_id = self.notion_client.find_row_by_name(db, data["name"])
+        if not row_id:
+            # Hiç eşleşme bulunamadı
+            self.logger.warning("Kayıt bulunamadı: %s", data, extra=log_extra)
+            return "not_found"
+        
+        # Status güncelle; satır zaten hedef değerdeyse yazma yapılmaz
+        stage_start = time.perf_counter()
+        plan = self.notion_client.plan_status_update(db, row_id, data["status"])
+        if plan and plan["unchanged"]:
+            timings["update_ms"] = round((time.perf_counter() - stage_start) * 1000, 3)
+            self.metrics.inc("updater_writes_avoided_total")
+            self.logger.info("Zaten güncel, yazma atlandı: %s", data, extra=log_extra)
+            return "unchanged"
+        ok = bool(plan) and self.notion_client.apply_status_update(db, row_id, plan)
+        timings["update_ms"] = round((time.perf_counter() - stage_start) * 1000, 3)
+        
+        if ok:
+            self.logger.info("Güncellendi: %s", data, extra=log_extra)
+            return "updated"
+        self.logger.error("Güncellenemedi: %s", data, extra=log_extra)
+        return "failed"
+        
+    def _find_row(self, databases: List[str], name: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        İsmi aday database'lerde arar. Öncelik aday sırasıdır (yeniden eskiye): tam
+        eşleşme bulunan ilk database kazanır, yoksa ilk içerme eşleşmesi döner.
+        Paralel aramada kazanan, kendinden önceki adaylar bittiği anda belli olur.
+        
+        Args:
+            databases: Aday database ID'leri (öncelik sırasıyla)
+            name: Aranacak isim
             
-            if row_id:
-                # Status güncelle
-                ok = self.notion_client.update_status(db, row_id, data["status"])
-                
-                if ok:
-                    self.logger.info(f"Güncellendi: {data}")
-                else:
-                    self.logger.error(f"Güncellenemedi: {data}")
-                return
-        
-        # Hiç eşleşme bulunamadı
-        self.logger.warning(f"Kayıt bulunamadı: {data}")
+        Returns:
+            Tuple[Optional[str], Optional[str]]: (database ID, satır ID)
+        """
+        if len(databases) < 2 or not self.parallel_lookup:
+            results = []
+            for db in databases:
+                results.append(self.notion_client.find_row_match(db, name))
+                if results[-1] and results[-1][1]:
+                    break
+            return self._pick(databases, results)
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="notion-lookup")
+        self.metrics.inc("updater_parallel_lookups_total")
+        futures = [self._executor.submit(self.notion_client.find_row_match, db, name) for db in databases]
+        try:
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # Baştan itibaren biten adaylara bak: tam eşleşme varsa sonrakiler beklenmez
+                results = []
+                for future in futures:
+                    if not future.done():
+                        break
+                    results.append(future.result())
+                    if results[-1] and results[-1][1]:
+                        return self._pick(databases, results)
+            return self._pick(databases, [future.result() for future in futures])
+        finally:
+            # Kazanan belli olunca başlamamış aramalar iptal edilir (süren HTTP istekleri arka planda biter)
+            cancelled = sum(1 for future in futures if future.cancel())
+            if cancelled:
+                self.metrics.inc("updater_lookups_cancelled_total", cancelled)
+        
+    @staticmethod
+    def _pick(databases: List[str], results: List[Optional[Tuple[str, bool]]]) -> Tuple[Optional[str], Optional[str]]:
+        for db, match in zip(databases, results):
+            if match and match[1]:
+                return db, match[0]
+        for db, match in zip(databases, results):
+            if match:
+                return db, match[0]
+        return None, None
@@ -4,7 +4,7 @@ WhatsApp Listener
 WhatsApp Web'i dinleyerek yeni mesajları yakalayan sınıf.
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -12,8 +12,15 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
 from datetime import datetime
+import threading
 import time
 from .browser import BrowserConfig
+from .memory_watchdog import MemoryWatchdog
+from .page_transport import CHAT_UNREAD_JS, create_transport
+from .recovery import STALE, SessionError, is_session_error
+from utils.date_utils import DATE_SEPARATOR_RE, date_range, format_date, parse_date, resolve_date_label
+from utils.deadline import budget_timeout
+from utils.metrics import get_metrics
 
 
 class WhatsAppListener:
@@ -33,10 +40,93 @@ class WhatsAppListener:
         self.logger = logger
         
         # Browser configuration
-        browser_config = BrowserConfig(config_loader, logger)
-        self.driver = browser_config.create_driver()
+        self.browser_config = BrowserConfig(config_loader, logger)
+        self.driver = self.browser_config.create_driver()
         
         self.is_logged_in = False
+        self.current_group = None
+        self.metrics = get_metrics()
+        
+        # Tek bir beklemenin üst sınırı; döngü bütçesi (Deadline) verilmişse kalan süreyle de sınırlanır
+        self.wait_cap = float(config_loader.get_selenium_config()["implicit_wait"])
+        self.deadline = None
+        # Son taramanın imlece / başlangıç ayracına kadar inip inmediği (bütçe veya kaydırma sınırıyla kesilmediyse True)
+        self.last_scan_complete = False
+        self._apply_timeouts()
+        
+        watchdog_config = config_loader.get_watchdog_config()
+        self.watchdog = MemoryWatchdog(self.driver, logger, watchdog_config) if watchdog_config["enabled"] else None
+        
+        # Sayfa okuma/kaydırma komutlarının taşıma katmanı (selenium veya cdp)
+        self.transport = create_transport(self.driver, logger, config_loader.get_extraction_config()["transport"])
+        
+        # CDP taşımasında açık sohbete yeni mesaj eklenince set edilir; tarama beklemesini erken bitirir
+        self.new_rows = threading.Event()
+        
+    def _apply_timeouts(self) -> None:
+        """
+        Örtük beklemeyi kapatır (fallback selector listelerinde her eksik selector
+        için beklenmesin) ve script süresini bekleme üst sınırına çeker.
+        """
+        try:
+            self.driver.implicitly_wait(0)
+            self.driver.set_script_timeout(self.wait_cap)
+        except Exception as e:
+            self.logger.warning("WebDriver zaman aşımları ayarlanamadı: %s", e)
+        
+    def _budget(self, timeout: float) -> float:
+        """
+        Bir bekleme için kullanılacak süre: istenen süre, wait_cap ve döngü bütçesinin en küçüğü.
+        
+        Args:
+            timeout: İstenen süre (saniye)
+            
+        Returns:
+            float: Saniye
+        """
+        return budget_timeout(self.deadline, min(timeout, self.wait_cap))
+        
+    def _budget_exhausted(self, stage: str) -> bool:
+        """
+        Döngü bütçesi bittiyse ölçer ve True döner.
+        
+        Args:
+            stage: Metrik etiketi (scroll, open_group ...)
+            
+        Returns:
+            bool: Bütçe bitti mi
+        """
+        if self.deadline is None or not self.deadline.expired:
+            return False
+        self.metrics.inc("scan_budget_exhausted_total", stage=stage)
+        self.logger.warning("⏱️ Döngü bütçesi bitti (%s), adım kısa kesildi", stage,
+                            extra={"event_key": ("budget_exhausted", stage)})
+        return True
+        
+    def _wait_for_any(self, selectors: List[str], timeout: float, poll: float = 0.25):
+        """
+        Selector'lardan herhangi biri görünene kadar tek bir süre boyunca bekler.
+        Öncelik sırası korunur; her selector için ayrı ayrı beklenmez.
+        
+        Args:
+            selectors: CSS selector'lar (öncelik sırasıyla)
+            timeout: Toplam bekleme süresi (saniye, bütçeyle sınırlanır)
+            poll: Yoklama aralığı (saniye)
+            
+        Returns:
+            Tuple[str, WebElement] or None: Bulunan selector ve eleman
+        """
+        limit = self._budget(timeout)
+        start = time.monotonic()
+        while True:
+            for selector in selectors:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    return selector, elements[0]
+            if time.monotonic() - start >= limit:
+                self.metrics.inc("listener_wait_timeouts_total")
+                return None
+            time.sleep(poll)
         
     def _is_chat_list_visible(self):
         """
@@ -87,6 +177,12 @@ class WhatsAppListener:
             bool: Giriş başarılı mı
         """
         try:
+            # Attach edilen Chrome'da WhatsApp zaten açıksa sayfayı yeniden yükleme
+            if "web.whatsapp.com" in (self.driver.current_url or "") and self._is_chat_list_visible():
+                self.logger.info("♻️ WhatsApp Web zaten açık, yeniden yüklenmedi")
+                self.is_logged_in = True
+                return True
+            
             self.driver.get("https://web.whatsapp.com")
             
             if self._wait_until_logged_in():
@@ -95,9 +191,55 @@ class WhatsAppListener:
             else:
                 return False
         except Exception as e:
-            self.logger.error(f"WhatsApp giriş hatası: {e}")
+            self.logger.error("WhatsApp giriş hatası: %s", e)
             return False
         
+    def reload_page(self, timeout: int = 60) -> bool:
+        """
+        WhatsApp Web'i yeniden yükler ve sohbet listesini bekler (oturum korunur).
+        
+        Args:
+            timeout: Sohbet listesi için bekleme süresi (saniye)
+            
+        Returns:
+            bool: Sohbet listesi geri geldi mi
+        """
+        self.current_group = None
+        self.driver.get("https://web.whatsapp.com")
+        self.is_logged_in = self._wait_until_logged_in(timeout)
+        return self.is_logged_in
+        
+    def restart_browser(self, quit_browser: bool = False) -> None:
+        """
+        Yanıt vermeyen tarayıcıyı aynı profille yeniden başlatır (Chrome hâlâ
+        açıksa debug portu üzerinden tekrar bağlanılır). Watchdog ve taşıma
+        katmanı yeni driver'a bağlanır.
+        
+        Args:
+            quit_browser: True ise Chrome kapatılıp güncel konfigürasyonla
+                (session_path, headless, browser ayarları) yeniden açılır
+        """
+        self.logger.warning("🔁 Tarayıcı yeniden başlatılıyor")
+        self.transport.close()
+        self.browser_config.release_driver(self.driver, quit_browser=quit_browser)
+        
+        self.driver = self.browser_config.create_driver()
+        self.is_logged_in = False
+        self.current_group = None
+        if self.watchdog:
+            self.watchdog.driver = self.driver
+        self.wait_cap = float(self.config_loader.get_selenium_config()["implicit_wait"])
+        self._apply_timeouts()
+        self.transport = create_transport(self.driver, self.logger, self.config_loader.get_extraction_config()["transport"])
+        self.metrics.inc("browser_restarts_total")
+        
+    def close(self) -> None:
+        """
+        Tarayıcı oturumunu kapatır (attach modunda Chrome açık bırakılır).
+        """
+        self.transport.close()
+        self.browser_config.release_driver(self.driver)
+        
     def open_group(self, group_name: str) -> bool:
         """
         Belirtilen grubu açar.
@@ -124,23 +266,85 @@ class WhatsAppListener:
                 "div[role='region']"
             ]
             
-            # 20 saniye boyunca mesaj panelini bekle
-            start_time = time.time()
-            while time.time() - start_time < 20:
-                for selector in message_selectors:
-                    try:
-                        if self.driver.find_element(By.CSS_SELECTOR, selector):
-                            return True
-                    except:
-                        continue
-                time.sleep(1)
+            # Mesaj panelini bekle (en fazla 20 saniye, wait_cap ve döngü bütçesiyle sınırlı)
+            if self._wait_for_any(message_selectors, 20):
+                self.current_group = group_name
+                self._watch_new_rows()
+                return True
             
             return False
             
         except Exception as e:
-            self.logger.error(f"Grup açma hatası: {e}")
+            self.logger.error("Grup açma hatası: %s", e)
+            return False
+        
+    def get_unread_counts(self) -> Dict[str, int]:
+        """
+        Sohbet listesindeki okunmamış mesaj rozetlerini tek çağrıda okur.
+        Liste sanal kaydırmalı olduğu için sadece yüklü sohbetler döner;
+        yeni mesaj alan sohbetler listenin üstüne çıktığından bu yeterlidir.
+        
+        Returns:
+            Dict[str, int]: Sohbet başlığı → okunmamış mesaj sayısı
+        """
+        try:
+            counts = self.transport.evaluate(CHAT_UNREAD_JS) or {}
+        except Exception as e:
+            self.logger.warning("Okunmamış rozetleri okunamadı: %s", e)
+            return {}
+        return {title: int(count) for title, count in counts.items()}
+        
+    def check_memory(self) -> bool:
+        """
+        Watchdog'a bellek kontrolü yaptırır; eşik aşıldıysa DOM'u küçültür.
+        Adımlar ucuzdan pahalıya: en alta kaydırma → sohbeti kapatıp açma → sekmeyi yenileme.
+        Oturum ve açık grup korunur.
+        
+        Returns:
+            bool: Bir temizleme adımı uygulandı mı
+        """
+        if not self.watchdog:
             return False
         
+        action = self.watchdog.check()
+        if not action:
+            return False
+        
+        try:
+            if action == "scroll_to_bottom":
+                container = self._get_message_container()
+                if container is not None:
+                    self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", container)
+            elif action == "reopen_chat":
+                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+                time.sleep(0.5)
+                if self.current_group:
+                    self.open_group(self.current_group)
+            elif action == "recycle_tab":
+                group = self.current_group
+                if self.reload_page() and group:
+                    self.open_group(group)
+            self.logger.info("🧹 Bellek temizleme adımı uygulandı: %s", action)
+            return True
+        except Exception as e:
+            self.logger.warning("Bellek temizleme adımı başarısız (%s): %s", action, e)
+            return False
+        
+    def _watch_new_rows(self) -> None:
+        """
+        Açılan sohbete yeni satır gözlemcisi kurar (sadece push destekleyen taşımada).
+        Sohbet değiştiğinde eski gözlemci sayfa tarafında kaldırılır.
+        """
+        try:
+            if self.transport.subscribe_new_rows(self._on_new_rows):
+                self.logger.debug("Yeni mesaj bildirimi kuruldu: %s", self.current_group)
+        except Exception as e:
+            self.logger.warning("Yeni mesaj bildirimi kurulamadı, aralıkla taranacak: %s", e)
+        
+    def _on_new_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self.metrics.inc("listener_pushed_rows_total", len(rows))
+        self.new_rows.set()
+        
     def get_recent_messages(self, limit=10) -> List[str]:
         """
         Son mesajları getirir.
@@ -171,7 +375,7 @@ class WhatsAppListener:
                     continue
                     
         except Exception as e:
-            self.logger.error(f"Mesaj alma hatası: {e}")
+            self.logger.error("Mesaj alma hatası: %s", e)
             
         return messages
         
@@ -180,14 +384,36 @@ class WhatsAppListener:
         Belirtilen tarih için mesajları getirir.
         Tarih ayracı bulup o günün mesajlarını toplar.
         """
+        messages = []
+        seen = set()
+        for record in self.get_message_records_by_date(target_date):
+            if record["text"] not in seen:
+                seen.add(record["text"])
+                messages.append(record["text"])
+        return messages
+
+    def get_message_records_by_date(self, target_date: str) -> List[Dict[str, Any]]:
+        """
+        Belirtilen tarih için mesaj kayıtlarını getirir.
+        Satırlar taşıma katmanından tek çağrıda okunur (Selenium veya CDP).
+        
+        Args:
+            target_date: Hedef tarih (gg.aa.yyyy)
+            
+        Returns:
+            List[Dict[str, Any]]: id (data-id), text, meta ve date alanlı kayıtlar
+            
+        Raises:
+            SessionError: Mesaj paneli bulunamazsa veya tarayıcı yanıt vermezse
+        """
         import re
         
-        self.logger.info(f"Hedef tarih aranıyor: {target_date}")
+        scan_start = time.perf_counter()
+        self.logger.info("Hedef tarih aranıyor: %s", target_date)
 
         # Bir kere focus ver
         if not self._focus_message_panel():
-            self.logger.error("Focus verilemedi, scroll yapılamıyor")
-            return []
+            raise SessionError(STALE, "Focus verilemedi, scroll yapılamıyor")
 
         # Tarih formatları hazırla
         date_formats = [
@@ -207,82 +433,233 @@ class WhatsAppListener:
             re.IGNORECASE
         )
 
-        messages = []
+        records = []
         seen = set()
         collecting = False
         target_found = False
         next_date_found = False
+        rows = []
 
         # Tek focus ile sürekli scroll - hiç bekleme yok
         self.logger.info("⬆️ Yukarı kaydırılıyor (PAGE_UP)")
-        actions = ActionChains(self.driver)
         
         for scroll_attempt in range(50):  # Daha fazla scroll denemesi
+            if self._budget_exhausted("scroll"):
+                break
+            
             # Scroll yap
-            actions.send_keys(Keys.PAGE_UP).perform()
+            with self.metrics.timer("listener_scroll_step_seconds", mode="date", transport=self.transport.name):
+                self.transport.page_up()
             
             # Mevcut mesajları kontrol et
             try:
-                rows = self.driver.find_elements(By.CSS_SELECTOR, "div[role='row']")
+                extract_start = time.perf_counter()
+                rows = self.transport.extract_rows()
                 for row in rows:
-                    try:
-                        raw_text = row.text.strip()
-                        if not raw_text:
+                    raw_text = row["raw"]
+                    if not raw_text:
+                        continue
+                        
+                    # Tarih ayracı mı kontrol et
+                    if date_pattern.match(raw_text):
+                        normalized_date = raw_text.strip()
+                        
+                        # Hedef tarih bulundu mu?
+                        if not target_found and normalized_date in date_formats:
+                            self.logger.info("✅ Tarih ayracı bulundu: %s", raw_text)
+                            collecting = True
+                            target_found = True
                             continue
-                            
-                        # Tarih ayracı mı kontrol et
-                        if date_pattern.match(raw_text):
-                            normalized_date = raw_text.strip()
-                            
-                            # Hedef tarih bulundu mu?
-                            if not target_found and normalized_date in date_formats:
-                                self.logger.info(f"✅ Tarih ayracı bulundu: {raw_text}")
-                                collecting = True
-                                target_found = True
-                                continue
-                            
-                            # Farklı tarih bulundu mu? (toplama durdur)
-                            elif collecting and normalized_date not in date_formats:
-                                self.logger.info(f"🛑 Sonraki tarih ayracı görüldü: {raw_text}")
-                                next_date_found = True
-                                break
                         
-                        # Mesaj toplama
-                        elif collecting and not next_date_found:
-                            message_text = self._extract_text_from_row(row)
-                            if message_text and message_text not in seen:
-                                seen.add(message_text)
-                                messages.append(message_text)
-                                
-                    except Exception as e:
-                        continue
+                        # Farklı tarih bulundu mu? (toplama durdur)
+                        elif collecting and normalized_date not in date_formats:
+                            self.logger.info("🛑 Sonraki tarih ayracı görüldü: %s", raw_text)
+                            next_date_found = True
+                            break
+                    
+                    # Mesaj toplama
+                    elif collecting and not next_date_found:
+                        self._collect_record(row, target_date, records, seen)
+                self.metrics.observe(
+                    "listener_extract_seconds", time.perf_counter() - extract_start,
+                    mode="date", transport=self.transport.name
+                )
                 
                 # Hedef tarih bulundu ve sonraki tarih de bulundu
                 if collecting and next_date_found:
                     break
                     
             except Exception as e:
-                self.logger.warning(f"Scroll sırasında hata: {e}")
+                if is_session_error(e):
+                    raise
+                self.logger.warning("Scroll sırasında hata: %s", e)
                 continue
 
+        # Hedef ayraç görüldüyse altındaki tüm yüklü satırlar toplanmıştır
+        self.last_scan_complete = target_found
+        
         # Hedef tarih bulunamadıysa son mesajları al
         if not target_found:
-            self.logger.warning(f"Hedef tarih bulunamadı: {target_date}")
+            self.logger.warning("Hedef tarih bulunamadı: %s", target_date)
+            message_rows = [row for row in rows if row["raw"] and not date_pattern.match(row["raw"])]
+            for row in message_rows[-20:]:  # Son 20 mesaj (günü bilinmediği için tarihsiz)
+                self._collect_record(row, None, records, seen)
+        
+        self.logger.info("📊 %s için toplanan mesaj sayısı: %s", target_date, len(records))
+        self.metrics.observe("listener_scan_seconds", time.perf_counter() - scan_start, mode="date")
+        self.metrics.inc("listener_messages_total", len(records), mode="date")
+        return records
+
+    @staticmethod
+    def _collect_record(row: Dict[str, Any], date_str: Optional[str], records: List[Dict[str, Any]], seen: set) -> None:
+        """
+        Satırı kayıt olarak ekler (data-id, yoksa metin üzerinden tekilleştirilir).
+        
+        Args:
+            row: Taşıma katmanından gelen satır
+            date_str: Satırın ait olduğu tarih (bilinmiyorsa None)
+            records: Kayıt listesi
+            seen: Görülen anahtarlar
+        """
+        text = row.get("text") or ""
+        if not text:
+            return
+        key = row.get("id") or text
+        if key in seen:
+            return
+        seen.add(key)
+        records.append({"id": row.get("id"), "text": text, "meta": row.get("meta"), "date": date_str})
+
+    def get_messages_by_date_range(self, start_date: str, end_date: str,
+                                   max_scrolls: int = 300) -> Dict[str, List[str]]:
+        """
+        Bir tarih aralığındaki mesajları tek bir yukarı kaydırma geçişinde toplar.
+        
+        Args:
+            start_date: Başlangıç tarihi (gg.aa.yyyy)
+            end_date: Bitiş tarihi (gg.aa.yyyy)
+            max_scrolls: Maksimum kaydırma sayısı
+            
+        Returns:
+            Dict[str, List[str]]: Tarih (gg.aa.yyyy) → mesajlar
+        """
+        buckets = {}
+        for key, records in self.get_message_records_by_date_range(start_date, end_date, max_scrolls).items():
+            texts = []
+            for record in records:
+                if record["text"] not in texts:
+                    texts.append(record["text"])
+            buckets[key] = texts
+        return buckets
+
+    def get_message_records_by_date_range(self, start_date: str, end_date: str, max_scrolls: int = 300,
+                                          cursor: Optional[Tuple[str, str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bir tarih aralığındaki mesaj kayıtlarını tek bir yukarı kaydırma geçişinde toplar.
+        Sohbet en yeniden en eskiye taranır, başlangıç tarihinden eski bir ayraç
+        yüklendiğinde kaydırma durur ve mesajlar ayraçlara göre gruplanır.
+        Gün adları ("Pazar", "Salı" ...) ve BUGÜN/DÜN mutlak tarihe çevrilir.
+        İmleç verilirse o mesaj yüklendiği anda kaydırma durur; imleçten sonraki
+        ayraçsız mesajlar imlecin gününe yazılır. İmlece, başlangıçtan eski ayraca
+        veya sohbet başına ulaşılırsa last_scan_complete True olur.
+        
+        Args:
+            start_date: Başlangıç tarihi (gg.aa.yyyy)
+            end_date: Bitiş tarihi (gg.aa.yyyy)
+            max_scrolls: Maksimum kaydırma sayısı
+            cursor: Önceki taramada görülen son mesajın (data-id, gg.aa.yyyy) çifti
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Tarih (gg.aa.yyyy) → kayıtlar
+            
+        Raises:
+            SessionError: Mesaj paneli bulunamazsa veya tarayıcı yanıt vermezse
+        """
+        scan_start = time.perf_counter()
+        start = parse_date(start_date)
+        end = parse_date(end_date)
+        today = datetime.now().date()
+        buckets = {format_date(day): [] for day in date_range(start, end)}
+        
+        self.logger.info("Tarih aralığı taranıyor: %s → %s", start_date, end_date)
+        
+        if not self._focus_message_panel():
+            raise SessionError(STALE, "Focus verilemedi, scroll yapılamıyor")
+        
+        # 1) Başlangıç tarihinden eski bir ayraç görünene kadar kaydır
+        rows = []
+        previous_count = -1
+        stalled = 0
+        self.last_scan_complete = False
+        for scroll_attempt in range(max_scrolls):
+            if self._budget_exhausted("scroll"):
+                break
+            with self.metrics.timer("listener_scroll_step_seconds", mode="range", transport=self.transport.name):
+                self.transport.page_up()
             try:
-                message_elements = self.driver.find_elements(By.CSS_SELECTOR, '.selectable-text')
-                for element in message_elements[-20:]:  # Son 20 mesaj
-                    try:
-                        text = element.text.strip()
-                        if text and text not in seen:
-                            seen.add(text)
-                            messages.append(text)
-                    except:
-                        continue
+                rows = self.transport.extract_rows()
             except Exception as e:
-                self.logger.error(f"Son mesaj alma hatası: {e}")
+                if is_session_error(e):
+                    raise
+                self.logger.warning("Scroll sırasında hata: %s", e)
+                continue
+            
+            # Önceki taramanın son mesajı yüklendiyse daha eskisi zaten işlenmiştir
+            if cursor and any(row.get("id") == cursor[0] for row in rows):
+                self.metrics.inc("listener_cursor_hits_total")
+                self.last_scan_complete = True
+                break
+            
+            oldest = None
+            for row in rows:
+                if DATE_SEPARATOR_RE.match(row["raw"]):
+                    label_date = resolve_date_label(row["raw"], today)
+                    if label_date and (oldest is None or label_date < oldest):
+                        oldest = label_date
+            if oldest and oldest < start:
+                self.logger.info("🛑 Başlangıçtan eski ayraç görüldü (%s), kaydırma bitti", format_date(oldest))
+                self.last_scan_complete = True
+                break
+            
+            # Yeni satır yüklenmiyorsa sohbetin başına gelinmiştir
+            if len(rows) == previous_count:
+                stalled += 1
+                if stalled >= 5:
+                    self.logger.info("Sohbet başına ulaşıldı")
+                    self.last_scan_complete = True
+                    break
+            else:
+                stalled = 0
+            previous_count = len(rows)
+        
+        # 2) Son okunan satırları ayraçlara göre grupla
+        extract_start = time.perf_counter()
+        seen = {key: set() for key in buckets}
+        current_key = None
+        for row in rows:
+            raw_text = row["raw"]
+            if not raw_text:
+                continue
+            
+            if DATE_SEPARATOR_RE.match(raw_text):
+                label_date = resolve_date_label(raw_text, today)
+                current_key = format_date(label_date) if label_date else None
+                continue
+            if cursor and row.get("id") == cursor[0]:
+                current_key = cursor[1]
+            
+            if current_key in buckets:
+                self._collect_record(row, current_key, buckets[current_key], seen[current_key])
+        self.metrics.observe(
+            "listener_extract_seconds", time.perf_counter() - extract_start,
+            mode="range", transport=self.transport.name
+        )
         
-        self.logger.info(f"📊 {target_date} için toplanan mesaj sayısı: {len(messages)}")
-        return messages
+        for key, records in buckets.items():
+            self.logger.info("📊 %s için toplanan mesaj sayısı: %s", key, len(records))
+            self.metrics.inc("listener_messages_total", len(records), mode="range")
+        self.metrics.observe("listener_scan_seconds", time.perf_counter() - scan_start, mode="range")
+        return buckets
 
     def _find_chat_panel(self, driver, timeout=10):
         """
@@ -295,9 +672,6 @@ class WhatsAppListener:
         Returns:
             WebElement or None: Chat panel element
         """
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
         # Daha kapsamlı selector listesi
         selectors = [
             "div[data-testid='conversation-panel-messages'][role='region']",
@@ -308,18 +682,12 @@ class WhatsAppListener:
             "div[role='region']"
         ]
         
-        for selector in selectors:
-            try:
-                panel = WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                self.logger.info(f"✅ Chat messages panel bulundu ({selector})")
-                return panel
-            except Exception as e:
-                self.logger.debug(f"Selector başarısız: {selector} - {e}")
-                continue
+        found = self._wait_for_any(selectors, timeout)
+        if found:
+            self.logger.info("✅ Chat messages panel bulundu (%s)", found[0])
+            return found[1]
         
-        self.logger.error(f"❌ Chat messages panel bulunamadı (timeout={timeout})")
+        self.logger.error("❌ Chat messages panel bulunamadı (timeout=%s)", timeout)
         return None
 
     def _scroll_up_fast(self, driver, panel, step: int = 2000) -> bool:
@@ -336,11 +704,11 @@ class WhatsAppListener:
         """
         try:
             driver.execute_script("arguments[0].scrollTop -= 2000;", panel)
-            self.logger.debug(f"⬆️ Hızlı yukarı kaydırıldı (step: {step})")
+            self.logger.debug("⬆️ Hızlı yukarı kaydırıldı (step: %s)", step)
             time.sleep(0.2)  # Small delay after scroll
             return True
         except Exception as e:
-            self.logger.warning(f"Hızlı yukarı kaydırma başarısız: {e}")
+            self.logger.warning("Hızlı yukarı kaydırma başarısız: %s", e)
             return False
 
     def _scroll_down_fast(self, driver, panel, step: int = 2000) -> bool:
@@ -357,11 +725,11 @@ class WhatsAppListener:
         """
         try:
             driver.execute_script("arguments[0].scrollTop += 2000;", panel)
-            self.logger.debug(f"⬇️ Hızlı aşağı kaydırıldı (step: {step})")
+            self.logger.debug("⬇️ Hızlı aşağı kaydırıldı (step: %s)", step)
             time.sleep(0.2)  # Small delay after scroll
             return True
         except Exception as e:
-            self.logger.warning(f"Hızlı aşağı kaydırma başarısız: {e}")
+            self.logger.warning("Hızlı aşağı kaydırma başarısız: %s", e)
             return False
 
     def _wait_for_lazy_load(self, panel, previous_count: int, timeout: int = 3) -> bool:
@@ -378,6 +746,7 @@ class WhatsAppListener:
         """
         import time
         
+        timeout = self._budget(timeout)
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
@@ -386,14 +755,16 @@ class WhatsAppListener:
                 current_count = len(dom_messages)
                 
                 if current_count > previous_count:
-                    self.logger.debug(f"Lazy load detected: {current_count} messages (was {previous_count})")
+                    self.logger.debug("Lazy load detected: %s messages (was %s)", current_count, previous_count)
+                    self.metrics.observe("listener_lazy_load_wait_seconds", time.time() - start_time, outcome="loaded")
                     return True
                     
                 time.sleep(0.2)
             except Exception as e:
-                self.logger.warning(f"Lazy load detection hatası: {e}")
+                self.logger.warning("Lazy load detection hatası: %s", e)
                 break
         
+        self.metrics.observe("listener_lazy_load_wait_seconds", time.time() - start_time, outcome="timeout")
         return False
 
     def _extract_messages_from_dom(self):
@@ -420,10 +791,10 @@ class WhatsAppListener:
                     self.logger.warning("Stale element hatası - mesaj atlanıyor")
                     continue
                 except Exception as e:
-                    self.logger.warning(f"Mesaj çıkarma hatası: {e}")
+                    self.logger.warning("Mesaj çıkarma hatası: %s", e)
                     continue
         except Exception as e:
-            self.logger.warning(f"DOM'dan mesaj çıkarma hatası: {e}")
+            self.logger.warning("DOM'dan mesaj çıkarma hatası: %s", e)
         return messages
 
     def _is_date_separator(self, text: str, date_pattern) -> bool:
@@ -546,23 +917,18 @@ class WhatsAppListener:
         Mesaj panelini bulur ve fokuslar.
         Test scriptindeki tam aynı yaklaşımı kullanır.
         """
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
         selectors = [
             "div[data-testid='conversation-panel-messages']",
             "div.copyable-area",
         ]
-        for sel in selectors:
+        found = self._wait_for_any(selectors, timeout)
+        if found:
             try:
-                panel = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, sel))
-                )
-                panel.click()
-                self.logger.info(f"✅ Mesaj paneline fokus verildi ({sel})")
+                found[1].click()
+                self.logger.info("✅ Mesaj paneline fokus verildi (%s)", found[0])
                 return True
-            except:
-                continue
+            except Exception as e:
+                self.logger.debug("Mesaj paneli tıklanamadı: %s", e)
         self.logger.error("❌ Mesaj paneli bulunamadı")
         return False
 
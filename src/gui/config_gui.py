@@ -9,8 +9,14 @@ from tkinter import filedialog, messagebox
 import json
 import os
 import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from utils.pidfile import PidFile
 
 CONFIG_PATH = os.path.join("config", "config.json")
+PID_PATH = os.path.join("config", "bot.pid")
 
 class ConfigGUI:
     def __init__(self, root):
@@ -70,27 +76,38 @@ class ConfigGUI:
                 self.fields["target_date"].set(data.get("target_date", ""))
 
     def save_config(self):
-        data = {k: v.get() if not isinstance(v, tk.BooleanVar) else v.get() for k, v in self.fields.items()}
+        # Formda olmayan ayarlar (gruplar, önbellek, metrikler ...) korunur
+        data = {}
+        if os.path.exists(CONFIG_PATH):
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        data.update({k: v.get() for k, v in self.fields.items()})
         # parent_page_id normalize et
         if "?" in data["parent_page_id"]:
             data["parent_page_id"] = data["parent_page_id"].split("?")[0]
 
-        # Varsayılan config ekleri
-        data.update({
-            "silent_mode": False,
-            "whatsapp": {"scan_interval": 5},
-            "selenium": {"implicit_wait": 10, "window_size": [1200, 800]}
-        })
+        # Varsayılan config ekleri (sadece eksikse)
+        data.setdefault("silent_mode", False)
+        data.setdefault("whatsapp", {"scan_interval": 5})
+        data.setdefault("selenium", {"implicit_wait": 10, "window_size": [1200, 800]})
 
+        # Çalışan bot dosyayı izlediği için yarım yazılmış dosya görmemeli: önce geçici dosyaya yaz
         os.makedirs("config", exist_ok=True)
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
+        temp_path = CONFIG_PATH + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, CONFIG_PATH)
 
         messagebox.showinfo("Kaydedildi", "Ayarlar başarıyla kaydedildi.")
 
     def save_and_start(self):
         self.save_config()
-        subprocess.Popen(["python", "src/main.py"])
+        # Bot zaten çalışıyorsa yeni değerler çalışan bot'a otomatik uygulanır
+        pid = PidFile(PID_PATH).running_pid()
+        if pid:
+            messagebox.showinfo("Bot çalışıyor", f"Bot zaten çalışıyor (pid {pid}); ayarlar otomatik uygulanacak.")
+            return
+        subprocess.Popen([sys.executable, "src/main.py"])
 
 if __name__ == "__main__":
     root = tk.Tk()
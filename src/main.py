@@ -4,77 +4,337 @@ Ana uygulama dosyası
 WhatsApp-Notion bot'unun ana giriş noktası.
 """
 
+import argparse
 import time
 import sys
-from datetime import datetime
+from datetime import timedelta
 from utils.config_loader import ConfigLoader
-from utils.logger import get_logger
+from utils.config_watcher import BROWSER_KEYS, HOT_KEYS, ConfigWatcher
+from utils.logger import flush_suppressed, setup_logger
+from utils.metrics import MetricsServer, MetricsSnapshotWriter, get_metrics
+from utils.message_archive import MessageArchive
+from utils.notion_cache import CacheRevalidator, NotionMetadataCache
+from utils.pidfile import PidFile
+from utils.deadline import Deadline
+from utils.profiler import ScanProfiler
+from utils.recording import SessionRecorder
 from core.message_parser import MessageParser
 from core.notion_client import NotionClient
 from core.whatsapp_listener import WhatsAppListener
 from core.updater import Updater
+from core.scheduler import ScanScheduler
+from core.day_tracker import DayTracker
+from core.day_mirror import DayMirror
+from core.group_monitor import GroupMonitor
+from core.group_rotation import GroupRotation
+from core.recovery import BROWSER_ERRORS, SessionRecovery
+
+PID_PATH = "config/bot.pid"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="WhatsApp → Notion bot")
+    parser.add_argument(
+        "--profile", type=int, nargs="?", const=3, default=None, metavar="N",
+        help="N tarama döngüsünün profilini logs/ altına yazıp çık (varsayılan 3)"
+    )
+    parser.add_argument(
+        "--record", nargs="?", const="", default=None, metavar="PATH",
+        help="Okunan mesajları ve Notion yanıtlarını src/replay.py ile oynatmak için kaydet"
+    )
+    return parser.parse_args()
 
 
 def main():
-    # Config ve logger yükle
-    config = ConfigLoader()
-    logger = get_logger()
+    args = parse_args()
+    overrides = {}
+    if args.record is not None:
+        overrides["recording"] = {"enabled": True}
+        if args.record:
+            overrides["recording"]["path"] = args.record
+    # Aynı bot ikinci kez başlatılmaz (ayar değişiklikleri çalışan bot'a otomatik uygulanır)
+    pidfile = PidFile(PID_PATH)
+    if not pidfile.acquire():
+        print(f"Bot zaten çalışıyor (pid {pidfile.running_pid()}); ayar değişiklikleri otomatik uygulanır.")
+        sys.exit(1)
+    try:
+        run(ConfigLoader(overrides=overrides), profile=args.profile)
+    finally:
+        pidfile.release()
 
-    notion_client = NotionClient(config.get_notion_token(), config.get_parent_page_id())
-    parser = MessageParser()
-    updater = Updater(notion_client, parser, logger)
+
+def run(config, profile=None, rate_limiter=None):
+    """
+    Bot'u verilen konfigürasyonla çalıştırır (tek süreç veya supervisor worker'ı).
+    
+    Args:
+        config: ConfigLoader instance
+        profile: Verilirse bu kadar döngünün profili yazılıp çıkılır
+        rate_limiter: Notion istekleri için paylaşılan hız sınırlayıcı (opsiyonel)
+    """
+    # Logger yükle
+    logging_config = config.get_logging_config()
+    logger = setup_logger(
+        level=logging_config["level"],
+        async_mode=logging_config["async"],
+        json_format=logging_config["json"],
+        dedup_window=logging_config["dedup_window"],
+        dedup_summary_interval=logging_config["dedup_summary_interval"],
+        log_dir=logging_config["log_dir"]
+    )
+    metrics = get_metrics()
+    
+    # Metrik endpoint'i ve JSON snapshot
+    metrics_config = config.get_metrics_config()
+    snapshot_writer = None
+    if metrics_config["enabled"]:
+        server = MetricsServer(metrics, metrics_config["host"], metrics_config["port"])
+        server.start()
+        snapshot_writer = MetricsSnapshotWriter(
+            metrics, metrics_config["snapshot_path"], metrics_config["snapshot_interval"]
+        )
+        snapshot_writer.start()
+        logger.info("📈 Metrikler: http://%s:%s/metrics", metrics_config['host'], server.port)
+
+    parser = MessageParser(config.get_status_rules())
     listener = WhatsAppListener(config, logger)
+    whatsapp_config = config.get_whatsapp_config()
+
+    # Kayıt modu: okunan mesajlar ve Notion yanıtları replay için dosyaya yazılır
+    recording_config = config.get_recording_config()
+    recorder = SessionRecorder(recording_config["path"]) if recording_config["enabled"] else None
+    if recorder:
+        logger.info("⏺️ Oturum kaydediliyor: %s", recorder.path)
 
-    # Target date belirle
-    target_date = config.get("target_date")
-    if not target_date:
-        target_date = datetime.now().strftime("%d.%m.%Y")
+    # Kalıcı Notion önbelleği: tarih → database, şemalar ve satırlar diskten yüklenir, arka planda doğrulanır
+    cache_config = config.get_cache_config()
+    notion_cache = NotionMetadataCache(cache_config["path"]) if cache_config["enabled"] else None
+
+    # Yerel mesaj arşivi: okunan tüm mesajlar FTS5 indeksiyle saklanır (src/archive_cli.py ile aranır)
+    archive_config = config.get_archive_config()
+    archive = MessageArchive(archive_config["path"]) if archive_config["enabled"] else None
+
+    # Her grup kendi Notion ana sayfasına yazar; sabit hedef tarih verilmemişse gün değişimi takip edilir
+    fixed_date = config.get("target_date") or None
+    lookup_config = config.get_lookup_config()
+    
+    def make_monitor(group):
+        notion_client = NotionClient(
+            config.get_notion_token(), group["parent_page_id"],
+            rate_limiter=rate_limiter, base_url=config.get_notion_base_url(),
+            recorder=recorder, cache=notion_cache
+        )
+        tracker = DayTracker(
+            notion_client, logger,
+            fixed_date=fixed_date,
+            late_report_hours=whatsapp_config.get("late_report_hours", 6)
+        )
+        updater = Updater(
+            notion_client, parser, logger, recorder=recorder,
+            candidate_days=lookup_config["candidate_days"],
+            # cProfile sadece açan thread'i ölçer: profil modunda aramalar ana thread'de yapılır
+            parallel_lookup=lookup_config["parallel"] and not profile,
+            max_workers=lookup_config["max_workers"]
+        )
+        # Arşiv modu: günün tüm mesajları tarih sayfasına 100'lük bloklar halinde eklenir
+        mirror = None
+        if archive and archive_config["mirror_to_notion"]:
+            mirror = DayMirror(notion_client, archive, logger, group["name"],
+                               max_batches=archive_config["mirror_max_batches"])
+        return GroupMonitor(
+            group["name"], notion_client, updater, tracker, logger, archive=archive, mirror=mirror
+        )
+    
+    monitors = {group["name"]: make_monitor(group) for group in config.get_groups()}
+    rotation = GroupRotation(monitors, logger, whatsapp_config["group_revisit_interval"])
+    revalidator = None
+    if notion_cache:
+        revalidator = CacheRevalidator(
+            [monitor.notion_client for monitor in monitors.values()], logger, cache_config["revalidate_interval"]
+        )
+        revalidator.start()
+    first_group = next(iter(monitors))
     
     # Başlangıç bilgilerini yazdır
     logger.info("=== WhatsApp → Notion Bot Başladı ===")
-    logger.info(f"WhatsApp Grup: {config.get_whatsapp_group()}")
-    logger.info(f"Headless: {config.get_headless()}")
-    logger.info(f"Session Path: {config.get_session_path()}")
-    logger.info(f"Hedef Tarih: {target_date}")
-
-    # Login
-    logger.info("WhatsApp'a giriş yapılıyor...")
-    if not listener.login_to_whatsapp():
-        logger.error("WhatsApp'a giriş yapılamadı.")
-        sys.exit(1)
-    logger.info("✅ WhatsApp'a giriş başarılı")
-
-    # Grup aç
-    logger.info(f"Grup açılıyor: {config.get_whatsapp_group()}")
-    if not listener.open_group(config.get_whatsapp_group()):
-        logger.warning("Grup açılamadı, tekrar dene!")
-        # Basit retry
-        for i in range(3):
-            time.sleep(5)
-            if listener.open_group(config.get_whatsapp_group()):
-                break
-        else:
-            logger.error("Grup açılamadı, çıkılıyor.")
-            sys.exit(1)
-    logger.info("✅ Grup başarıyla açıldı")
-
-    # Hedef tarih için database bul
-    db_id = notion_client.get_database_by_date(target_date)
-    if not db_id:
-        logger.error(f"Hedef tarih için database bulunamadı: {target_date}")
+    logger.info("WhatsApp Grup: %s", ", ".join(monitors))
+    logger.info("Headless: %s", config.get_headless())
+    logger.info("Session Path: %s", config.get_session_path())
+    logger.info("Hedef Tarih: %s", fixed_date or 'bugün (gün değişimi izleniyor)')
+
+    # Login ve grup açma; başarısız olursa kurtarma adımları (yeniden yükleme, tarayıcıyı yeniden başlatma) denenir
+    recovery = SessionRecovery(listener, logger, default_group=first_group)
+    logger.info("WhatsApp'a giriş yapılıyor, grup açılıyor: %s", first_group)
+    if not recovery.ensure_session(first_group):
+        logger.error("WhatsApp oturumu hazırlanamadı, çıkılıyor.")
+        listener.close()
         sys.exit(1)
+    logger.info("✅ WhatsApp'a giriş başarılı, grup açıldı")
+
+    # Sabit hedef tarih için database bul
+    if fixed_date:
+        for monitor in monitors.values():
+            if not monitor.notion_client.get_database_by_date(fixed_date):
+                logger.error("Hedef tarih için database bulunamadı: %s (%s)", fixed_date, monitor.name)
+                sys.exit(1)
+    
+    # Konfigürasyon dosyası izlenir; değişiklikler döngüler arasında uygulanır
+    watcher = ConfigWatcher(config, logger)
+    
+    def apply_config(changed):
+        nonlocal whatsapp_config, scheduler, fixed_date
+        if "status_rules" in changed:
+            parser.set_status_rules(config.get_status_rules())
+            logger.info("⚙️ Durum kuralları güncellendi: %s", ", ".join(config.get_status_rules() or {}) or "varsayılan")
+        
+        groups_changed = bool(changed & {"groups", "whatsapp_group", "parent_page_id"})
+        if groups_changed:
+            # Değişmeyen grupların izleyicileri (görülen mesajlar, önbellekler) korunur
+            groups = {group["name"]: group for group in config.get_groups()}
+            kept = {
+                name: monitor for name, monitor in monitors.items()
+                if name in groups and groups[name]["parent_page_id"] == monitor.notion_client.parent_page_id
+            }
+            # Yeni izleyiciler önce kurulur; hata olursa eski grup seti aynen kalır
+            rebuilt = {name: kept.get(name) or make_monitor(group) for name, group in groups.items()}
+            monitors.clear()
+            monitors.update(rebuilt)
+            rotation.group_names = list(monitors)
+            recovery.default_group = next(iter(monitors))
+            if revalidator:
+                revalidator.clients = [monitor.notion_client for monitor in monitors.values()]
+            logger.info("⚙️ İzlenen gruplar: %s", ", ".join(monitors))
+        
+        if "whatsapp" in changed:
+            whatsapp_config = config.get_whatsapp_config()
+            scheduler = ScanScheduler(whatsapp_config, logger)
+            rotation.revisit_interval = whatsapp_config["group_revisit_interval"]
+            for monitor in monitors.values():
+                monitor.tracker.late_report_window = timedelta(hours=whatsapp_config["late_report_hours"])
+        
+        if "target_date" in changed or groups_changed:
+            fixed_date = config.get("target_date") or None
+            for monitor in monitors.values():
+                monitor.tracker.fixed_date = fixed_date
+                if fixed_date and not monitor.notion_client.get_database_by_date(fixed_date):
+                    logger.error("Hedef tarih için database bulunamadı: %s (%s)", fixed_date, monitor.name)
+            if "target_date" in changed:
+                logger.info("⚙️ Hedef tarih: %s", fixed_date or 'bugün (gün değişimi izleniyor)')
+        
+        browser_changed = changed & BROWSER_KEYS
+        if browser_changed:
+            # Chrome kapatılıp yeni profil/headless ayarıyla açılır; süreç ve Notion durumu korunur
+            logger.warning("🔁 Tarayıcı ayarları değişti (%s), tarayıcı yeniden başlatılıyor", ", ".join(sorted(browser_changed)))
+            try:
+                listener.restart_browser(quit_browser=True)
+            except Exception as e:
+                logger.error("Tarayıcı yeniden başlatılamadı: %s", e)
+            if not recovery.ensure_session(recovery.default_group):
+                logger.error("WhatsApp oturumu yeniden hazırlanamadı, sonraki döngüde kurtarma denenecek")
+        
+        pending = changed - HOT_KEYS - BROWSER_KEYS
+        if pending:
+            logger.warning("⚙️ Bu ayarlar bot yeniden başlatılınca uygulanacak: %s", ", ".join(sorted(pending)))
     
     # Döngü
+    scheduler = ScanScheduler(whatsapp_config, logger)
+    profiler = ScanProfiler("main") if profile else None
+    unexpected_errors = 0
+    pending_changes = set()
+    if profiler:
+        logger.info("🔬 Profil modu: %s döngü (Notion aramaları sıralı)", profile)
     try:
         while True:
-            messages = listener.get_messages_by_date(target_date)
-            for msg in messages:
-                updater.process_text(msg, db_id)
-            time.sleep(config.get_whatsapp_config().get("scan_interval", 5))
+            if profiler:
+                profiler.enable()
+            cycle_start = time.perf_counter()
+            # Bundan sonra gelen mesajlar (tarama sırasında gelenler de) sonraki beklemeyi erken bitirir
+            listener.new_rows.clear()
+            
+            # Döngüdeki tüm beklemeler ortak bir zaman bütçesinden düşer
+            deadline = Deadline(whatsapp_config["cycle_budget"])
+            listener.deadline = deadline
+            
+            # Birden fazla grup varsa sadece rozeti olan (veya uzun süredir bakılmayan) sohbetlere geçilir
+            new_count = 0
+            try:
+                unread_counts = listener.get_unread_counts() if len(monitors) > 1 else {}
+                for group_name in rotation.plan(unread_counts, listener.current_group):
+                    if deadline.expired:
+                        # Kalan gruplar rozetleri durduğu için sonraki döngüde taranır
+                        logger.warning("⏱️ Döngü bütçesi bitti, kalan gruplar sonraki döngüye kaldı")
+                        break
+                    if listener.current_group != group_name:
+                        if not listener.open_group(group_name):
+                            logger.warning("Grup açılamadı, atlanıyor: %s", group_name)
+                            continue
+                        metrics.inc("group_switches_total")
+                    new_count += monitors[group_name].scan(listener)
+                    rotation.mark_scanned(group_name)
+                listener.check_memory()
+                unexpected_errors = 0
+            except Exception as e:
+                # Kurtarma adımları (sayfa yenileme, tarayıcı başlatma) bütçeye tabi değildir
+                listener.deadline = None
+                # Tarama durumu (görülen mesajlar, önbellekler) korunur, sadece oturum düzeltilir.
+                # Tarayıcı dışı hatalarda her 3 tekrarda bir kurtarma denenir, arada artan beklemeyle devam edilir.
+                unexpected_errors = 0 if isinstance(e, BROWSER_ERRORS) else unexpected_errors + 1
+                if unexpected_errors:
+                    logger.exception("Tarama döngüsünde hata: %s", e)
+                if unexpected_errors % 3 == 0:
+                    if not recovery.recover(e):
+                        time.sleep(recovery.backoff())
+                else:
+                    time.sleep(recovery.backoff(unexpected_errors))
+            
+            listener.deadline = None
+            
+            overrun = deadline.overrun()
+            if overrun > 0:
+                metrics.inc("scan_budget_overruns_total")
+                metrics.observe("scan_budget_overrun_seconds", overrun)
+                logger.warning("⏱️ Döngü bütçesi %.1fs aşıldı (bütçe %ss)", overrun, deadline.budget)
+            metrics.observe("scan_cycle_seconds", time.perf_counter() - cycle_start)
+            metrics.inc("scan_cycles_total")
+            
+            # Profil modunda bekleme profile dahil edilmez
+            if profiler:
+                profiler.disable()
+                if profiler.cycles >= profile:
+                    profiler.write_report(logger)
+                    break
+            
+            interval = scheduler.next_interval(new_count)
+            metrics.set_gauge("scan_interval_seconds", interval)
+            flush_suppressed()
+            
+            # CDP taşımasında sohbete yeni mesaj gelince bekleme erken biter.
+            # Bekleme sırasında konfigürasyon değişirse tarayıcı kapatılmadan uygulanır.
+            # Uygulanamayan değişiklikler (Notion/tarayıcı hatası) botu durdurmaz, sonraki döngüde tekrar denenir.
+            changed = watcher.wait(interval, wake=listener.new_rows) | pending_changes
+            if changed:
+                try:
+                    apply_config(changed)
+                    pending_changes = set()
+                except Exception as e:
+                    pending_changes = changed
+                    logger.exception("Konfigürasyon değişikliği uygulanamadı, sonraki döngüde tekrar denenecek: %s", e)
+                    if isinstance(e, BROWSER_ERRORS) and not recovery.recover(e):
+                        time.sleep(recovery.backoff())
     except KeyboardInterrupt:
-        logger.info("Bot kapatılıyor...")
-        listener.driver.quit()
-        sys.exit(0)
+        pass
+    
+    logger.info("Bot kapatılıyor...")
+    if snapshot_writer:
+        snapshot_writer.stop()
+    if recorder:
+        recorder.close()
+    if revalidator:
+        revalidator.stop()
+    if archive:
+        archive.close()
+    listener.close()
+    sys.exit(0)
 
 
 if __name__ == "__main__":
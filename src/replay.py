@@ -0,0 +1,157 @@
+"""
+Replay
+
+`main.py --record` ile kaydedilmiş bir oturumu WhatsApp ve Notion'a bağlanmadan
+MessageParser → Updater → NotionClient hattından tekrar geçirir. Notion yanıtları
+kayıttan verilir; sonuçlar, yazmalar ve süreler kayıtla karşılaştırılır.
+
+Kullanım:
+    python src/replay.py logs/session_20250927_140200.jsonl.gz [--speed max|realtime|2] [--report rapor.json]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from utils.recording import ReplayNotionAPI, load_recording
+from core.message_parser import MessageParser
+from core.notion_client import NotionClient
+from core.updater import Updater
+
+
+def parse_speed(value: str) -> Optional[float]:
+    """
+    Oynatma hızını çözer.
+
+    Args:
+        value: "max" (beklemesiz), "realtime" (1x) veya çarpan (örn. "4")
+
+    Returns:
+        Optional[float]: Hız çarpanı; max için None
+    """
+    if value == "max":
+        return None
+    if value == "realtime":
+        return 1.0
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("Hız pozitif olmalı")
+    return speed
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))]
+
+
+def _quiet_logger() -> logging.Logger:
+    # Oynatmada her mesajın logu ölçümü kirletmesin
+    for name in ("replay", "WhatsAppNotionBot"):
+        logger = logging.getLogger(name)
+        logger.handlers = [logging.NullHandler()]
+        logger.propagate = False
+    return logger
+
+
+def replay(path: str, speed: Optional[float] = None, include_rate_limits: bool = False,
+           logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    """
+    Kaydı oynatır ve raporu döndürür.
+
+    Args:
+        path: Kayıt dosyası
+        speed: Hız çarpanı (None: beklemeden, 1.0: kayıttaki aralıklarla)
+        include_rate_limits: Kayıttaki 429 yanıtları da oynatılsın mı
+        logger: Updater logger'ı (varsayılan sessiz)
+
+    Returns:
+        Dict[str, Any]: messages, seconds, throughput, p50/p99, sonuç eşleşmeleri,
+            Notion çağrıları, kayıtta karşılığı olmayan çağrılar ve yazma farkı
+    """
+    messages, calls = load_recording(path)
+    api = ReplayNotionAPI(calls, include_rate_limits=include_rate_limits)
+    logger = logger or _quiet_logger()
+    parser = MessageParser()
+
+    # Her grup (ana sayfa) kendi istemcisiyle, kayıttaki gibi
+    updaters: Dict[Optional[str], Updater] = {}
+    for message in messages:
+        page = message.get("page")
+        if page not in updaters:
+            client = NotionClient("secret_replay", page or "", client=api)
+            updaters[page] = Updater(client, parser, logger)
+
+    outcomes = Counter()
+    mismatches = []
+    latencies = []
+    first_t = messages[0]["t"] if messages else 0.0
+    start = time.perf_counter()
+    for message in messages:
+        if speed:
+            wait = (message["t"] - first_t) / speed - (time.perf_counter() - start)
+            if wait > 0:
+                time.sleep(wait)
+        message_start = time.perf_counter()
+        outcome = updaters[message.get("page")].process_text(
+            message["text"], message.get("database_id"), message_id=message.get("id"),
+            fallback=message.get("fallback", False)
+        )
+        latencies.append(time.perf_counter() - message_start)
+        outcomes[outcome] += 1
+        if outcome != message.get("outcome"):
+            mismatches.append({"id": message.get("id"), "text": message["text"],
+                               "recorded": message.get("outcome"), "replayed": outcome})
+    elapsed = time.perf_counter() - start
+
+    return {
+        "recording": path,
+        "messages": len(messages),
+        "speed": speed or "max",
+        "seconds": round(elapsed, 4),
+        "throughput_msg_s": round(len(messages) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(statistics.median(latencies) * 1000, 3) if latencies else 0.0,
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "outcomes": dict(outcomes),
+        "outcome_matches": len(messages) - len(mismatches),
+        "outcome_mismatches": mismatches,
+        "notion_calls": api.calls,
+        "recorded_notion_calls": len(calls),
+        "unmatched_calls": api.misses,
+        "writes": api.write_diff(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaydedilmiş oturumu Notion'a bağlanmadan oynat")
+    parser.add_argument("recording", help="main.py --record ile yazılan .jsonl.gz dosyası")
+    parser.add_argument("--speed", type=parse_speed, default=None,
+                        help="max (varsayılan), realtime veya hız çarpanı (örn. 4)")
+    parser.add_argument("--with-429", action="store_true", help="Kayıttaki 429 yanıtlarını da oynat")
+    parser.add_argument("--report", help="Raporun yazılacağı JSON yolu")
+    args = parser.parse_args()
+
+    report = replay(args.recording, speed=args.speed, include_rate_limits=args.with_429)
+    print(f"{report['messages']} mesaj  {report['throughput_msg_s']} msg/s  "
+          f"p50={report['p50_ms']:.1f}ms  p99={report['p99_ms']:.1f}ms")
+    print(f"Sonuç eşleşmesi: {report['outcome_matches']}/{report['messages']}  "
+          f"Notion çağrısı: {report['notion_calls']} (kayıtta {report['recorded_notion_calls']}, "
+          f"karşılıksız {report['unmatched_calls']})  Yazmalar: {report['writes']}")
+    for mismatch in report["outcome_mismatches"][:20]:
+        print(f"  ≠ {mismatch['recorded']} → {mismatch['replayed']}: {mismatch['text']}")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Rapor yazıldı: {args.report}")
+    sys.exit(0 if not report["outcome_mismatches"] and not report["writes"]["missing"] else 1)
+
+
+if __name__ == "__main__":
+    main()
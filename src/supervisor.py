@@ -0,0 +1,246 @@
+"""
+Supervisor
+
+Birden fazla bot worker sürecini (her biri kendi Chrome profili ve grup seti ile)
+başlatan, Notion hız sınırını aralarında paylaştıran ve çöken worker'ları
+yeniden başlatan giriş noktası.
+
+Kullanım:
+    python src/supervisor.py
+
+Worker'lar config.json içindeki `supervisor.workers` listesinden okunur; her
+eleman ana konfigürasyonun üzerine yazılacak ayarlardır (session_path, groups ...).
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.config_loader import ConfigLoader
+from utils.logger import setup_logger
+from utils.rate_limiter import RateLimiter, connect_rate_limiter, serve_rate_limiter
+
+CONFIG_PATH = "config/config.json"
+
+
+def build_worker_overrides(config: ConfigLoader, index: int, worker: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker'ın konfigürasyon override'larını hazırlar. Süreçler arasında çakışan
+    kaynaklar (Chrome profili, debug portu, metrik portu, log klasörü, oturum kaydı)
+    verilmemişse worker adına / numarasına göre ayrıştırılır.
+
+    Args:
+        config: Ana ConfigLoader
+        index: Worker numarası (0'dan başlar)
+        worker: supervisor.workers elemanı
+
+    Returns:
+        Dict[str, Any]: ConfigLoader(overrides=...) için ayarlar
+    """
+    overrides = {key: value for key, value in worker.items() if key != "name"}
+    name = worker.get("name") or f"worker-{index + 1}"
+    log_dir = os.path.join(config.get_logging_config()["log_dir"], name)
+
+    # İki Chrome aynı profil klasörünü açamaz: profili verilmeyen worker'a kendi klasörü açılır
+    base_session = os.path.normpath(config.get("session_path") or "whatsapp_session")
+    overrides.setdefault("session_path", f"{base_session}_{name}")
+
+    browser = dict(overrides.get("browser", {}))
+    debug_port = config.get_browser_config()["remote_debugging_port"]
+    if debug_port and "remote_debugging_port" not in browser:
+        browser["remote_debugging_port"] = int(debug_port) + index
+    overrides["browser"] = browser
+
+    metrics = dict(overrides.get("metrics", {}))
+    metrics.setdefault("port", config.get_metrics_config()["port"] + index)
+    metrics.setdefault("snapshot_path", os.path.join(log_dir, "metrics.json"))
+    overrides["metrics"] = metrics
+
+    logging_overrides = dict(overrides.get("logging", {}))
+    logging_overrides.setdefault("log_dir", log_dir)
+    overrides["logging"] = logging_overrides
+
+    # Aynı saniyede başlayan worker'lar aynı kayıt dosyasını açmasın
+    recording = dict(overrides.get("recording", {}))
+    recording_path = config.get_recording_config()["path"]
+    recording.setdefault("path", os.path.join(os.path.dirname(recording_path), name, os.path.basename(recording_path)))
+    overrides["recording"] = recording
+    return overrides
+
+
+def run_worker(name: str, overrides: Dict[str, Any], limiter_address, authkey: bytes) -> None:
+    """
+    Worker sürecinin giriş noktası.
+
+    Args:
+        name: Worker adı
+        overrides: Konfigürasyon override'ları
+        limiter_address: Paylaşılan hız sınırlayıcının adresi
+        authkey: IPC doğrulama anahtarı
+    """
+    # Selenium ve Notion bağımlılıkları sadece worker süreçlerinde yüklenir
+    from main import run
+
+    multiprocessing.current_process().name = name
+    run(ConfigLoader(CONFIG_PATH, overrides), rate_limiter=connect_rate_limiter(limiter_address, authkey))
+
+
+def check_worker_profiles(slots: List["WorkerSlot"]) -> None:
+    """
+    Aynı Chrome profilini (session_path) kullanan iki worker olmadığını doğrular.
+
+    Args:
+        slots: Worker'lar
+
+    Raises:
+        ValueError: İki worker aynı session_path'i kullanıyorsa
+    """
+    owners: Dict[str, str] = {}
+    for slot in slots:
+        profile = os.path.normcase(os.path.abspath(slot.overrides["session_path"]))
+        if profile in owners:
+            raise ValueError(
+                f"'{owners[profile]}' ve '{slot.name}' aynı Chrome profilini kullanıyor: {slot.overrides['session_path']}"
+            )
+        owners[profile] = slot.name
+
+
+class WorkerSlot:
+    """
+    Bir worker'ın süreci ve yeniden başlatma durumu.
+    """
+
+    def __init__(self, name: str, overrides: Dict[str, Any]):
+        self.name = name
+        self.overrides = overrides
+        self.process: Optional[multiprocessing.Process] = None
+        self.started_at = 0.0
+        self.failures = 0
+        self.next_start = 0.0
+        self.finished = False
+
+
+class Supervisor:
+    """
+    Worker süreçlerini başlatıp izleyen sınıf.
+    """
+
+    def __init__(self, config: ConfigLoader, logger):
+        """
+        Supervisor'ı başlatır.
+
+        Args:
+            config: Ana ConfigLoader
+            logger: Logger instance
+        """
+        self.config = config
+        self.logger = logger
+        supervisor_config = config.get_supervisor_config()
+        self.restart_delay = supervisor_config["restart_delay"]
+        self.max_restart_delay = supervisor_config["max_restart_delay"]
+        self.rate_limit = supervisor_config["notion_rate_limit"]
+        self.authkey = os.urandom(16)
+        self.limiter_address = None
+        self.slots: List[WorkerSlot] = [
+            WorkerSlot(worker.get("name") or f"worker-{i + 1}", build_worker_overrides(config, i, worker))
+            for i, worker in enumerate(supervisor_config["workers"])
+        ]
+        check_worker_profiles(self.slots)
+
+    def _start(self, slot: WorkerSlot) -> None:
+        slot.process = multiprocessing.Process(
+            target=run_worker, name=slot.name,
+            args=(slot.name, slot.overrides, self.limiter_address, self.authkey)
+        )
+        slot.process.start()
+        slot.started_at = time.monotonic()
+        self.logger.info("🚀 Worker başlatıldı: %s (pid %s, gruplar: %s)",
+                         slot.name, slot.process.pid,
+                         ", ".join(g.get("name", "?") for g in slot.overrides.get("groups", [])) or "-")
+
+    def _check(self, slot: WorkerSlot, now: float) -> None:
+        if slot.finished:
+            return
+        if slot.process is None:
+            if now >= slot.next_start:
+                self._start(slot)
+            return
+        if slot.process.is_alive():
+            return
+
+        exitcode = slot.process.exitcode
+        slot.process = None
+        if exitcode == 0:
+            self.logger.info("Worker kapandı: %s", slot.name)
+            slot.finished = True
+            return
+
+        # Uzun süre çalışmış bir worker'ın çökmesi yeni bir hata serisi sayılır
+        if now - slot.started_at > self.max_restart_delay:
+            slot.failures = 0
+        delay = min(self.max_restart_delay, self.restart_delay * (2 ** slot.failures))
+        slot.failures += 1
+        slot.next_start = now + delay
+        self.logger.warning("💥 Worker çöktü: %s (çıkış kodu %s), %.0fs sonra yeniden başlatılacak",
+                            slot.name, exitcode, delay)
+
+    def run(self) -> None:
+        """
+        Paylaşılan hız sınırlayıcıyı sunar, worker'ları başlatır ve hepsi
+        temiz kapanana (veya Ctrl+C gelene) kadar izler.
+        """
+        if not self.slots:
+            self.logger.error("supervisor.workers boş, başlatılacak worker yok")
+            return
+
+        self.limiter_address = serve_rate_limiter(RateLimiter(self.rate_limit), self.authkey)
+        self.logger.info("🚦 Paylaşılan Notion hız sınırı: %s istek/s (%s:%s)",
+                         self.rate_limit, *self.limiter_address)
+        try:
+            while not all(slot.finished for slot in self.slots):
+                now = time.monotonic()
+                for slot in self.slots:
+                    self._check(slot, now)
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 15) -> None:
+        """
+        Worker'ların kapanmasını bekler, kapanmayanları sonlandırır.
+
+        Args:
+            timeout: Worker başına bekleme süresi (saniye)
+        """
+        for slot in self.slots:
+            if slot.process and slot.process.is_alive():
+                slot.process.join(timeout)
+                if slot.process.is_alive():
+                    self.logger.warning("Worker kapanmadı, sonlandırılıyor: %s", slot.name)
+                    slot.process.terminate()
+                    slot.process.join()
+        self.logger.info("Supervisor kapatıldı")
+
+
+def main():
+    config = ConfigLoader(CONFIG_PATH)
+    logging_config = config.get_logging_config()
+    logger = setup_logger(
+        name="Supervisor",
+        level=logging_config["level"],
+        log_dir=logging_config["log_dir"]
+    )
+    try:
+        supervisor = Supervisor(config, logger)
+    except ValueError as e:
+        logger.error("Worker konfigürasyonu geçersiz: %s", e)
+        sys.exit(1)
+    supervisor.run()
+
+
+if __name__ == "__main__":
+    main()
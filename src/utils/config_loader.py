@@ -6,26 +6,42 @@ Konfigürasyon dosyalarını yükleyen sınıf.
 
 import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 
+from utils.date_utils import parse_date
+
 
 class ConfigLoader:
     """
     Konfigürasyon dosyalarını yükleyen sınıf.
     """
     
-    def __init__(self, config_path: str = "config/config.json"):
+    def __init__(self, config_path: str = "config/config.json",
+                 overrides: Optional[Dict[str, Any]] = None):
         """
         Config Loader'ı başlatır.
         
         Args:
             config_path: Konfigürasyon dosya yolu
+            overrides: Dosyadaki değerlerin üzerine (iç içe) yazılacak ayarlar,
+                örn. supervisor worker'larının session_path ve grupları
         """
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self.overrides = overrides or {}
         self._load_config()
         
+    @staticmethod
+    def _merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+        merged = dict(base)
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = ConfigLoader._merge(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
+        
     def _load_config(self) -> None:
         """
         Konfigürasyon dosyasını yükler.
@@ -37,6 +53,45 @@ class ConfigLoader:
             raise ValueError(f"Konfigürasyon dosyası bulunamadı: {self.config_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Konfigürasyon dosyası geçersiz JSON: {e}")
+        if self.overrides:
+            self.config = self._merge(self.config, self.overrides)
+        
+    def validate(self) -> None:
+        """
+        Çalışma sırasında değiştirilebilen ayarları doğrular.
+        
+        Raises:
+            ValueError: Grup, durum kuralı, tarama aralığı veya hedef tarih geçersizse
+        """
+        self.get_groups()
+        self.get_status_rules()
+        whatsapp_config = self.get_whatsapp_config()
+        for key in ("scan_interval", "min_scan_interval", "max_scan_interval", "cycle_budget"):
+            value = whatsapp_config[key]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"whatsapp.{key} pozitif bir sayı olmalı: {value!r}")
+        target_date = self.get("target_date")
+        if target_date:
+            parse_date(target_date)
+        
+    def reload(self) -> Set[str]:
+        """
+        Konfigürasyon dosyasını yeniden okur. Yeni ayarlar geçersizse eskileri korunur.
+        
+        Returns:
+            Set[str]: Değişen üst düzey anahtarlar
+            
+        Raises:
+            ValueError: Dosya okunamazsa veya ayarlar geçersizse
+        """
+        previous = self.config
+        try:
+            self._load_config()
+            self.validate()
+        except ValueError:
+            self.config = previous
+            raise
+        return {key for key in set(previous) | set(self.config) if previous.get(key) != self.config.get(key)}
         
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -76,7 +131,10 @@ class ConfigLoader:
         Raises:
             ValueError: Page ID boş veya geçersizse
         """
-        page_id = self.get("parent_page_id")
+        return self._normalize_page_id(self.get("parent_page_id"))
+        
+    @staticmethod
+    def _normalize_page_id(page_id: str) -> str:
         if not page_id or page_id == "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee":
             raise ValueError("Parent page ID boş veya geçersiz")
         
@@ -86,6 +144,42 @@ class ConfigLoader:
             
         return page_id
         
+    def get_groups(self) -> List[Dict[str, str]]:
+        """
+        İzlenecek WhatsApp gruplarını ve Notion ana sayfalarını getirir.
+        `groups` listesi boşsa tek grup ayarına (whatsapp_group + parent_page_id) düşer.
+        
+        Returns:
+            List[Dict[str, str]]: name ve parent_page_id alanlı gruplar
+            
+        Raises:
+            ValueError: Grup adı veya page ID boşsa
+        """
+        groups = self.get("groups") or []
+        if not groups:
+            return [{"name": self.get_whatsapp_group(), "parent_page_id": self.get_parent_page_id()}]
+        
+        result = []
+        for group in groups:
+            name = group.get("name")
+            if not name:
+                raise ValueError("groups içinde grup adı boş")
+            result.append({
+                "name": name,
+                "parent_page_id": self._normalize_page_id(group.get("parent_page_id") or self.get("parent_page_id"))
+            })
+        return result
+        
+    def get_notion_base_url(self) -> Optional[str]:
+        """
+        Notion API adresini getirir (boşsa resmi API kullanılır).
+        Yerel stand-in sunucusuyla test ve benchmark için kullanılır.
+        
+        Returns:
+            Optional[str]: Örn. "http://127.0.0.1:8765"
+        """
+        return self.get("notion_base_url") or None
+        
     def get_whatsapp_group(self) -> str:
         """
         WhatsApp grup adını getirir.
@@ -146,6 +240,52 @@ class ConfigLoader:
             "window_size": selenium_config.get("window_size", [1200, 800])
         }
         
+    def get_browser_config(self) -> Dict[str, Any]:
+        """
+        Tarayıcı oturumu (attach / chromedriver önbelleği) konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: Tarayıcı ayarları
+        """
+        browser_config = self.get("browser", {})
+        return {
+            "debugger_address": browser_config.get("debugger_address", ""),
+            "remote_debugging_port": browser_config.get("remote_debugging_port", 0),
+            "keep_browser_open": browser_config.get("keep_browser_open", False),
+            "chromedriver_path": browser_config.get("chromedriver_path", ""),
+            "driver_cache_file": browser_config.get("driver_cache_file", "config/.chromedriver_path"),
+            "text_only": browser_config.get("text_only", False),
+            "disk_cache_mb": browser_config.get("disk_cache_mb", 64),
+            "blocked_url_patterns": browser_config.get("blocked_url_patterns", [])
+        }
+        
+    def get_watchdog_config(self) -> Dict[str, Any]:
+        """
+        Tarayıcı bellek watchdog konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: Watchdog ayarları
+        """
+        watchdog_config = self.get("watchdog", {})
+        return {
+            "enabled": watchdog_config.get("enabled", False),
+            "max_heap_mb": watchdog_config.get("max_heap_mb", 400),
+            "max_dom_nodes": watchdog_config.get("max_dom_nodes", 150000),
+            "check_interval": watchdog_config.get("check_interval", 60)
+        }
+        
+    def get_extraction_config(self) -> Dict[str, Any]:
+        """
+        Mesaj okuma taşıma katmanı konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: transport: "selenium" (chromedriver) veya "cdp" (DevTools websocket)
+        """
+        extraction_config = self.get("extraction", {})
+        return {
+            "transport": extraction_config.get("transport", "selenium")
+        }
+        
     def get_whatsapp_config(self) -> Dict[str, Any]:
         """
         WhatsApp konfigürasyonunu getirir.
@@ -155,5 +295,142 @@ class ConfigLoader:
         """
         whatsapp_config = self.get("whatsapp", {})
         return {
-            "scan_interval": whatsapp_config.get("scan_interval", 5)
+            "scan_interval": whatsapp_config.get("scan_interval", 5),
+            "min_scan_interval": whatsapp_config.get("min_scan_interval", 2),
+            "max_scan_interval": whatsapp_config.get("max_scan_interval", 120),
+            "backoff_factor": whatsapp_config.get("backoff_factor", 2.0),
+            "off_hours_interval": whatsapp_config.get("off_hours_interval", 600),
+            "working_hours": whatsapp_config.get("working_hours", {}),
+            "late_report_hours": whatsapp_config.get("late_report_hours", 6),
+            "group_revisit_interval": whatsapp_config.get("group_revisit_interval", 900),
+            "cycle_budget": whatsapp_config.get("cycle_budget", 45)
+        }
+        
+    def get_status_rules(self) -> Optional[Dict[str, List[str]]]:
+        """
+        Mesaj durum kurallarını getirir (durum → anahtar kelimeler, sıra önceliktir).
+        
+        Returns:
+            Optional[Dict[str, List[str]]]: Kurallar; tanımlı değilse None (parser varsayılanları)
+            
+        Raises:
+            ValueError: Kurallar geçersizse
+        """
+        rules = self.get("status_rules")
+        if not rules:
+            return None
+        if not isinstance(rules, dict):
+            raise ValueError("status_rules durum → anahtar kelime listesi olmalı")
+        for status, keywords in rules.items():
+            if not status or not isinstance(keywords, list) or not keywords \
+                    or not all(isinstance(keyword, str) and keyword.strip() for keyword in keywords):
+                raise ValueError(f"status_rules içinde geçersiz kural: {status!r}")
+        return {status: [keyword.strip() for keyword in keywords] for status, keywords in rules.items()}
+        
+    def get_metrics_config(self) -> Dict[str, Any]:
+        """
+        Metrik (Prometheus endpoint ve JSON snapshot) konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: Metrik ayarları
+        """
+        metrics_config = self.get("metrics", {})
+        return {
+            "enabled": metrics_config.get("enabled", False),
+            "host": metrics_config.get("host", "127.0.0.1"),
+            "port": metrics_config.get("port", 9108),
+            "snapshot_path": metrics_config.get("snapshot_path", "logs/metrics.json"),
+            "snapshot_interval": metrics_config.get("snapshot_interval", 60)
+        }
+        
+    def get_logging_config(self) -> Dict[str, Any]:
+        """
+        Logging konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: Logging ayarları
+        """
+        logging_config = self.get("logging", {})
+        return {
+            "level": logging_config.get("level", "INFO"),
+            "async": logging_config.get("async", False),
+            "json": logging_config.get("json", False),
+            "dedup_window": logging_config.get("dedup_window", 300),
+            "dedup_summary_interval": logging_config.get("dedup_summary_interval", 600),
+            "log_dir": logging_config.get("log_dir", "logs")
+        }
+        
+    def get_lookup_config(self) -> Dict[str, Any]:
+        """
+        Satır arama konfigürasyonunu getirir (hedef database'i belli olmayan mesajlar için).
+        
+        Returns:
+            Dict[str, Any]: candidate_days (1 = bugün, 2 = bugün ve dün, N = son N gün),
+                parallel (aday database'ler aynı anda aranır), max_workers
+        """
+        lookup_config = self.get("lookup", {})
+        return {
+            "candidate_days": lookup_config.get("candidate_days", 2),
+            "parallel": lookup_config.get("parallel", True),
+            "max_workers": lookup_config.get("max_workers", 4)
+        }
+        
+    def get_cache_config(self) -> Dict[str, Any]:
+        """
+        Kalıcı Notion meta veri önbelleği konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: enabled, path (SQLite dosyası), revalidate_interval (saniye)
+        """
+        cache_config = self.get("cache", {})
+        return {
+            "enabled": cache_config.get("enabled", False),
+            "path": cache_config.get("path", "config/cache/notion_metadata.sqlite"),
+            "revalidate_interval": cache_config.get("revalidate_interval", 300)
+        }
+        
+    def get_archive_config(self) -> Dict[str, Any]:
+        """
+        Yerel mesaj arşivi konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: enabled, path (SQLite dosyası), mirror_to_notion (günlük mesajları
+                tarih sayfasına ekle), mirror_max_batches (tarama başına en fazla append çağrısı)
+        """
+        archive_config = self.get("archive", {})
+        return {
+            "enabled": archive_config.get("enabled", False),
+            "path": archive_config.get("path", "data/message_archive.sqlite"),
+            "mirror_to_notion": archive_config.get("mirror_to_notion", False),
+            "mirror_max_batches": archive_config.get("mirror_max_batches", 5)
+        }
+        
+    def get_recording_config(self) -> Dict[str, Any]:
+        """
+        Oturum kaydı (record/replay) konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: enabled, path (strftime biçimleri açılır)
+        """
+        recording_config = self.get("recording", {})
+        return {
+            "enabled": recording_config.get("enabled", False),
+            "path": recording_config.get("path", "logs/session_%Y%m%d_%H%M%S.jsonl.gz")
+        }
+        
+    def get_supervisor_config(self) -> Dict[str, Any]:
+        """
+        Çoklu süreç (supervisor) konfigürasyonunu getirir.
+        
+        Returns:
+            Dict[str, Any]: workers (her biri config override'ı: session_path, groups ...),
+                notion_rate_limit (tüm worker'lar için toplam istek/saniye), restart_delay,
+                max_restart_delay (saniye)
+        """
+        supervisor_config = self.get("supervisor", {})
+        return {
+            "workers": supervisor_config.get("workers", []),
+            "notion_rate_limit": supervisor_config.get("notion_rate_limit", 3),
+            "restart_delay": supervisor_config.get("restart_delay", 5),
+            "max_restart_delay": supervisor_config.get("max_restart_delay", 300)
         }
@@ -0,0 +1,96 @@
+"""
+Config Watcher
+
+Çalışan bot'un konfigürasyon dosyasını izler (mtime yoklaması). Dosya
+değiştiğinde ConfigLoader.reload ile yeniden okur; geçersiz ayarlar loglanır
+ve eski ayarlarla devam edilir. Değişen anahtarların nasıl uygulanacağına
+çağıran karar verir (HOT_KEYS / BROWSER_KEYS).
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional, Set, Tuple
+
+from utils.metrics import get_metrics
+
+# Bot çalışırken yerinde uygulanan ayarlar
+HOT_KEYS = {"whatsapp", "target_date", "groups", "whatsapp_group", "parent_page_id", "status_rules"}
+
+# Sadece tarayıcı yeniden başlatılarak uygulanabilen ayarlar
+BROWSER_KEYS = {"session_path", "headless", "browser", "selenium", "extraction"}
+
+
+class ConfigWatcher:
+    """
+    Konfigürasyon dosyasındaki değişiklikleri yoklayan izleyici.
+    """
+
+    def __init__(self, config, logger: logging.Logger, poll_interval: float = 2.0):
+        """
+        İzleyiciyi hazırlar (mevcut dosya değişmemiş sayılır).
+
+        Args:
+            config: ConfigLoader instance
+            logger: Logger instance
+            poll_interval: Dosya kontrol aralığı (saniye)
+        """
+        self.config = config
+        self.logger = logger
+        self.poll_interval = poll_interval
+        self.metrics = get_metrics()
+        self._stamp = self._file_stamp()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.config.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> Set[str]:
+        """
+        Dosya değiştiyse konfigürasyonu yeniden yükler.
+
+        Returns:
+            Set[str]: Değişen üst düzey anahtarlar (değişiklik yoksa veya geçersizse boş)
+        """
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return set()
+        self._stamp = stamp
+        try:
+            changed = self.config.reload()
+        except ValueError as e:
+            # Aynı dosya için bir kez loglanır; düzeltilip kaydedilince tekrar denenir
+            self.metrics.inc("config_reloads_total", result="invalid")
+            self.logger.error("⚙️ Konfigürasyon geçersiz, eski ayarlarla devam ediliyor: %s", e)
+            return set()
+        self.metrics.inc("config_reloads_total", result="ok")
+        if changed:
+            self.logger.info("⚙️ Konfigürasyon yenilendi: %s", ", ".join(sorted(changed)))
+        return changed
+
+    def wait(self, timeout: float, wake: Optional[threading.Event] = None) -> Set[str]:
+        """
+        Konfigürasyon değişene, wake olayı set edilene (örn. sohbete yeni mesaj geldi)
+        veya süre dolana kadar bekler (tarama aralığı beklemesi).
+
+        Args:
+            timeout: En uzun bekleme (saniye)
+            wake: Set edilince beklemeyi erken bitiren olay (opsiyonel)
+
+        Returns:
+            Set[str]: Değişen anahtarlar; değişiklik olmadan bittiyse boş
+        """
+        end = time.monotonic() + timeout
+        while True:
+            changed = self.check()
+            remaining = end - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            if wake is None:
+                time.sleep(min(self.poll_interval, remaining))
+            elif wake.wait(min(self.poll_interval, remaining)):
+                return self.check()
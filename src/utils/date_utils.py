@@ -0,0 +1,145 @@
+"""
+Date Utils
+
+WhatsApp tarih ayraçlarını ve Türkçe gün adlarını mutlak tarihlere çeviren yardımcılar.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+DATE_FORMAT = "%d.%m.%Y"
+
+# date.weekday() sırasıyla Türkçe gün adları
+TURKISH_DAYS = ["pazartesi", "salı", "çarşamba", "perşembe", "cuma", "cumartesi", "pazar"]
+ENGLISH_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+_TURKISH_UPPER_MAP = str.maketrans({"İ": "i", "I": "ı"})
+_ASCII_FOLD_MAP = str.maketrans({"ı": "i", "ş": "s", "ç": "c", "ğ": "g", "ö": "o", "ü": "u"})
+
+_NUMERIC_DATE_RE = re.compile(r"^(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})$")
+
+# Tarih ayracı regex (sayısal tarih, bugün/dün veya gün adı)
+DATE_SEPARATOR_RE = re.compile(
+    r"^\s*(\d{1,2}[./-]\d{1,2}[./-]\d{2,4}|BUGÜN|DÜN|TODAY|YESTERDAY"
+    r"|PAZARTES[İI]|SALI|ÇARŞAMBA|PERŞEMBE|CUMARTES[İI]|CUMA|PAZAR"
+    r"|MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\s*$",
+    re.IGNORECASE
+)
+
+
+def turkish_lower(text: str) -> str:
+    """
+    Türkçe büyük/küçük harf kurallarına göre küçük harfe çevirir (İ → i, I → ı).
+
+    Args:
+        text: Metin
+
+    Returns:
+        str: Küçük harfli metin
+    """
+    return text.translate(_TURKISH_UPPER_MAP).lower()
+
+
+def fold_turkish(text: str) -> str:
+    """
+    Metni küçük harfe çevirip Türkçe karakterleri ASCII karşılıklarına indirger.
+
+    Args:
+        text: Metin
+
+    Returns:
+        str: Katlanmış metin (örn. "SALI" → "sali", "Çarşamba" → "carsamba")
+    """
+    return turkish_lower(text).translate(_ASCII_FOLD_MAP)
+
+
+_WEEKDAY_LOOKUP = {fold_turkish(name): index for index, name in enumerate(TURKISH_DAYS)}
+_WEEKDAY_LOOKUP.update({name: index for index, name in enumerate(ENGLISH_DAYS)})
+
+
+def parse_date(date_str: str) -> date:
+    """
+    "gg.aa.yyyy" formatındaki tarihi parse eder.
+
+    Args:
+        date_str: Tarih metni
+
+    Returns:
+        date: Tarih
+
+    Raises:
+        ValueError: Format geçersizse
+    """
+    try:
+        return datetime.strptime(date_str.strip(), DATE_FORMAT).date()
+    except ValueError:
+        raise ValueError(f"Geçersiz tarih: {date_str} (beklenen format gg.aa.yyyy)")
+
+
+def format_date(value: date) -> str:
+    """
+    Tarihi "gg.aa.yyyy" formatına çevirir.
+
+    Args:
+        value: Tarih
+
+    Returns:
+        str: Tarih metni
+    """
+    return value.strftime(DATE_FORMAT)
+
+
+def date_range(start: date, end: date) -> List[date]:
+    """
+    İki tarih arasındaki (dahil) günleri döndürür.
+
+    Args:
+        start: Başlangıç tarihi
+        end: Bitiş tarihi
+
+    Returns:
+        List[date]: Günler (eskiden yeniye)
+    """
+    days = (end - start).days
+    return [start + timedelta(days=i) for i in range(days + 1)]
+
+
+def resolve_date_label(label: str, today: Optional[date] = None) -> Optional[date]:
+    """
+    WhatsApp tarih ayracını mutlak tarihe çevirir.
+
+    "27.09.2025", "27/09/25", "BUGÜN", "DÜN" ve son bir haftadaki gün adları
+    ("Pazar", "SALI", "Cumartesi" ...) desteklenir.
+
+    Args:
+        label: Ayraç metni
+        today: Referans gün (varsayılan bugün)
+
+    Returns:
+        Optional[date]: Çözülen tarih veya None
+    """
+    today = today or date.today()
+    text = fold_turkish(label.strip())
+
+    if text in ("bugun", "today"):
+        return today
+    if text in ("dun", "yesterday"):
+        return today - timedelta(days=1)
+
+    if text in _WEEKDAY_LOOKUP:
+        # Gün adı son bir hafta için gösterilir: en yakın geçmiş gün
+        days_back = (today.weekday() - _WEEKDAY_LOOKUP[text]) % 7 or 7
+        return today - timedelta(days=days_back)
+
+    match = _NUMERIC_DATE_RE.match(text)
+    if match:
+        day, month, year = (int(part) for part in match.groups())
+        if year < 100:
+            year += 2000
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+
+    return None
@@ -0,0 +1,77 @@
+"""
+Deadline
+
+Tarama döngüsü başına zaman bütçesi. Bekleme ve WebDriver komutları süresini
+kalan bütçeden alır; bütçe aşımı döngüyü sessizce uzatmak yerine ölçülür.
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class Deadline:
+    """
+    Monotonic saatle çalışan bitiş zamanı.
+    """
+
+    def __init__(self, budget: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Bütçeyi başlatır.
+
+        Args:
+            budget: Toplam süre (saniye)
+            clock: Zaman kaynağı (test için)
+        """
+        self.budget = float(budget)
+        self.clock = clock
+        self.started = clock()
+        self.expires = self.started + self.budget
+
+    def remaining(self) -> float:
+        """
+        Returns:
+            float: Kalan süre (saniye, en az 0)
+        """
+        return max(0.0, self.expires - self.clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.clock() >= self.expires
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    def overrun(self) -> float:
+        """
+        Returns:
+            float: Bütçenin ne kadar aşıldığı (saniye, aşılmadıysa 0)
+        """
+        return max(0.0, self.clock() - self.expires)
+
+    def timeout(self, cap: float, floor: float = 0.0) -> float:
+        """
+        Bir bekleme için kullanılacak süreyi verir: istenen süre, kalan bütçe ile sınırlanır.
+
+        Args:
+            cap: Beklemenin kendi üst sınırı (saniye)
+            floor: Bütçe bitse bile verilecek en kısa süre (tek bir deneme için)
+
+        Returns:
+            float: Saniye
+        """
+        return max(floor, min(cap, self.remaining()))
+
+
+def budget_timeout(deadline: Optional[Deadline], cap: float, floor: float = 0.0) -> float:
+    """
+    Deadline yoksa sadece üst sınırı uygular.
+
+    Args:
+        deadline: Döngü bütçesi (opsiyonel)
+        cap: Beklemenin üst sınırı (saniye)
+        floor: En kısa süre (saniye)
+
+    Returns:
+        float: Saniye
+    """
+    return deadline.timeout(cap, floor) if deadline else cap
@@ -4,55 +4,265 @@ Logger
 Logging yapılandırması ve yardımcı fonksiyonlar.
 """
 
+import atexit
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import queue
+import threading
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+# Yapılandırılmış (JSON) çıktıya eklenecek `extra` alanları
+STRUCTURED_FIELDS = ("message_id", "stage", "stage_timings", "event", "suppressed")
 
-def get_logger(name: str = "WhatsAppNotionBot") -> logging.Logger:
+_listeners = {}
+_dedup_filters = {}
+
+
+class JsonFormatter(logging.Formatter):
     """
-    Singleton logger getirir veya oluşturur.
-    
+    Log kayıtlarını tek satırlık JSON olarak biçimlendirir (JSON lines).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class DuplicateFilter(logging.Filter):
+    """
+    Aynı olayın pencere süresi içindeki tekrarlarını bastırır.
+
+    Olay anahtarı `extra={"event_key": ...}` ile verilebilir; verilmezse logger adı,
+    seviye, mesaj şablonu ve argümanlardan oluşur. Pencere bittikten sonra olay
+    tekrar geldiğinde kaç kez bastırıldığı mesaja eklenir; flush() ile bekleyen
+    sayımlar periyodik özet olarak yazılır. `extra={"dedup": False}` filtreyi atlar.
+    """
+
+    def __init__(self, window: float = 300, summary_interval: float = 600,
+                 max_level: int = logging.WARNING):
+        """
+        Filtreyi başlatır.
+
+        Args:
+            window: Tekrarların bastırılacağı süre (saniye)
+            summary_interval: Bastırma özetlerinin en sık yazılma aralığı (saniye)
+            max_level: Bu seviyenin üzerindeki kayıtlar (örn. ERROR) hiç bastırılmaz
+        """
+        super().__init__()
+        self.window = window
+        self.summary_interval = summary_interval
+        self.max_level = max_level
+        self._lock = threading.Lock()
+        # anahtar → [pencere başlangıcı, bastırılan sayısı, örnek mesaj]
+        self._events = {}
+        self._last_summary = time.monotonic()
+
+    @staticmethod
+    def _event_key(record: logging.LogRecord):
+        key = getattr(record, "event_key", None)
+        if key is not None:
+            return key
+        return (record.name, record.levelno, str(record.msg), repr(record.args))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or getattr(record, "dedup", True) is False:
+            return True
+
+        key = self._event_key(record)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._events.get(key)
+            if entry and now - entry[0] < self.window:
+                entry[1] += 1
+                return False
+            suppressed = entry[1] if entry else 0
+            self._events[key] = [now, 0, (record.levelno, record.msg, record.args)]
+
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.msg} (son {self.window:.0f}s içinde {suppressed} tekrar bastırıldı)"
+        return True
+
+    def flush(self, logger: logging.Logger, force: bool = False) -> int:
+        """
+        Penceresi dolmuş olayların bastırma özetlerini yazar ve eski kayıtları temizler.
+
+        Args:
+            logger: Özetlerin yazılacağı logger
+            force: summary_interval beklenmeden yaz
+
+        Returns:
+            int: Yazılan özet sayısı
+        """
+        now = time.monotonic()
+        if not force and now - self._last_summary < self.summary_interval:
+            return 0
+        self._last_summary = now
+
+        summaries = []
+        with self._lock:
+            for key, (started, suppressed, sample) in list(self._events.items()):
+                if force or now - started >= self.window:
+                    del self._events[key]
+                    if suppressed:
+                        summaries.append((suppressed, sample))
+
+        for suppressed, (levelno, msg, args) in summaries:
+            try:
+                text = str(msg) % args if args else str(msg)
+            except (TypeError, ValueError):
+                text = str(msg)
+            logger.log(
+                levelno, "🔇 %d tekrar bastırıldı: %s", suppressed, text,
+                extra={"dedup": False, "event": "log_suppressed", "suppressed": suppressed}
+            )
+        return len(summaries)
+
+
+def flush_suppressed(name: str = "WhatsAppNotionBot", force: bool = False) -> int:
+    """
+    Logger'ın tekrar filtresindeki bekleyen bastırma özetlerini yazar.
+
+    Args:
+        name: Logger adı
+        force: summary_interval beklenmeden yaz
+
+    Returns:
+        int: Yazılan özet sayısı
+    """
+    dedup_filter = _dedup_filters.get(name)
+    if not dedup_filter:
+        return 0
+    return dedup_filter.flush(logging.getLogger(name), force=force)
+
+
+def _stop_listener(name: str) -> None:
+    listener = _listeners.pop(name, None)
+    if listener:
+        listener.stop()
+
+
+def setup_logger(name: str = "WhatsAppNotionBot", level: str = "INFO",
+                 async_mode: bool = False, json_format: bool = False,
+                 log_dir: str = "logs", dedup_window: float = 0,
+                 dedup_summary_interval: float = 600) -> logging.Logger:
+    """
+    Logger'ı yapılandırır (varsa önceki yapılandırmayı değiştirir).
+
     Args:
         name: Logger adı
-        
+        level: Log seviyesi (DEBUG, INFO, WARNING, ERROR)
+        async_mode: True ise kayıtlar bir kuyruğa yazılır ve konsol/dosya çıktısı
+            ayrı bir thread'de yapılır; tarama ve güncelleme thread'leri diske yazarken beklemez
+        json_format: True ise dosyaya JSON lines formatında yazılır
+        log_dir: Log dizini
+        dedup_window: 0'dan büyükse aynı olayın bu süre (saniye) içindeki tekrarları bastırılır
+        dedup_summary_interval: Bastırma özetlerinin yazılma aralığı (saniye)
+
     Returns:
         logging.Logger: Yapılandırılmış logger
     """
     logger = logging.getLogger(name)
-    
-    # Logger zaten yapılandırılmışsa tekrar yapılandırma
-    if logger.handlers:
-        return logger
-    
+
+    # Önceki yapılandırmayı temizle
+    _stop_listener(name)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    old_filter = _dedup_filters.pop(name, None)
+    if old_filter:
+        logger.removeFilter(old_filter)
+
     # Log dizinini oluştur
-    log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
-    
+
     # Logger seviyesini ayarla
-    logger.setLevel(logging.INFO)
-    
+    log_level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+    logger.setLevel(log_level)
+    logger.propagate = False
+
     # Formatter oluştur
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    
+
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+
     # File handler (RotatingFileHandler)
+    file_name = "whatsapp_notion_bot.jsonl" if json_format else "whatsapp_notion_bot.log"
     file_handler = RotatingFileHandler(
-        filename=os.path.join(log_dir, "whatsapp_notion_bot.log"),
+        filename=os.path.join(log_dir, file_name),
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5,
         encoding="utf-8"
     )
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
+    file_handler.setLevel(log_level)
+    file_handler.setFormatter(JsonFormatter() if json_format else formatter)
+
+    if async_mode:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+    else:
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+
+    # Tekrarlayan olaylar kuyruğa/diske ulaşmadan bastırılır
+    if dedup_window > 0:
+        dedup_filter = DuplicateFilter(dedup_window, dedup_summary_interval)
+        logger.addFilter(dedup_filter)
+        _dedup_filters[name] = dedup_filter
+
     return logger
+
+
+def get_logger(name: str = "WhatsAppNotionBot") -> logging.Logger:
+    """
+    Singleton logger getirir veya oluşturur.
+
+    Args:
+        name: Logger adı
+
+    Returns:
+        logging.Logger: Yapılandırılmış logger
+    """
+    logger = logging.getLogger(name)
+
+    # Logger zaten yapılandırılmışsa tekrar yapılandırma
+    if logger.handlers:
+        return logger
+
+    return setup_logger(name)
+
+
+def shutdown_logging() -> None:
+    """
+    Kuyruktaki kayıtları boşaltıp arka plan log thread'lerini durdurur.
+    """
+    for name in list(_dedup_filters):
+        flush_suppressed(name, force=True)
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,285 @@
+"""
+Message Archive
+
+WhatsApp'tan okunan tüm mesajları (sadece durum bildirenleri değil) yerel bir
+SQLite arşivinde saklar. Metin ve gönderen FTS5 ile indekslenir; aylar süren
+geçmiş, WhatsApp Web'de tekrar kaydırmadan milisaniyeler içinde aranır.
+Her tarama partisi tek işlemde (transaction) yazılır, data-id ile tekilleştirilir.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.date_utils import fold_turkish, format_date, parse_date
+from utils.metrics import get_metrics
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    chat TEXT NOT NULL,
+    day TEXT NOT NULL,
+    time TEXT,
+    sender TEXT,
+    text TEXT NOT NULL,
+    data_id TEXT,
+    msg_key TEXT NOT NULL,
+    archived_at REAL NOT NULL,
+    UNIQUE (chat, msg_key)
+);
+CREATE INDEX IF NOT EXISTS messages_chat_day ON messages (chat, day);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    chat TEXT NOT NULL,
+    day TEXT NOT NULL,
+    last_message_id INTEGER NOT NULL,
+    last_data_id TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (chat, day)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    text, sender, content='messages', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+# data-pre-plain-text: "[14:02, 27.09.2025] Gönderen: "
+_META_RE = re.compile(r"^\s*\[(?P<time>[^,\]]+),\s*(?P<date>[^\]]+)\]\s*(?P<sender>.*?):?\s*$")
+
+
+def parse_meta(meta: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Mesajın meta bilgisinden saat ve gönderen adını çıkarır.
+
+    Args:
+        meta: data-pre-plain-text değeri ("[14:02, 27.09.2025] Gönderen: ")
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (saat, gönderen)
+    """
+    match = _META_RE.match(meta or "")
+    if not match:
+        return None, None
+    return match.group("time").strip(), match.group("sender").strip() or None
+
+
+def _display_date(day: str) -> str:
+    # Arşivde ISO (yyyy-mm-dd, sıralanabilir), dışarıda gg.aa.yyyy
+    return format_date(datetime.strptime(day, "%Y-%m-%d").date())
+
+
+def fts_query(query: str) -> str:
+    """
+    Kullanıcı sorgusunu FTS5 ifadesine çevirir: her kelime tırnaklanır (AND),
+    son kelime önek olarak aranır. İndeks Türkçe katlanmış metin tuttuğu için sorgu da katlanır.
+
+    Args:
+        query: Arama metni
+
+    Returns:
+        str: FTS5 MATCH ifadesi
+    """
+    terms = ['"%s"' % term.replace('"', '""') for term in fold_turkish(query).split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class MessageArchive:
+    """
+    FTS5 indeksli, thread-safe SQLite mesaj arşivi.
+    """
+
+    def __init__(self, path: str = "data/message_archive.sqlite"):
+        """
+        Arşivi açar (dosya ve tablolar yoksa oluşturulur).
+
+        Args:
+            path: SQLite dosya yolu
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA_SQL)
+        self.metrics = get_metrics()
+
+    def add_records(self, chat: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Bir tarama partisinin kayıtlarını tek işlemde arşive yazar.
+        Aynı data-id (yoksa aynı gün/saat/gönderen/metin) ikinci kez yazılmaz.
+
+        Args:
+            chat: Sohbet (grup) adı
+            records: id (data-id), text, meta, date (gg.aa.yyyy) alanlı kayıtlar;
+                tarihi bilinmeyen kayıtlar atlanır
+
+        Returns:
+            int: Yeni eklenen mesaj sayısı
+        """
+        start = time.perf_counter()
+        added = 0
+        now = time.time()
+        with self._lock, self._conn:
+            for record in records:
+                text = record.get("text")
+                if not text or not record.get("date"):
+                    continue
+                day = parse_date(record["date"]).isoformat()
+                msg_time, sender = parse_meta(record.get("meta"))
+                data_id = record.get("id")
+                msg_key = data_id or hashlib.sha1(
+                    f"{day}|{msg_time}|{sender}|{text}".encode("utf-8")
+                ).hexdigest()
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO messages (chat, day, time, sender, text, data_id, msg_key, archived_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (chat, day, msg_time, sender, text, data_id, msg_key, now)
+                )
+                if cursor.rowcount:
+                    # İndekste katlanmış metin tutulur: "IŞIK", "ışık" ve "isik" aynı terimdir
+                    self._conn.execute(
+                        "INSERT INTO messages_fts (rowid, text, sender) VALUES (?, ?, ?)",
+                        (cursor.lastrowid, fold_turkish(text), fold_turkish(sender or ""))
+                    )
+                    added += 1
+        self.metrics.observe("archive_write_seconds", time.perf_counter() - start)
+        self.metrics.inc("archive_messages_total", added, chat=chat)
+        return added
+
+    def search(self, query: str, chat: Optional[str] = None, sender: Optional[str] = None,
+               start_date: Optional[str] = None, end_date: Optional[str] = None,
+               limit: int = 50, raw: bool = False) -> List[Dict[str, Any]]:
+        """
+        Arşivde tam metin araması yapar (en yeni mesaj önce).
+
+        Args:
+            query: Arama metni
+            chat: Sadece bu sohbet
+            sender: Gönderen adında geçen metin
+            start_date: Başlangıç tarihi (gg.aa.yyyy)
+            end_date: Bitiş tarihi (gg.aa.yyyy)
+            limit: En fazla sonuç
+            raw: True ise sorgu FTS5 sözdizimiyle olduğu gibi kullanılır
+
+        Returns:
+            List[Dict[str, Any]]: chat, date, time, sender, text, data_id, snippet alanlı sonuçlar
+        """
+        where = ["messages_fts MATCH ?"]
+        params: List[Any] = [query if raw else fts_query(query)]
+        if chat:
+            where.append("m.chat = ?")
+            params.append(chat)
+        if sender:
+            where.append("m.sender LIKE ?")
+            params.append(f"%{sender}%")
+        if start_date:
+            where.append("m.day >= ?")
+            params.append(parse_date(start_date).isoformat())
+        if end_date:
+            where.append("m.day <= ?")
+            params.append(parse_date(end_date).isoformat())
+        params.append(limit)
+        sql = (
+            "SELECT m.chat, m.day, m.time, m.sender, m.text, m.data_id, "
+            "snippet(messages_fts, 0, '[', ']', '…', 12) "
+            "FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid "
+            f"WHERE {' AND '.join(where)} ORDER BY m.day DESC, m.id DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "chat": chat_name, "date": _display_date(day),
+                "time": msg_time, "sender": sender_name, "text": text, "data_id": data_id, "snippet": snippet
+            }
+            for chat_name, day, msg_time, sender_name, text, data_id, snippet in rows
+        ]
+
+    # --- Notion'a aktarım (core.day_mirror) ---
+
+    def pending_mirror(self, chat: str, date_str: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Günün Notion sayfasına henüz eklenmemiş mesajlarını arşiv sırasıyla getirir.
+
+        Args:
+            chat: Sohbet (grup) adı
+            date_str: Tarih (gg.aa.yyyy)
+            limit: En fazla mesaj
+
+        Returns:
+            List[Dict[str, Any]]: id (arşiv sırası), time, sender, text, data_id alanlı mesajlar
+        """
+        day = parse_date(date_str).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, time, sender, text, data_id FROM messages "
+                "WHERE chat = ? AND day = ? AND id > COALESCE("
+                "(SELECT last_message_id FROM mirror_state WHERE chat = ? AND day = ?), 0) "
+                "ORDER BY id LIMIT ?",
+                (chat, day, chat, day, -1 if limit is None else limit)
+            ).fetchall()
+        return [
+            {"id": message_id, "time": msg_time, "sender": sender, "text": text, "data_id": data_id}
+            for message_id, msg_time, sender, text, data_id in rows
+        ]
+
+    def mark_mirrored(self, chat: str, date_str: str, message: Dict[str, Any]) -> None:
+        """
+        Aktarımın kaldığı yeri (son eklenen mesaj) kaydeder.
+
+        Args:
+            chat: Sohbet (grup) adı
+            date_str: Tarih (gg.aa.yyyy)
+            message: pending_mirror() mesajı
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mirror_state VALUES (?, ?, ?, ?, ?)",
+                (chat, parse_date(date_str).isoformat(), message["id"], message.get("data_id"), time.time())
+            )
+
+    def mirror_cursor(self, chat: str, date_str: str) -> Optional[str]:
+        """
+        Günün Notion'a eklenen son mesajının data-id'sini getirir.
+
+        Args:
+            chat: Sohbet (grup) adı
+            date_str: Tarih (gg.aa.yyyy)
+
+        Returns:
+            Optional[str]: data-id; hiç aktarım yapılmadıysa None
+        """
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT last_data_id FROM mirror_state WHERE chat = ? AND day = ?",
+                (chat, parse_date(date_str).isoformat())
+            ).fetchone()
+        return found[0] if found else None
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Sohbet başına mesaj sayısını ve tarih aralığını getirir.
+
+        Returns:
+            List[Dict[str, Any]]: chat, messages, first_date, last_date alanlı satırlar
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT chat, COUNT(*), MIN(day), MAX(day) FROM messages GROUP BY chat ORDER BY chat"
+            ).fetchall()
+        return [
+            {"chat": chat, "messages": count, "first_date": _display_date(first), "last_date": _display_date(last)}
+            for chat, count, first, last in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
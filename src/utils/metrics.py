@@ -0,0 +1,320 @@
+"""
+Metrics
+
+Aşama bazlı süre ve sayaç ölçümleri. Ölçümler yerel bir HTTP endpoint'inden
+Prometheus metin formatında sunulur ve periyodik olarak JSON'a yazılır.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+# Histogram kova sınırları (saniye)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + body + "}"
+
+
+class _Histogram:
+    """
+    Sabit kovalı histogram.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """
+    Thread-safe metrik kayıt defteri (sayaç, gauge ve histogram).
+    """
+
+    def __init__(self, prefix: str = "wnb_"):
+        """
+        Registry'yi başlatır.
+
+        Args:
+            prefix: Tüm metrik adlarının öneki
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Sayacı artırır.
+
+        Args:
+            name: Metrik adı
+            value: Artış miktarı
+            **labels: Etiketler
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """
+        Gauge değerini ayarlar.
+
+        Args:
+            name: Metrik adı
+            value: Değer
+            **labels: Etiketler
+        """
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """
+        Histograma bir süre ölçümü ekler.
+
+        Args:
+            name: Metrik adı
+            seconds: Ölçülen süre (saniye)
+            **labels: Etiketler
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """
+        Blok süresini ölçüp histograma ekleyen context manager.
+
+        Args:
+            name: Metrik adı
+            **labels: Etiketler
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def render_prometheus(self) -> str:
+        """
+        Metrikleri Prometheus metin formatında döndürür.
+
+        Returns:
+            str: Prometheus exposition metni
+        """
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full = self.prefix + name
+                lines.append(f"# TYPE {full} counter")
+                for key, value in series.items():
+                    lines.append(f"{full}{_format_labels(key)} {value}")
+            for name, series in sorted(self._gauges.items()):
+                full = self.prefix + name
+                lines.append(f"# TYPE {full} gauge")
+                for key, value in series.items():
+                    lines.append(f"{full}{_format_labels(key)} {value}")
+            for name, series in sorted(self._histograms.items()):
+                full = self.prefix + name
+                lines.append(f"# TYPE {full} histogram")
+                for key, histogram in series.items():
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f"{full}_bucket{_format_labels(key, ('le', str(bound)))} {count}")
+                    lines.append(f"{full}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{full}_sum{_format_labels(key)} {histogram.sum}")
+                    lines.append(f"{full}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Metriklerin JSON'a yazılabilir bir kopyasını döndürür.
+
+        Returns:
+            Dict[str, Any]: Metrik anlık görüntüsü
+        """
+        def labels_dict(key: LabelKey) -> Dict[str, str]:
+            return dict(key)
+
+        with self._lock:
+            return {
+                "timestamp": time.time(),
+                "counters": {
+                    name: [{"labels": labels_dict(k), "value": v} for k, v in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [{"labels": labels_dict(k), "value": v} for k, v in series.items()]
+                    for name, series in self._gauges.items()
+                },
+                "histograms": {
+                    name: [
+                        {
+                            "labels": labels_dict(k),
+                            "count": h.count,
+                            "sum": h.sum,
+                            "avg": h.sum / h.count if h.count else 0.0,
+                            "max": h.max,
+                        }
+                        for k, h in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """
+        Tüm metrikleri temizler.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Paylaşılan metrik registry'sini getirir.
+
+    Returns:
+        MetricsRegistry: Singleton registry
+    """
+    return _registry
+
+
+class MetricsServer:
+    """
+    Metrikleri yerel HTTP üzerinden sunan sunucu (/metrics ve /metrics.json).
+    """
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9108):
+        """
+        Sunucuyu hazırlar.
+
+        Args:
+            registry: MetricsRegistry instance
+            host: Dinlenecek adres
+            port: Dinlenecek port
+        """
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.startswith("/metrics.json"):
+                    body = json.dumps(registry.snapshot(), ensure_ascii=False).encode("utf-8")
+                    content_type = "application/json; charset=utf-8"
+                elif handler.path.startswith("/metrics"):
+                    body = registry.render_prometheus().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                else:
+                    handler.send_error(404)
+                    return
+                handler.send_response(200)
+                handler.send_header("Content-Type", content_type)
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                # HTTP erişim logları bot loguna karışmasın
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class MetricsSnapshotWriter:
+    """
+    Metrik anlık görüntüsünü periyodik olarak JSON dosyasına yazan thread.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: str = "logs/metrics.json", interval: float = 60):
+        """
+        Yazıcıyı hazırlar.
+
+        Args:
+            registry: MetricsRegistry instance
+            path: JSON dosya yolu
+            interval: Yazma aralığı (saniye)
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="metrics-snapshot", daemon=True)
+
+    def write(self) -> None:
+        """
+        Anlık görüntüyü atomik olarak dosyaya yazar.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.registry.snapshot(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                continue
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.write()
@@ -0,0 +1,330 @@
+"""
+Notion Cache
+
+Notion meta verisini (tarih → database eşlemesi, database şemaları ve satır
+indeksleri) SQLite'ta saklayan kalıcı önbellek. Bot yeniden başladığında ilk
+mesaj Notion'da sayfa/database/satır keşfi yapılmadan işlenir; satırlar
+`last_edited_time` su seviyesinden (watermark) itibaren artımlı güncellenir.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS date_databases (
+    parent_page_id TEXT NOT NULL,
+    date_str TEXT NOT NULL,
+    database_id TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (parent_page_id, date_str)
+);
+CREATE TABLE IF NOT EXISTS schemas (
+    database_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    database_id TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    last_edited_time TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (database_id, page_id)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    database_id TEXT PRIMARY KEY,
+    last_edited_time TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def _compact_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    # Eşleştirme ve durum karşılaştırması için gereken alanlar
+    return {
+        "id": row["id"],
+        "last_edited_time": row.get("last_edited_time"),
+        "properties": row.get("properties", {}),
+    }
+
+
+class NotionMetadataCache:
+    """
+    Thread-safe kalıcı Notion meta veri önbelleği. Satırlar ilk erişimde
+    SQLite'tan belleğe alınır, yazmalar hem belleğe hem diske yapılır.
+    """
+
+    def __init__(self, path: str = "config/cache/notion_metadata.sqlite"):
+        """
+        Önbelleği açar (dosya ve tablolar yoksa oluşturulur).
+
+        Args:
+            path: SQLite dosya yolu
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.RLock()
+        # Supervisor worker'ları aynı dosyayı paylaşabilir: WAL + bekleme süresi
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA_SQL)
+        self._rows: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+
+    # --- Tarih → database ---
+
+    def get_database(self, parent_page_id: str, date_str: str) -> Optional[str]:
+        """
+        Tarih sayfasının önbellekteki database ID'sini getirir.
+
+        Args:
+            parent_page_id: Ana sayfa ID'si
+            date_str: Tarih (gg.aa.yyyy)
+
+        Returns:
+            Optional[str]: Database ID'si
+        """
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT database_id FROM date_databases WHERE parent_page_id = ? AND date_str = ?",
+                (parent_page_id, date_str)
+            ).fetchone()
+        return found[0] if found else None
+
+    def set_database(self, parent_page_id: str, date_str: str, database_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO date_databases VALUES (?, ?, ?, ?)",
+                (parent_page_id, date_str, database_id, time.time())
+            )
+
+    def databases(self, parent_page_id: str) -> List[str]:
+        """
+        Ana sayfa için önbellekte tutulan database ID'lerini getirir.
+
+        Args:
+            parent_page_id: Ana sayfa ID'si
+
+        Returns:
+            List[str]: Database ID'leri (en yeni tarih önce)
+        """
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT database_id FROM date_databases WHERE parent_page_id = ? ORDER BY updated_at DESC",
+                (parent_page_id,)
+            ).fetchall()
+        return [row[0] for row in found]
+
+    def forget_database(self, database_id: str) -> None:
+        """
+        Database'e ait tüm kayıtları (tarih eşlemesi, şema, satırlar) siler.
+
+        Args:
+            database_id: Database ID'si
+        """
+        with self._lock, self._conn:
+            for table in ("date_databases", "schemas", "rows", "watermarks"):
+                self._conn.execute(f"DELETE FROM {table} WHERE database_id = ?", (database_id,))
+            self._rows.pop(database_id, None)
+            self._schemas.pop(database_id, None)
+
+    # --- Şemalar ---
+
+    def get_schema(self, database_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Database şemasını (databases.retrieve yanıtı) getirir.
+
+        Args:
+            database_id: Database ID'si
+
+        Returns:
+            Optional[Dict[str, Any]]: Şema
+        """
+        with self._lock:
+            if database_id not in self._schemas:
+                found = self._conn.execute(
+                    "SELECT data FROM schemas WHERE database_id = ?", (database_id,)
+                ).fetchone()
+                if not found:
+                    return None
+                self._schemas[database_id] = json.loads(found[0])
+            return self._schemas[database_id]
+
+    def set_schema(self, database_id: str, schema: Dict[str, Any]) -> None:
+        schema = {key: schema.get(key) for key in ("id", "last_edited_time", "properties")}
+        with self._lock, self._conn:
+            self._schemas[database_id] = schema
+            self._conn.execute(
+                "INSERT OR REPLACE INTO schemas VALUES (?, ?, ?)",
+                (database_id, json.dumps(schema, ensure_ascii=False), time.time())
+            )
+
+    def forget_schema(self, database_id: str) -> None:
+        with self._lock, self._conn:
+            self._schemas.pop(database_id, None)
+            self._conn.execute("DELETE FROM schemas WHERE database_id = ?", (database_id,))
+
+    # --- Satır indeksi ---
+
+    def _load_rows(self, database_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        rows = self._rows.get(database_id)
+        if rows is None and self.watermark(database_id) is not None:
+            rows = {}
+            for page_id, data in self._conn.execute(
+                "SELECT page_id, data FROM rows WHERE database_id = ? ORDER BY rowid", (database_id,)
+            ):
+                rows[page_id] = json.loads(data)
+            self._rows[database_id] = rows
+        return rows
+
+    def get_rows(self, database_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Database'in önbellekteki satırlarını getirir.
+
+        Args:
+            database_id: Database ID'si
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Satırlar; hiç senkronize edilmediyse None
+        """
+        with self._lock:
+            rows = self._load_rows(database_id)
+            return list(rows.values()) if rows is not None else None
+
+    def get_row(self, database_id: str, page_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Tek satırı (son bilinen özellikleriyle) getirir.
+
+        Args:
+            database_id: Database ID'si
+            page_id: Satırın page ID'si
+
+        Returns:
+            Optional[Dict[str, Any]]: Satır
+        """
+        with self._lock:
+            rows = self._load_rows(database_id)
+            return rows.get(page_id) if rows else None
+
+    def watermark(self, database_id: str) -> Optional[str]:
+        """
+        Database'in en son görülen satır değişiklik zamanını getirir.
+
+        Args:
+            database_id: Database ID'si
+
+        Returns:
+            Optional[str]: ISO zaman damgası; hiç senkronize edilmediyse None
+                (senkronize edilmiş boş database için boş string)
+        """
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT last_edited_time FROM watermarks WHERE database_id = ?", (database_id,)
+            ).fetchone()
+        return (found[0] or "") if found else None
+
+    def store_rows(self, database_id: str, rows: Iterable[Dict[str, Any]], replace: bool = False) -> None:
+        """
+        Satırları önbelleğe yazar ve su seviyesini ilerletir.
+
+        Args:
+            database_id: Database ID'si
+            rows: databases.query sonuç satırları
+            replace: True ise önceki satırlar silinir (tam senkronizasyon)
+        """
+        rows = [_compact_row(row) for row in rows]
+        with self._lock, self._conn:
+            cached = {} if replace else (self._load_rows(database_id) or {})
+            if replace:
+                self._conn.execute("DELETE FROM rows WHERE database_id = ?", (database_id,))
+            watermark = "" if replace else (self.watermark(database_id) or "")
+            for row in rows:
+                cached[row["id"]] = row
+                watermark = max(watermark, row.get("last_edited_time") or "")
+            # Tek işlemde toplu yazma
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+                [(database_id, row["id"], row.get("last_edited_time"), json.dumps(row, ensure_ascii=False))
+                 for row in rows]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)", (database_id, watermark, time.time())
+            )
+            self._rows[database_id] = cached
+
+    def update_row(self, database_id: str, row: Dict[str, Any]) -> None:
+        """
+        Tek satırı (örn. pages.update yanıtı) günceller; su seviyesi değişmez,
+        çünkü araya başka istemcilerin değişiklikleri girmiş olabilir.
+
+        Args:
+            database_id: Database ID'si
+            row: Satır
+        """
+        row = _compact_row(row)
+        with self._lock, self._conn:
+            rows = self._load_rows(database_id)
+            if rows is None:
+                return
+            rows[row["id"]] = row
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+                (database_id, row["id"], row.get("last_edited_time"), json.dumps(row, ensure_ascii=False))
+            )
+
+    def forget_row(self, database_id: str, page_id: str) -> None:
+        with self._lock, self._conn:
+            rows = self._load_rows(database_id)
+            if rows:
+                rows.pop(page_id, None)
+            self._conn.execute("DELETE FROM rows WHERE database_id = ? AND page_id = ?", (database_id, page_id))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CacheRevalidator:
+    """
+    Önbelleği arka planda periyodik olarak Notion'la doğrulayan thread.
+    """
+
+    def __init__(self, clients: List[Any], logger: logging.Logger, interval: float = 300):
+        """
+        Doğrulayıcıyı hazırlar.
+
+        Args:
+            clients: revalidate_cache() metodu olan NotionClient'lar
+            logger: Logger instance
+            interval: Doğrulama aralığı (saniye); ilk doğrulama hemen yapılır
+        """
+        self.clients = clients
+        self.logger = logger
+        self.interval = interval
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="notion-cache-revalidate", daemon=True)
+
+    def _run(self) -> None:
+        while True:
+            for client in self.clients:
+                if self._stop.is_set():
+                    return
+                try:
+                    client.revalidate_cache()
+                except Exception as e:
+                    self.logger.warning("Notion önbelleği doğrulanamadı: %s", e)
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,565 @@
+"""
+Notion Stand-in
+
+Bot'un kullandığı Notion API endpoint'lerini taklit eden yerel HTTP sunucusu.
+Ağ erişimi olmadan NotionClient / Updater testleri ve yük benchmark'ları için
+kullanılır; NotionClient(base_url=standin.base_url) ile bağlanılır.
+
+Desteklenen endpoint'ler:
+    GET   /v1/blocks/{id}/children     (start_cursor / page_size)
+    PATCH /v1/blocks/{id}/children     (children, en fazla 100 blok)
+    POST  /v1/databases/{id}/query     (filter / start_cursor / page_size / sorts)
+    GET   /v1/databases/{id}
+    PATCH /v1/pages/{id}
+
+Kullanım:
+    python src/utils/notion_standin.py --days 3 --rows 200 --latency 0.05
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+TURKISH_WEEKDAYS = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar"]
+
+SEED_FIRST_NAMES = ["Ahmet", "Ayşe", "Mehmet", "Zeynep", "Emre", "Gülşen", "Çağrı", "Şule", "İbrahim", "Özge"]
+SEED_LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Çelik", "Şahin", "Öztürk", "Aydın", "Arslan", "Doğan", "Koç"]
+SEED_STATUSES = ["Gidildi", "Gidilmedi", "Kaldı"]
+
+MAX_PAGE_SIZE = 100
+MAX_APPEND_CHILDREN = 100
+MAX_TEXT_CONTENT = 2000
+
+
+class StandInError(Exception):
+    """
+    Notion hata gövdesi olarak döndürülecek hata.
+    """
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _rich_text(content: str) -> List[Dict[str, Any]]:
+    return [{
+        "type": "text",
+        "text": {"content": content, "link": None},
+        "plain_text": content,
+        "href": None,
+    }]
+
+
+def _plain_text(prop: Dict[str, Any]) -> str:
+    return "".join(part.get("plain_text", "") for part in prop.get(prop.get("type"), []) or [])
+
+
+class NotionStandIn:
+    """
+    Bellekte tutulan sayfa/database verisini Notion API biçiminde sunan sunucu.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: Union[float, Tuple[float, float]] = 0.0,
+                 rate_limit_probability: float = 0.0, retry_after: float = 1,
+                 seed: Optional[int] = None):
+        """
+        Sunucuyu hazırlar.
+
+        Args:
+            host: Dinlenecek adres
+            port: Dinlenecek port (0 ise boş port seçilir)
+            latency: İstek başına gecikme (saniye) veya (min, max) aralığı
+            rate_limit_probability: Her isteğin 429 ile reddedilme olasılığı
+            retry_after: 429 yanıtlarındaki Retry-After değeri (saniye)
+            seed: Rastgelelik tohumu (gecikme, 429 ve seed verisi için)
+        """
+        self.latency = latency
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+
+        self.parent_page_id = self._new_id()
+        self.blocks: Dict[str, List[Dict[str, Any]]] = {self.parent_page_id: []}
+        self.databases: Dict[str, Dict[str, Any]] = {}
+        self.rows: Dict[str, List[str]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter = Counter()
+        self._forced_429 = 0
+        self._lock = threading.RLock()
+
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Başlık ve gövde ayrı yazıldığı için keep-alive bağlantılarda Nagle ~40ms gecikme ekler
+            disable_nagle_algorithm = True
+
+            def _handle(handler, verb: str) -> None:
+                standin._serve(handler, verb)
+
+            def do_GET(handler):
+                handler._handle("GET")
+
+            def do_POST(handler):
+                handler._handle("POST")
+
+            def do_PATCH(handler):
+                handler._handle("PATCH")
+
+            def log_message(handler, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="notion-standin", daemon=True)
+
+    # --- Sunucu ---
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.httpd.server_address[0]}:{self.port}"
+
+    def start(self) -> "NotionStandIn":
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def inject_429(self, count: int = 1) -> None:
+        """
+        Sonraki `count` isteği 429 (rate_limited) ile reddeder.
+
+        Args:
+            count: Reddedilecek istek sayısı
+        """
+        with self._lock:
+            self._forced_429 += count
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+    @property
+    def total_requests(self) -> int:
+        return sum(count for key, count in self.requests.items() if key != "rate_limited")
+
+    # --- Seed verisi ---
+
+    @staticmethod
+    def _new_id() -> str:
+        return str(uuid.uuid4())
+
+    def add_date_page(self, day: date, rows: List[Tuple[str, str]],
+                      status_type: str = "status", as_database: bool = False,
+                      filler_blocks: int = 0) -> Tuple[str, str]:
+        """
+        Ana sayfanın altına bir tarih sayfası (veya doğrudan tarih başlıklı database) ekler.
+
+        Args:
+            day: Tarih
+            rows: (isim, durum) satırları
+            status_type: Durum kolonunun tipi ("status" veya "select")
+            as_database: True ise database doğrudan ana sayfanın altına eklenir
+            filler_blocks: Tarih sayfasına database'den önce eklenecek paragraf sayısı
+
+        Returns:
+            Tuple[str, str]: (sayfa ID, database ID); as_database ise ikisi aynıdır
+        """
+        title = f"{day.strftime('%d.%m.%Y')} {TURKISH_WEEKDAYS[day.weekday()]}"
+        with self._lock:
+            db_id = self._new_id()
+            options = [{"name": name, "id": name.lower(), "color": "default"} for name in SEED_STATUSES]
+            self.databases[db_id] = {
+                "object": "database",
+                "id": db_id,
+                "title": _rich_text(title),
+                "created_time": _now_iso(),
+                "last_edited_time": _now_iso(),
+                "properties": {
+                    "İsim": {"id": "title", "name": "İsim", "type": "title", "title": {}},
+                    "Durum": {"id": "durum", "name": "Durum", "type": status_type, status_type: {"options": options}},
+                    "Not": {"id": "not", "name": "Not", "type": "rich_text", "rich_text": {}},
+                },
+            }
+            self.rows[db_id] = []
+            for name, status in rows:
+                self.add_row(db_id, name, status)
+
+            db_block = {"object": "block", "id": db_id, "type": "child_database",
+                        "child_database": {"title": title}, "has_children": False}
+            if as_database:
+                self.blocks[self.parent_page_id].append(db_block)
+                return db_id, db_id
+
+            page_id = self._new_id()
+            self.blocks[self.parent_page_id].append({
+                "object": "block", "id": page_id, "type": "child_page",
+                "child_page": {"title": title}, "has_children": True,
+            })
+            self.blocks[page_id] = [
+                {"object": "block", "id": self._new_id(), "type": "paragraph",
+                 "paragraph": {"rich_text": _rich_text(f"Not {i + 1}")}, "has_children": False}
+                for i in range(filler_blocks)
+            ] + [db_block]
+            return page_id, db_id
+
+    def add_row(self, database_id: str, name: str, status: Optional[str] = None) -> str:
+        """
+        Database'e bir satır ekler.
+
+        Args:
+            database_id: Database ID'si
+            name: İsim (title)
+            status: Durum
+
+        Returns:
+            str: Satırın page ID'si
+        """
+        with self._lock:
+            status_type = self.databases[database_id]["properties"]["Durum"]["type"]
+            page_id = self._new_id()
+            now = _now_iso()
+            self.pages[page_id] = {
+                "object": "page",
+                "id": page_id,
+                "created_time": now,
+                "last_edited_time": now,
+                "archived": False,
+                "parent": {"type": "database_id", "database_id": database_id},
+                "properties": {
+                    "İsim": {"id": "title", "type": "title", "title": _rich_text(name)},
+                    "Durum": {"id": "durum", "type": status_type,
+                              status_type: {"name": status} if status else None},
+                    "Not": {"id": "not", "type": "rich_text", "rich_text": []},
+                },
+            }
+            self.rows[database_id].append(page_id)
+            return page_id
+
+    def seed(self, days: int = 2, rows_per_day: int = 50, end: Optional[date] = None,
+             filler_blocks: int = 0, extra_pages: int = 0) -> List[Tuple[str, str, str]]:
+        """
+        Bugünden geriye `days` gün için tarih sayfaları ve rastgele Türkçe isimli satırlar üretir.
+
+        Args:
+            days: Gün sayısı
+            rows_per_day: Gün başına satır sayısı
+            end: Son gün (varsayılan bugün)
+            filler_blocks: Her tarih sayfasındaki ek paragraf sayısı
+            extra_pages: Ana sayfaya eklenecek tarihsiz sayfa sayısı (sayfalama yükü için)
+
+        Returns:
+            List[Tuple[str, str, str]]: (gg.aa.yyyy, sayfa ID, database ID)
+        """
+        end = end or date.today()
+        created = []
+        with self._lock:
+            for i in range(extra_pages):
+                page_id = self._new_id()
+                self.blocks[self.parent_page_id].append({
+                    "object": "block", "id": page_id, "type": "child_page",
+                    "child_page": {"title": f"Arşiv {i + 1}"}, "has_children": False,
+                })
+                self.blocks[page_id] = []
+            for offset in range(days - 1, -1, -1):
+                day = end - timedelta(days=offset)
+                rows = [
+                    (f"{self.random.choice(SEED_FIRST_NAMES)} {self.random.choice(SEED_LAST_NAMES)} {n + 1}",
+                     self.random.choice(SEED_STATUSES + [None]))
+                    for n in range(rows_per_day)
+                ]
+                page_id, db_id = self.add_date_page(day, rows, filler_blocks=filler_blocks)
+                created.append((day.strftime("%d.%m.%Y"), page_id, db_id))
+        return created
+
+    def row_names(self, database_id: str) -> List[str]:
+        with self._lock:
+            return [_plain_text(self.pages[page_id]["properties"]["İsim"]) for page_id in self.rows[database_id]]
+
+    def row_status(self, page_id: str) -> Optional[str]:
+        with self._lock:
+            prop = self.pages[page_id]["properties"]["Durum"]
+            value = prop.get(prop["type"])
+            return value.get("name") if value else None
+
+    # --- İstek işleme ---
+
+    def _serve(self, handler: BaseHTTPRequestHandler, verb: str) -> None:
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        parsed = urlparse(handler.path)
+        headers = {}
+
+        try:
+            self._delay()
+            with self._lock:
+                limited = self._forced_429 > 0 or (
+                    self.rate_limit_probability and self.random.random() < self.rate_limit_probability
+                )
+                if self._forced_429 > 0:
+                    self._forced_429 -= 1
+                if limited:
+                    self.requests["rate_limited"] += 1
+                    headers["Retry-After"] = str(self.retry_after)
+                    raise StandInError(429, "rate_limited", "You have been rate limited. Please try again in a few minutes.")
+
+            body = json.loads(raw.decode("utf-8")) if raw else {}
+            status, payload = 200, self._route(verb, parsed.path, parse_qs(parsed.query), body)
+        except StandInError as e:
+            status, payload = e.status, {"object": "error", "status": e.status, "code": e.code, "message": e.message}
+        except json.JSONDecodeError:
+            status, payload = 400, {"object": "error", "status": 400, "code": "invalid_json",
+                                    "message": "Error parsing JSON body."}
+
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _delay(self) -> None:
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            with self._lock:
+                latency = self.random.uniform(latency[0], latency[1])
+        if latency:
+            time.sleep(latency)
+
+    def _route(self, verb: str, path: str, query: Dict[str, List[str]], body: Dict[str, Any]) -> Dict[str, Any]:
+        match = re.fullmatch(r"/v1/blocks/([^/]+)/children", path)
+        if match and verb == "GET":
+            self.requests["blocks.children.list"] += 1
+            return self._list_children(match.group(1), query)
+        if match and verb == "PATCH":
+            self.requests["blocks.children.append"] += 1
+            return self._append_children(match.group(1), body)
+
+        match = re.fullmatch(r"/v1/databases/([^/]+)/query", path)
+        if match and verb == "POST":
+            self.requests["databases.query"] += 1
+            return self._query_database(match.group(1), body)
+
+        match = re.fullmatch(r"/v1/databases/([^/]+)", path)
+        if match and verb == "GET":
+            self.requests["databases.retrieve"] += 1
+            return self._get_database(match.group(1))
+
+        match = re.fullmatch(r"/v1/pages/([^/]+)", path)
+        if match and verb == "PATCH":
+            self.requests["pages.update"] += 1
+            return self._update_page(match.group(1), body)
+
+        raise StandInError(400, "invalid_request_url", f"Invalid request URL: {verb} {path}")
+
+    @staticmethod
+    def _paginate(items: List[Any], start_cursor: Optional[str], page_size: Any) -> Dict[str, Any]:
+        try:
+            page_size = int(page_size or MAX_PAGE_SIZE)
+            start = int(start_cursor) if start_cursor else 0
+        except ValueError:
+            raise StandInError(400, "validation_error", "start_cursor or page_size is invalid.")
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise StandInError(400, "validation_error", f"page_size should be between 1 and {MAX_PAGE_SIZE}.")
+
+        chunk = items[start:start + page_size]
+        has_more = start + page_size < len(items)
+        return {
+            "object": "list",
+            "results": chunk,
+            "next_cursor": str(start + page_size) if has_more else None,
+            "has_more": has_more,
+        }
+
+    def _list_children(self, block_id: str, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        with self._lock:
+            if block_id not in self.blocks:
+                raise StandInError(404, "object_not_found", f"Could not find block with ID: {block_id}.")
+            children = list(self.blocks[block_id])
+        response = self._paginate(children, (query.get("start_cursor") or [None])[0],
+                                  (query.get("page_size") or [None])[0])
+        response["type"] = "block"
+        response["block"] = {}
+        return response
+
+    def _append_children(self, block_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        children = body.get("children")
+        if not isinstance(children, list) or not children:
+            raise StandInError(400, "validation_error", "body.children should be a non-empty array.")
+        if len(children) > MAX_APPEND_CHILDREN:
+            raise StandInError(400, "validation_error",
+                               f"body.children.length should be ≤ `{MAX_APPEND_CHILDREN}`, instead was `{len(children)}`.")
+        created = []
+        for index, child in enumerate(children):
+            kind = child.get("type")
+            if not kind or kind not in child:
+                raise StandInError(400, "validation_error", f"body.children[{index}] should define its type.")
+            for part in child[kind].get("rich_text", []):
+                if len(part.get("text", {}).get("content", "")) > MAX_TEXT_CONTENT:
+                    raise StandInError(400, "validation_error",
+                                       f"body.children[{index}] text.content.length should be ≤ `{MAX_TEXT_CONTENT}`.")
+            block = {"object": "block", "id": self._new_id(), "type": kind, "has_children": False,
+                     kind: json.loads(json.dumps(child[kind]))}
+            for part in block[kind].get("rich_text", []):
+                part.setdefault("plain_text", part.get("text", {}).get("content", ""))
+            created.append(block)
+        with self._lock:
+            if block_id not in self.blocks:
+                raise StandInError(404, "object_not_found", f"Could not find block with ID: {block_id}.")
+            self.blocks[block_id].extend(created)
+        return {"object": "list", "results": created, "next_cursor": None, "has_more": False,
+                "type": "block", "block": {}}
+
+    def _get_database(self, database_id: str) -> Dict[str, Any]:
+        with self._lock:
+            database = self.databases.get(database_id)
+            if not database:
+                raise StandInError(404, "object_not_found", f"Could not find database with ID: {database_id}.")
+            return json.loads(json.dumps(database))
+
+    def _query_database(self, database_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if database_id not in self.databases:
+                raise StandInError(404, "object_not_found", f"Could not find database with ID: {database_id}.")
+            rows = [self.pages[page_id] for page_id in self.rows[database_id]]
+            if body.get("filter"):
+                rows = [row for row in rows if self._matches(row, body["filter"])]
+            for sort in reversed(body.get("sorts") or []):
+                key = sort.get("timestamp") or sort.get("property")
+                if key not in ("last_edited_time", "created_time"):
+                    raise StandInError(400, "validation_error", f"Unsupported sort: {key}")
+                rows.sort(key=lambda row: row[key], reverse=sort.get("direction") == "descending")
+            # Sadece dönen sayfa kopyalanır (büyük database'lerde her sayfada tüm satırlar kopyalanmasın)
+            response = self._paginate(rows, body.get("start_cursor"), body.get("page_size"))
+            response["results"] = json.loads(json.dumps(response["results"]))
+        response["type"] = "page_or_database"
+        response["page_or_database"] = {}
+        return response
+
+    def _matches(self, row: Dict[str, Any], condition: Dict[str, Any]) -> bool:
+        if "and" in condition:
+            return all(self._matches(row, sub) for sub in condition["and"])
+        if "or" in condition:
+            return any(self._matches(row, sub) for sub in condition["or"])
+
+        if "timestamp" in condition:
+            key = condition["timestamp"]
+            operator, value = next(iter(condition[key].items()))
+            actual = row[key]
+            return {
+                "after": actual > value,
+                "on_or_after": actual >= value,
+                "before": actual < value,
+                "on_or_before": actual <= value,
+                "equals": actual == value,
+            }.get(operator, False)
+
+        prop = row["properties"].get(condition.get("property"))
+        if prop is None:
+            raise StandInError(400, "validation_error", f"Could not find property: {condition.get('property')}")
+        for kind in ("title", "rich_text"):
+            if kind in condition:
+                operator, value = next(iter(condition[kind].items()))
+                text = _plain_text(prop).lower()
+                value = str(value).lower()
+                if operator == "contains":
+                    return value in text
+                if operator == "equals":
+                    return text == value
+                if operator == "starts_with":
+                    return text.startswith(value)
+                if operator == "is_empty":
+                    return not text
+                raise StandInError(400, "validation_error", f"Unsupported {kind} filter: {operator}")
+        for kind in ("status", "select"):
+            if kind in condition:
+                operator, value = next(iter(condition[kind].items()))
+                current = (prop.get(prop["type"]) or {}).get("name")
+                if operator == "equals":
+                    return current == value
+                if operator == "does_not_equal":
+                    return current != value
+                if operator == "is_empty":
+                    return current is None
+                raise StandInError(400, "validation_error", f"Unsupported {kind} filter: {operator}")
+        raise StandInError(400, "validation_error", f"Unsupported filter: {list(condition)}")
+
+    def _update_page(self, page_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            page = self.pages.get(page_id)
+            if not page:
+                raise StandInError(404, "object_not_found", f"Could not find page with ID: {page_id}.")
+            for name, value in (body.get("properties") or {}).items():
+                prop = page["properties"].get(name)
+                if prop is None:
+                    raise StandInError(400, "validation_error", f"{name} is not a property that exists.")
+                kind = prop["type"]
+                if kind not in value:
+                    raise StandInError(400, "validation_error", f"{name} is expected to be {kind}.")
+                if kind in ("status", "select"):
+                    options = self.databases[page["parent"]["database_id"]]["properties"][name][kind]["options"]
+                    option_name = (value[kind] or {}).get("name")
+                    if option_name is not None and option_name not in {o["name"] for o in options}:
+                        if kind == "status":
+                            raise StandInError(400, "validation_error", f"Invalid status option: {option_name}")
+                        options.append({"name": option_name, "id": option_name.lower(), "color": "default"})
+                    prop[kind] = {"name": option_name} if option_name is not None else None
+                elif kind in ("title", "rich_text"):
+                    prop[kind] = _rich_text("".join(
+                        part.get("text", {}).get("content", "") for part in value[kind]
+                    ))
+                else:
+                    prop[kind] = value[kind]
+            page["last_edited_time"] = _now_iso()
+            return json.loads(json.dumps(page))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel Notion API stand-in sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--days", type=int, default=2, help="Tarih sayfası sayısı")
+    parser.add_argument("--rows", type=int, default=50, help="Gün başına satır sayısı")
+    parser.add_argument("--latency", type=float, default=0.0, help="İstek başına gecikme (saniye)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 olasılığı (0-1)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    standin = NotionStandIn(args.host, args.port, latency=args.latency,
+                            rate_limit_probability=args.rate_limit, seed=args.seed)
+    for date_str, page_id, db_id in standin.seed(args.days, args.rows):
+        print(f"{date_str}: sayfa={page_id} database={db_id}")
+    print(f"parent_page_id: {standin.parent_page_id}")
+    print(f"Notion stand-in: {standin.base_url} (Ctrl+C ile durdur)")
+    try:
+        standin.httpd.serve_forever()
+    except KeyboardInterrupt:
+        standin.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+PID File
+
+Aynı bot'un iki kez başlatılmasını (örn. GUI'den tekrar "Başlat") önleyen
+PID dosyası.
+"""
+
+import os
+from typing import Optional
+
+
+def pid_alive(pid: int) -> bool:
+    """
+    Süreç hâlâ çalışıyor mu kontrol eder.
+
+    Args:
+        pid: Süreç kimliği
+
+    Returns:
+        bool: Çalışıyor mu
+    """
+    if pid <= 0:
+        return False
+    if os.name == "nt":
+        # Windows'ta os.kill(pid, 0) süreci sonlandırır; OpenProcess ile sorgulanır
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class PidFile:
+    """
+    Tek örnek kilidi olarak kullanılan PID dosyası.
+    """
+
+    def __init__(self, path: str = "config/bot.pid"):
+        """
+        Args:
+            path: PID dosyası yolu
+        """
+        self.path = path
+        self.acquired = False
+
+    def running_pid(self) -> Optional[int]:
+        """
+        Dosyadaki süreç çalışıyorsa PID'ini döndürür.
+
+        Returns:
+            Optional[int]: Çalışan bot'un PID'i
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                pid = int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return None
+        return pid if pid_alive(pid) else None
+
+    def acquire(self) -> bool:
+        """
+        PID dosyasını bu süreç için oluşturur; eski (ölü sürece ait) dosya silinir.
+
+        Returns:
+            bool: Kilit alındı mı (False: başka bir bot çalışıyor)
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self.running_pid():
+                    return False
+                try:
+                    os.remove(self.path)
+                except FileNotFoundError:
+                    pass
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(str(os.getpid()))
+            self.acquired = True
+            return True
+        return False
+
+    def release(self) -> None:
+        if not self.acquired:
+            return
+        self.acquired = False
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,123 @@
+"""
+Profiler
+
+Tarama döngülerinin cProfile ile profilini çıkaran ve WebDriver / Notion HTTP
+çağrılarında beklenen süreyi ayrıştıran yardımcı.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+from datetime import datetime
+from typing import Dict, Tuple
+
+# (dosya yolu son eki, fonksiyon adı) → kategori
+BLOCKING_CALLS = {
+    "webdriver_http": ("selenium/webdriver/remote/remote_connection.py", "_request"),
+    "notion_http": ("notion_client/client.py", "request"),
+    "sleep": ("~", "<built-in method time.sleep>"),
+}
+
+
+class ScanProfiler:
+    """
+    Birden fazla tarama döngüsünü tek bir profilde toplayan sınıf.
+    Profil sadece enable()/disable() arasında çalışır; döngüler arası bekleme hariç tutulur.
+    """
+
+    def __init__(self, label: str = "scan", output_dir: str = "logs"):
+        """
+        Profiler'ı başlatır.
+
+        Args:
+            label: Çıktı dosya adında kullanılacak etiket
+            output_dir: Profil ve özetin yazılacağı klasör
+        """
+        self.label = label
+        self.output_dir = output_dir
+        self.profile = cProfile.Profile()
+        self.cycles = 0
+
+    def enable(self) -> None:
+        self.profile.enable()
+
+    def disable(self) -> None:
+        """
+        Profili durdurur ve bir döngü tamamlanmış sayar.
+        """
+        self.profile.disable()
+        self.cycles += 1
+
+    def blocking_breakdown(self, stats: pstats.Stats) -> Dict[str, float]:
+        """
+        Bilinen bloklayan çağrılarda geçen kümülatif süreyi hesaplar.
+
+        Args:
+            stats: pstats.Stats instance
+
+        Returns:
+            Dict[str, float]: Kategori → saniye
+        """
+        breakdown = {category: 0.0 for category in BLOCKING_CALLS}
+        for (filename, _line, func), (_cc, _nc, _tt, ct, _callers) in stats.stats.items():
+            path = filename.replace("\\", "/")
+            for category, (suffix, name) in BLOCKING_CALLS.items():
+                if func == name and path.endswith(suffix):
+                    breakdown[category] += ct
+        return breakdown
+
+    def write_report(self, logger=None, top: int = 25) -> Tuple[str, str]:
+        """
+        Profili .prof olarak ve en sıcak noktaların özetini .txt olarak yazar.
+
+        Args:
+            logger: Özet satırlarının yazılacağı logger (opsiyonel)
+            top: Özette listelenecek fonksiyon sayısı
+
+        Returns:
+            Tuple[str, str]: (.prof yolu, özet yolu)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.output_dir, f"profile_{self.label}_{stamp}")
+        prof_path = base + ".prof"
+        summary_path = base + ".txt"
+
+        self.profile.dump_stats(prof_path)
+
+        buffer = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=buffer)
+        total = stats.total_tt
+        breakdown = self.blocking_breakdown(stats)
+        python_time = max(0.0, total - sum(breakdown.values()))
+
+        header = [
+            f"Profil: {self.label} ({self.cycles} döngü)",
+            f"Toplam süre: {total:.2f}s"
+            + (f" (döngü başına {total / self.cycles:.2f}s)" if self.cycles else ""),
+            f"  WebDriver HTTP: {breakdown['webdriver_http']:.2f}s ({self._percent(breakdown['webdriver_http'], total)})",
+            f"  Notion HTTP:    {breakdown['notion_http']:.2f}s ({self._percent(breakdown['notion_http'], total)})",
+            f"  time.sleep:     {breakdown['sleep']:.2f}s ({self._percent(breakdown['sleep'], total)})",
+            f"  Diğer (Python): {python_time:.2f}s ({self._percent(python_time, total)})",
+        ]
+
+        buffer.write("\n".join(header) + "\n\n")
+        buffer.write(f"=== Kümülatif süreye göre ilk {top} ===\n")
+        stats.sort_stats("cumulative").print_stats(top)
+        buffer.write(f"=== Kendi süresine göre ilk {top} ===\n")
+        stats.sort_stats("tottime").print_stats(top)
+
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(buffer.getvalue())
+
+        if logger:
+            for line in header:
+                logger.info("%s", line)
+            logger.info("📝 Profil yazıldı: %s / %s", prof_path, summary_path)
+
+        return prof_path, summary_path
+
+    @staticmethod
+    def _percent(part: float, total: float) -> str:
+        return f"%{part / total * 100:.0f}" if total else "%0"
@@ -0,0 +1,131 @@
+"""
+Rate Limiter
+
+Notion API istekleri için token bucket hız sınırlayıcı ve birden fazla bot
+sürecinin aynı sınırlayıcıyı paylaşmasını sağlayan yerel IPC sunucusu.
+"""
+
+import threading
+import time
+from multiprocessing.managers import BaseManager, BaseProxy
+from typing import Optional, Tuple
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket. Notion entegrasyon başına ortalama ~3 istek/saniye kabul eder.
+    """
+
+    def __init__(self, rate: float = 3.0, burst: Optional[float] = None):
+        """
+        Sınırlayıcıyı başlatır.
+
+        Args:
+            rate: Saniyede eklenen token (istek) sayısı
+            burst: Kova kapasitesi (varsayılan rate)
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0, now: Optional[float] = None) -> float:
+        """
+        Token ayırır ve isteğin kaç saniye bekledikten sonra yapılabileceğini döndürür.
+        Bekleme süresi çağıranın tarafında uygulanır; sınırlayıcı kilitte beklemez.
+
+        Args:
+            tokens: Ayrılacak token sayısı
+            now: Şu anki zaman (time.monotonic)
+
+        Returns:
+            float: Beklenmesi gereken süre (saniye)
+        """
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Token alınana kadar bekler.
+
+        Args:
+            tokens: Ayrılacak token sayısı
+
+        Returns:
+            float: Beklenen süre (saniye)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiterProxy(BaseProxy):
+    """
+    Paylaşılan sınırlayıcının istemci tarafı. reserve() sunucuda çalışır,
+    bekleme istemci sürecinde yapılır.
+    """
+
+    _exposed_ = ("reserve",)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        return self._callmethod("reserve", (tokens,))
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiterManager(BaseManager):
+    pass
+
+
+RateLimiterManager.register("get_rate_limiter", proxytype=RateLimiterProxy)
+
+
+def serve_rate_limiter(limiter: RateLimiter, authkey: bytes,
+                       address: Tuple[str, int] = ("127.0.0.1", 0)) -> Tuple[str, int]:
+    """
+    Sınırlayıcıyı bu süreçteki bir arka plan thread'inden sunar.
+
+    Args:
+        limiter: Paylaşılacak RateLimiter
+        authkey: İstemcilerin kullanacağı doğrulama anahtarı
+        address: Dinlenecek adres (port 0 ise boş port seçilir)
+
+    Returns:
+        Tuple[str, int]: Sunucunun gerçek adresi
+    """
+    class _ServerManager(BaseManager):
+        pass
+
+    _ServerManager.register("get_rate_limiter", callable=lambda: limiter, proxytype=RateLimiterProxy)
+    server = _ServerManager(address=address, authkey=authkey).get_server()
+    thread = threading.Thread(target=server.serve_forever, name="rate-limiter-server", daemon=True)
+    thread.start()
+    return server.address
+
+
+def connect_rate_limiter(address: Tuple[str, int], authkey: bytes) -> RateLimiterProxy:
+    """
+    Başka bir süreçte sunulan sınırlayıcıya bağlanır.
+
+    Args:
+        address: serve_rate_limiter() adresi
+        authkey: Doğrulama anahtarı
+
+    Returns:
+        RateLimiterProxy: acquire()/reserve() destekleyen vekil
+    """
+    manager = RateLimiterManager(address=tuple(address), authkey=authkey)
+    manager.connect()
+    return manager.get_rate_limiter()
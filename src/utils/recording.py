@@ -0,0 +1,267 @@
+"""
+Recording
+
+Canlı bir çalıştırmanın girdilerini (okunan mesajlar ve Notion yanıtları)
+sıkıştırılmış JSON lines dosyasına kaydeden ve kayıttan Notion yanıtlarını
+geri oynatan yardımcılar.
+
+Kayıt satırları:
+    {"type": "session", "version": 1, "started": "..."}
+    {"type": "notion", "t": 1.23, "method": "databases.query", "kwargs": {...}, "result": {...}}
+    {"type": "notion", "t": 1.30, "method": "pages.update", "kwargs": {...}, "error": {"status": 429, ...}}
+    {"type": "message", "t": 1.20, "id": "...", "text": "...", "database_id": "...", "page": "...", "outcome": "updated"}
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+RECORDING_VERSION = 1
+
+
+def _canonical(kwargs: Dict[str, Any]) -> str:
+    return json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class SessionRecorder:
+    """
+    Thread-safe kayıt yazıcı (gzip JSON lines).
+    """
+
+    def __init__(self, path: str):
+        """
+        Kaydı başlatır.
+
+        Args:
+            path: Kayıt dosyası (.jsonl.gz); strftime biçimleri açılır
+        """
+        self.path = datetime.now().strftime(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._write({"type": "session", "version": RECORDING_VERSION,
+                     "started": datetime.now().isoformat(timespec="seconds")})
+
+    def _write(self, entry: Dict[str, Any], flush: bool = False) -> None:
+        line = json.dumps(entry, ensure_ascii=False, default=str, separators=(",", ":"))
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            if flush:
+                self._file.flush()
+
+    def _offset(self) -> float:
+        return round(time.monotonic() - self._started, 4)
+
+    def record_notion(self, method: str, kwargs: Dict[str, Any],
+                      result: Any = None, error: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Bir Notion API çağrısını ve yanıtını (veya hatasını) kaydeder.
+
+        Args:
+            method: API metodu (örn. databases.query)
+            kwargs: Çağrı argümanları
+            result: Yanıt
+            error: Hata bilgisi (status, code, message, retry_after)
+        """
+        entry = {"type": "notion", "t": self._offset(), "method": method, "kwargs": kwargs}
+        if error is not None:
+            entry["error"] = error
+        else:
+            entry["result"] = result
+        self._write(entry)
+
+    def record_message(self, message_id: str, text: str, database_id: Optional[str],
+                       page: Optional[str], outcome: str, started: Optional[float] = None,
+                       fallback: bool = False) -> None:
+        """
+        İşlenen bir mesajı ve sonucunu kaydeder.
+
+        Args:
+            message_id: Mesaj kimliği
+            text: Mesaj metni
+            database_id: Hedef database
+            page: NotionClient'ın ana sayfası (grup)
+            outcome: Updater sonucu (updated, not_found ...)
+            started: İşlemin başladığı an (time.monotonic); yoksa şimdi
+            fallback: Son günlerin database'leri de arandı mı
+        """
+        t = round((started if started is not None else time.monotonic()) - self._started, 4)
+        record = {"type": "message", "t": t, "id": message_id, "text": text,
+                  "database_id": database_id, "page": page, "outcome": outcome}
+        if fallback:
+            record["fallback"] = True
+        self._write(record, flush=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_recording(path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Kayıt dosyasını okur.
+
+    Args:
+        path: Kayıt dosyası (.jsonl.gz veya .jsonl)
+
+    Returns:
+        Tuple[List, List]: (mesajlar t'ye göre sıralı, Notion çağrıları kayıt sırasıyla)
+
+    Raises:
+        ValueError: Desteklenmeyen kayıt sürümü
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    messages, calls = [], []
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Yarıda kalmış son satır (kayıt sırasında kapanma)
+                break
+            kind = entry.get("type")
+            if kind == "session" and entry.get("version") != RECORDING_VERSION:
+                raise ValueError(f"Desteklenmeyen kayıt sürümü: {entry.get('version')}")
+            if kind == "message":
+                messages.append(entry)
+            elif kind == "notion":
+                calls.append(entry)
+    messages.sort(key=lambda entry: entry["t"])
+    return messages, calls
+
+
+class _ReplayPath:
+    """
+    `api.blocks.children.list(...)` gibi zincirleri metot adına çeviren vekil.
+    """
+
+    def __init__(self, api: "ReplayNotionAPI", path: str):
+        self._api = api
+        self._path = path
+
+    def __getattr__(self, name: str) -> "_ReplayPath":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _ReplayPath(self._api, f"{self._path}.{name}")
+
+    def __call__(self, **kwargs) -> Any:
+        return self._api.respond(self._path, kwargs)
+
+
+class ReplayNotionAPI:
+    """
+    notion_client.Client yerine geçen, kayıtlı yanıtları döndüren istemci.
+    NotionClient(..., client=ReplayNotionAPI(calls)) ile kullanılır.
+
+    Aynı argümanlarla yapılan çağrılar kayıt sırasıyla (FIFO) yanıtlanır; kayıtta
+    birebir karşılığı olmayan çağrıya aynı metot ve hedef ID için son yanıt verilir.
+    Yazma çağrıları (pages.update) karşılaştırma için ayrıca toplanır.
+    """
+
+    TARGET_KEYS = ("block_id", "database_id", "page_id")
+
+    def __init__(self, calls: List[Dict[str, Any]], include_rate_limits: bool = False):
+        """
+        Args:
+            calls: load_recording() Notion çağrıları
+            include_rate_limits: False ise kayıttaki 429 yanıtları atlanır
+                (geçicidirler; tam hızda oynatmada beklemeye yol açmasınlar)
+        """
+        self._exact: Dict[Tuple[str, str], deque] = defaultdict(deque)
+        self._latest: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.recorded_writes = []
+        self.writes = []
+        self.calls = 0
+        self.misses = 0
+
+        for call in calls:
+            error = call.get("error")
+            if error and error.get("status") == 429 and not include_rate_limits:
+                continue
+            self._exact[(call["method"], _canonical(call["kwargs"]))].append(call)
+            if call["method"] == "pages.update" and not error:
+                self.recorded_writes.append(self._write_key(call["kwargs"]))
+
+    def __getattr__(self, name: str) -> _ReplayPath:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _ReplayPath(self, name)
+
+    @staticmethod
+    def _write_key(kwargs: Dict[str, Any]) -> Tuple[str, str]:
+        return kwargs.get("page_id"), _canonical(kwargs.get("properties", {}))
+
+    def _target(self, method: str, kwargs: Dict[str, Any]) -> Tuple[str, Any]:
+        return method, tuple(kwargs.get(key) for key in self.TARGET_KEYS)
+
+    def respond(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Kayıtlı yanıtı döndürür (veya kayıtlı hatayı fırlatır).
+
+        Args:
+            method: API metodu
+            kwargs: Çağrı argümanları
+
+        Returns:
+            Any: Kayıtlı yanıt
+
+        Raises:
+            LookupError: Bu metot ve hedef için hiç kayıt yoksa
+        """
+        with self._lock:
+            self.calls += 1
+            if method == "pages.update":
+                self.writes.append(self._write_key(kwargs))
+            queue = self._exact.get((method, _canonical(kwargs)))
+            if queue:
+                call = queue.popleft() if len(queue) > 1 else queue[0]
+            else:
+                self.misses += 1
+                call = self._latest.get(self._target(method, kwargs))
+                if call is None:
+                    raise LookupError(f"Kayıtta karşılığı yok: {method} {_canonical(kwargs)[:200]}")
+            self._latest[self._target(method, kwargs)] = call
+
+        if call.get("error"):
+            raise self._api_error(call["error"])
+        return json.loads(json.dumps(call["result"]))
+
+    @staticmethod
+    def _api_error(error: Dict[str, Any]) -> Exception:
+        from httpx import Request, Response
+        from notion_client import APIResponseError
+
+        headers = {"retry-after": str(error["retry_after"])} if error.get("retry_after") is not None else {}
+        response = Response(error.get("status", 400), headers=headers,
+                            request=Request("POST", "https://api.notion.com/v1/replay"))
+        return APIResponseError(response, error.get("message", ""), error.get("code", ""))
+
+    def write_diff(self) -> Dict[str, int]:
+        """
+        Oynatmadaki yazmaları kayıttakilerle karşılaştırır.
+
+        Returns:
+            Dict[str, int]: matched, missing (kayıtta olup yapılmayan), extra (yeni yapılan)
+        """
+        recorded = list(self.recorded_writes)
+        missing = list(recorded)
+        extra = 0
+        for write in self.writes:
+            if write in missing:
+                missing.remove(write)
+            else:
+                extra += 1
+        return {"matched": len(recorded) - len(missing), "missing": len(missing), "extra": extra}
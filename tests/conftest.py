@@ -0,0 +1,25 @@
+"""
+Pytest ayarları
+
+Testlerin `core` ve `utils` paketlerini `src/` altından import edebilmesini sağlar
+ve ortak fikstürleri tanımlar.
+"""
+
+import os
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+@pytest.fixture
+def standin():
+    """Her test için boş, yerel Notion API stand-in sunucusu."""
+    from utils.notion_standin import NotionStandIn
+
+    server = NotionStandIn(seed=1).start()
+    yield server
+    server.stop()
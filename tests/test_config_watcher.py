@@ -0,0 +1,118 @@
+"""
+Test Config Watcher
+
+Çalışırken konfigürasyon yenileme, durum kuralları ve tek örnek PID dosyası testleri.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from core.message_parser import MessageParser
+from utils.config_loader import ConfigLoader
+from utils.config_watcher import ConfigWatcher
+from utils.pidfile import PidFile
+
+BASE_CONFIG = {
+    "whatsapp_group": "Grup",
+    "parent_page_id": "page-1",
+    "session_path": "session",
+    "headless": False,
+    "whatsapp": {"scan_interval": 5},
+}
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def info(self, *args):
+        pass
+
+    def error(self, message, *args):
+        self.errors.append(message % args)
+
+
+def _write(path, data):
+    path.write_text(data if isinstance(data, str) else json.dumps(data), encoding="utf-8")
+    # Aynı saniyede iki yazma mtime'ı değiştirmeyebilir
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_applies_changes_and_keeps_overrides(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, BASE_CONFIG)
+    config = ConfigLoader(str(path), overrides={"session_path": "worker-1"})
+    watcher = ConfigWatcher(config, _Logger(), poll_interval=0.01)
+    assert watcher.check() == set()
+
+    _write(path, {**BASE_CONFIG, "target_date": "28.09.2025", "whatsapp": {"scan_interval": 10}})
+    assert watcher.check() == {"target_date", "whatsapp"}
+    assert config.get_whatsapp_config()["scan_interval"] == 10
+    assert config.get("session_path") == "worker-1"
+    assert watcher.wait(0.05) == set()
+
+
+def test_wait_ends_early_when_woken(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, BASE_CONFIG)
+    watcher = ConfigWatcher(ConfigLoader(str(path)), _Logger(), poll_interval=5)
+    wake = threading.Event()
+    threading.Timer(0.05, wake.set).start()
+
+    start = time.monotonic()
+    assert watcher.wait(10, wake=wake) == set()
+    assert time.monotonic() - start < 1
+
+
+def test_invalid_config_keeps_previous_settings(tmp_path):
+    path = tmp_path / "config.json"
+    _write(path, BASE_CONFIG)
+    config = ConfigLoader(str(path))
+    logger = _Logger()
+    watcher = ConfigWatcher(config, logger, poll_interval=0.01)
+
+    for broken in ('{"whatsapp_group": ', {**BASE_CONFIG, "whatsapp": {"scan_interval": 0}},
+                   {**BASE_CONFIG, "target_date": "2025-09-28"},
+                   {**BASE_CONFIG, "status_rules": {"iptal": []}}):
+        _write(path, broken)
+        assert watcher.check() == set()
+        assert config.get_whatsapp_config()["scan_interval"] == 5 and not config.get("target_date")
+    assert len(logger.errors) == 4
+
+    _write(path, {**BASE_CONFIG, "status_rules": {"ertelendi": ["ertelendi"], "iptal": ["iptal"]}})
+    assert watcher.check() == {"status_rules"}
+
+
+def test_parser_status_rules_can_change_at_runtime():
+    parser = MessageParser()
+    assert parser.parse_message("Ahmet Yılmaz ertelendi") == {"name": "Ahmet Yılmaz", "status": "kaldı"}
+
+    parser.set_status_rules({"ertelendi": ["ertelendi", "ERTELE"], "iptal": ["iptal"]})
+    assert parser.parse_message("Ahmet Yılmaz ERTELE") == {"name": "Ahmet Yılmaz", "status": "ertelendi"}
+    assert parser.parse_message("Ayşe ertelendi iptal")["status"] == "ertelendi"
+    assert parser.parse_message("Mehmet gidildi")["status"] is None
+
+    parser.set_status_rules(None)
+    assert parser.parse_message("Mehmet gidildi")["status"] == "gidildi"
+
+
+def test_pid_file_blocks_second_instance(tmp_path):
+    path = str(tmp_path / "bot.pid")
+    first = PidFile(path)
+    assert first.acquire()
+    assert not PidFile(path).acquire()
+    first.release()
+    assert not os.path.exists(path)
+
+    # Ölmüş sürecin dosyası kilit sayılmaz
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    with open(path, "w") as f:
+        f.write(str(process.pid))
+    assert PidFile(path).running_pid() is None
+    assert PidFile(path).acquire()
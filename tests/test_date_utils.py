@@ -0,0 +1,45 @@
+"""
+Test Date Utils
+
+Tarih ayracı çözümleme testleri.
+"""
+
+from datetime import date
+
+from utils.date_utils import DATE_SEPARATOR_RE, date_range, resolve_date_label
+
+# 27.09.2025 bir cumartesi
+TODAY = date(2025, 9, 27)
+
+
+def test_relative_labels():
+    assert resolve_date_label("BUGÜN", TODAY) == TODAY
+    assert resolve_date_label("DÜN", TODAY) == date(2025, 9, 26)
+    assert resolve_date_label("Yesterday", TODAY) == date(2025, 9, 26)
+
+
+def test_weekday_labels_resolve_to_last_week():
+    assert resolve_date_label("Pazar", TODAY) == date(2025, 9, 21)
+    assert resolve_date_label("SALI", TODAY) == date(2025, 9, 23)
+    assert resolve_date_label("PAZARTESİ", TODAY) == date(2025, 9, 22)
+    assert resolve_date_label("Çarşamba", TODAY) == date(2025, 9, 24)
+    # Bugünün gün adı bir hafta önceyi gösterir
+    assert resolve_date_label("Cumartesi", TODAY) == date(2025, 9, 20)
+
+
+def test_numeric_labels():
+    assert resolve_date_label("27.09.2025", TODAY) == TODAY
+    assert resolve_date_label("21/09/25", TODAY) == date(2025, 9, 21)
+    assert resolve_date_label("31.02.2025", TODAY) is None
+    assert resolve_date_label("Merhaba", TODAY) is None
+
+
+def test_separator_pattern():
+    for label in ["Pazar", "Salı", "CUMARTESİ", "DÜN", "27-09-2025"]:
+        assert DATE_SEPARATOR_RE.match(label)
+    assert not DATE_SEPARATOR_RE.match("Pazar günü gidildi")
+
+
+def test_date_range_inclusive():
+    days = date_range(date(2025, 9, 21), TODAY)
+    assert days[0] == date(2025, 9, 21) and days[-1] == TODAY and len(days) == 7
@@ -0,0 +1,77 @@
+"""
+Test Day Mirror
+
+Arşivlenen günlük mesajların Notion tarih sayfasına 100'lük bloklarla,
+kaldığı yerden devam ederek eklenmesi (yerel Notion stand-in).
+"""
+
+import logging
+from datetime import date
+
+import pytest
+
+pytest.importorskip("notion_client")
+
+from core.day_mirror import DayMirror, message_block
+from core.notion_client import NotionClient
+from utils.message_archive import MessageArchive
+
+
+def _records(start, count, date_str="27.09.2025"):
+    return [{"id": f"m{i}", "text": f"Mesaj {i}", "meta": f"[10:{i % 60:02d}, {date_str}] Ali Veli: ",
+             "date": date_str} for i in range(start, start + count)]
+
+
+def _texts(standin, page_id):
+    return [block["paragraph"]["rich_text"][-1]["plain_text"]
+            for block in standin.blocks[page_id] if block["type"] == "paragraph"]
+
+
+@pytest.fixture
+def setup(tmp_path, standin):
+    page_id, _ = standin.add_date_page(date(2025, 9, 27), [("Ahmet Yılmaz", None)])
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url)
+    archive = MessageArchive(str(tmp_path / "archive.sqlite"))
+    return standin, page_id, client, archive
+
+
+def test_day_is_appended_in_batches_and_resumed(setup):
+    standin, page_id, client, archive = setup
+    archive.add_records("Grup", _records(0, 250))
+    mirror = DayMirror(client, archive, logging.getLogger("test"), "Grup", max_batches=2)
+
+    standin.inject_429(1)
+    assert mirror.mirror("27.09.2025") == 200
+    assert standin.requests["blocks.children.append"] == 2
+    assert archive.mirror_cursor("Grup", "27.09.2025") == "m199"
+
+    # Kalan 50 mesaj ve yeni gelenler sonraki çalıştırmada, tek çağrıda
+    archive.add_records("Grup", _records(240, 20))
+    standin.reset_counters()
+    assert mirror.mirror("27.09.2025") == 60
+    assert standin.requests["blocks.children.append"] == 1
+    assert _texts(standin, page_id) == [f"Mesaj {i}" for i in range(260)]
+
+    standin.reset_counters()
+    assert mirror.mirror("27.09.2025") == 0
+    assert standin.total_requests == 0
+
+
+def test_failed_batch_is_retried_next_run(setup):
+    standin, page_id, client, archive = setup
+    archive.add_records("Grup", _records(0, 3))
+    mirror = DayMirror(client, archive, logging.getLogger("test"), "Grup")
+    client._page_cache["27.09.2025"] = ("missing-page", 0)
+    assert mirror.mirror("27.09.2025") == 0
+    assert archive.mirror_cursor("Grup", "27.09.2025") is None
+
+    client._page_cache.clear()
+    assert mirror.mirror("27.09.2025") == 3
+    assert _texts(standin, page_id) == ["Mesaj 0", "Mesaj 1", "Mesaj 2"]
+
+
+def test_message_block_splits_long_text():
+    block = message_block({"time": "14:02", "sender": "Ayşe", "text": "a" * 4500})
+    parts = block["paragraph"]["rich_text"]
+    assert parts[0]["text"]["content"] == "14:02 Ayşe: " and parts[0]["annotations"]["bold"]
+    assert [len(part["text"]["content"]) for part in parts[1:]] == [2000, 2000, 500]
@@ -0,0 +1,47 @@
+"""
+Test Day Tracker
+
+Gün değişimi takibi testleri.
+"""
+
+import logging
+from datetime import datetime
+
+from core.day_tracker import DayTracker
+
+
+class FakeNotionClient:
+    def __init__(self, databases):
+        self.databases = databases
+        self.calls = []
+
+    def get_database_by_date(self, date_str):
+        self.calls.append(date_str)
+        return self.databases.get(date_str)
+
+
+LOGGER = logging.getLogger("test")
+
+
+def test_rollover_keeps_yesterday_during_late_window():
+    client = FakeNotionClient({"27.09.2025": "db27", "28.09.2025": "db28"})
+    tracker = DayTracker(client, LOGGER, late_report_hours=6)
+
+    assert tracker.watched_databases(datetime(2025, 9, 27, 23, 59)) == [("27.09.2025", "db27")]
+    assert tracker.watched_databases(datetime(2025, 9, 28, 0, 5)) == [
+        ("27.09.2025", "db27"), ("28.09.2025", "db28")
+    ]
+    assert tracker.watched_databases(datetime(2025, 9, 28, 7, 0)) == [("28.09.2025", "db28")]
+    assert tracker.current_date == "28.09.2025"
+
+
+def test_missing_database_is_skipped():
+    client = FakeNotionClient({"27.09.2025": "db27"})
+    tracker = DayTracker(client, LOGGER, late_report_hours=6)
+    assert tracker.watched_databases(datetime(2025, 9, 28, 1, 0)) == [("27.09.2025", "db27")]
+
+
+def test_fixed_date_ignores_clock():
+    client = FakeNotionClient({"27.09.2025": "db27"})
+    tracker = DayTracker(client, LOGGER, fixed_date="27.09.2025")
+    assert tracker.watched_dates(datetime(2025, 10, 5, 12, 0)) == ["27.09.2025"]
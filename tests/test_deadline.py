@@ -0,0 +1,35 @@
+"""
+Test Deadline
+
+Döngü zaman bütçesi testleri.
+"""
+
+from utils.deadline import Deadline, budget_timeout
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_waits_are_capped_by_remaining_budget():
+    clock = FakeClock()
+    deadline = Deadline(30, clock=clock)
+
+    assert deadline.timeout(10) == 10
+    clock.now += 25
+    assert deadline.timeout(10) == 5
+    assert not deadline.expired
+
+    clock.now += 7
+    assert deadline.expired
+    assert deadline.timeout(10) == 0
+    assert deadline.timeout(10, floor=0.5) == 0.5
+    assert deadline.overrun() == 2
+
+
+def test_budget_timeout_without_deadline():
+    assert budget_timeout(None, 10) == 10
@@ -0,0 +1,138 @@
+"""
+Test Group Monitor
+
+Tarama imleci ve sadece yeni mesajların işlenmesi testleri.
+"""
+
+import logging
+from datetime import datetime
+
+import pytest
+
+from core.group_monitor import GroupMonitor
+from utils.date_utils import format_date
+
+
+class FakeTracker:
+    def __init__(self, watched):
+        self.watched = watched
+        self.fixed_date = None
+
+    def watched_databases(self):
+        return self.watched
+
+
+class FakeListener:
+    def __init__(self, records):
+        self.records = records
+        self.cursors = []
+        self.last_scan_complete = True
+
+    def get_message_records_by_date(self, date_str):
+        self.cursors.append(None)
+        return self.records[date_str]
+
+    def get_message_records_by_date_range(self, start_date, end_date, cursor=None):
+        self.cursors.append(cursor)
+        return {date_str: self.records[date_str] for date_str in self.records}
+
+
+class FakeUpdater:
+    def __init__(self, outcomes=None):
+        self.outcomes = outcomes or {}
+        self.processed = []
+
+    def process_text(self, text, database_id=None, **kwargs):
+        self.processed.append(text)
+        return self.outcomes.get(text, "updated")
+
+
+def _record(data_id, text, date_str="27.09.2025"):
+    return {"id": data_id, "text": text, "meta": None, "date": date_str}
+
+
+def test_cursor_is_passed_and_only_new_messages_are_processed():
+    listener = FakeListener({"27.09.2025": [_record("m1", "Ali gidildi"), _record("m2", "Can iptal")]})
+    updater = FakeUpdater({"Can iptal": "failed"})
+    monitor = GroupMonitor("Grup", None, updater, FakeTracker([("27.09.2025", "db27")]), logging.getLogger("test"))
+
+    assert monitor.scan(listener) == 2
+    assert monitor.cursor == ("m2", "27.09.2025")
+
+    # İkinci taramada imleç verilir; yazılamayan mesaj tekrar denenir, işlenen tekrar gönderilmez
+    listener.records["27.09.2025"].append(_record("m3", "Ayşe kaldı"))
+    updater.outcomes = {}
+    assert monitor.scan(listener) == 2
+    assert listener.cursors == [None, ("m2", "27.09.2025")]
+    assert updater.processed == ["Ali gidildi", "Can iptal", "Can iptal", "Ayşe kaldı"]
+    assert monitor.cursor == ("m3", "27.09.2025")
+
+    assert monitor.scan(listener) == 0
+    assert len(updater.processed) == 4
+
+
+def test_truncated_scan_keeps_the_old_cursor():
+    listener = FakeListener({"27.09.2025": [_record("m1", "Ali gidildi")]})
+    updater = FakeUpdater()
+    monitor = GroupMonitor("Grup", None, updater, FakeTracker([("27.09.2025", "db27")]), logging.getLogger("test"))
+    monitor.scan(listener)
+
+    # Bütçe bitti, m2..m4 yüklenmeden sadece en yeni satır okundu: imleç ilerlemez
+    listener.records["27.09.2025"] = [_record("m5", "Can iptal")]
+    listener.last_scan_complete = False
+    monitor.scan(listener)
+    assert monitor.cursor == ("m1", "27.09.2025")
+    assert updater.processed == ["Ali gidildi", "Can iptal"]
+
+
+class FakeTransport:
+    name = "fake"
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.scrolls = 0
+
+    def page_up(self):
+        self.scrolls += 1
+
+    def extract_rows(self):
+        return self.pages[min(self.scrolls, len(self.pages)) - 1]
+
+
+class ExpiringDeadline:
+    def __init__(self, steps):
+        self.steps = steps
+
+    @property
+    def expired(self):
+        self.steps -= 1
+        return self.steps < 0
+
+
+def _row(data_id, text):
+    return {"raw": text, "text": text, "id": data_id}
+
+
+def test_range_scan_reports_whether_it_reached_the_cursor():
+    pytest.importorskip("selenium")
+    from core.whatsapp_listener import WhatsAppListener
+    from utils.metrics import get_metrics
+
+    today = format_date(datetime.now().date())
+    older = [_row(None, "BUGÜN"), _row("m1", "Ali gidildi"), _row("m2", "Can iptal"), _row("m3", "Ayşe kaldı")]
+    pages = [older[2:], older]
+
+    listener = WhatsAppListener.__new__(WhatsAppListener)
+    listener.logger = logging.getLogger("test")
+    listener.metrics = get_metrics()
+    listener._focus_message_panel = lambda: True
+
+    # Tek kaydırmalık bütçe: imleç (m1) görülmeden kesilir
+    listener.transport, listener.deadline = FakeTransport(pages), ExpiringDeadline(1)
+    listener.get_message_records_by_date_range(today, today, cursor=("m1", today))
+    assert not listener.last_scan_complete
+
+    listener.transport, listener.deadline = FakeTransport(pages), None
+    records = listener.get_message_records_by_date_range(today, today, cursor=("m1", today))
+    assert listener.last_scan_complete
+    assert [record["id"] for record in records[today]] == ["m1", "m2", "m3"]
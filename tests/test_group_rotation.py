@@ -0,0 +1,28 @@
+"""
+Test Group Rotation
+
+Çoklu grup rotasyonu testleri.
+"""
+
+from core.group_rotation import GroupRotation
+
+
+def test_first_cycle_visits_all_groups_then_only_unread():
+    rotation = GroupRotation(["A", "B", "C"], revisit_interval=900)
+
+    assert rotation.plan({}, "A", now=0) == ["A", "B", "C"]
+    for name in ("A", "B", "C"):
+        rotation.mark_scanned(name, now=0)
+
+    # Açık grup her zaman taranır, diğerlerine sadece rozet varsa geçilir
+    assert rotation.plan({}, "C", now=10) == ["C"]
+    assert rotation.plan({"A": 2, "B": 7}, "C", now=10) == ["C", "B", "A"]
+
+
+def test_overdue_groups_are_revisited_without_badge():
+    rotation = GroupRotation(["A", "B"], revisit_interval=60)
+    rotation.mark_scanned("A", now=0)
+    rotation.mark_scanned("B", now=30)
+
+    assert rotation.plan({}, "B", now=70) == ["B", "A"]
+    assert rotation.plan({}, "B", now=50) == ["B"]
@@ -0,0 +1,52 @@
+"""
+Test Logger
+
+Kuyruk tabanlı ve JSON log yapılandırması testleri.
+"""
+
+import json
+
+from utils.logger import setup_logger, shutdown_logging
+
+
+def test_async_json_logging(tmp_path):
+    logger = setup_logger("TestAsyncLogger", async_mode=True, json_format=True, log_dir=str(tmp_path))
+    logger.info("Güncellendi: %s", {"name": "Aynur"}, extra={"message_id": "abc", "stage_timings": {"parse_ms": 0.1}})
+    logger.debug("Görünmemeli: %s", "x")
+    shutdown_logging()
+
+    lines = (tmp_path / "whatsapp_notion_bot.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["msg"] == "Güncellendi: {'name': 'Aynur'}"
+    assert record["message_id"] == "abc"
+    assert record["stage_timings"] == {"parse_ms": 0.1}
+
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def test_duplicate_filter_suppresses_repeats(tmp_path):
+    logger = setup_logger("TestDedupLogger", log_dir=str(tmp_path), dedup_window=300)
+    dedup_filter = logger.filters[0]
+
+    for _ in range(5):
+        logger.warning("Durum bulunamadı: %s", "Selma merhaba")
+    logger.warning("Durum bulunamadı: %s", "Ahmet selam")
+    logger.error("Güncellenemedi: %s", "Aynur")
+    logger.error("Güncellenemedi: %s", "Aynur")
+
+    assert dedup_filter.flush(logger, force=True) == 1
+    shutdown_logging()
+
+    lines = (tmp_path / "whatsapp_notion_bot.log").read_text(encoding="utf-8").splitlines()
+    assert sum("Selma merhaba" in line for line in lines) == 2
+    assert any("🔇 4 tekrar bastırıldı: Durum bulunamadı: Selma merhaba" in line for line in lines)
+    assert sum("Ahmet selam" in line for line in lines) == 1
+    # ERROR seviyesi bastırılmaz
+    assert sum("Güncellenemedi" in line for line in lines) == 2
+
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
@@ -0,0 +1,46 @@
+"""
+Test Memory Watchdog
+
+Bellek eşiği ve kademeli temizleme testleri.
+"""
+
+import logging
+
+from core.memory_watchdog import MemoryWatchdog
+
+
+class FakeDriver:
+    def __init__(self):
+        self.heap = 100 * 1024 * 1024
+        self.nodes = 1000
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Performance.getMetrics":
+            return {"metrics": [
+                {"name": "JSHeapUsedSize", "value": self.heap},
+                {"name": "Nodes", "value": self.nodes},
+            ]}
+        return {}
+
+
+CONFIG = {"max_heap_mb": 400, "max_dom_nodes": 50000, "check_interval": 60}
+
+
+def test_escalates_while_over_threshold():
+    driver = FakeDriver()
+    watchdog = MemoryWatchdog(driver, logging.getLogger("test"), CONFIG)
+
+    assert watchdog.check(now=100) is None
+    driver.nodes = 80000
+    # Kontrol aralığı dolmadan tekrar okunmaz
+    assert watchdog.check(now=120) is None
+    assert watchdog.check(now=200) == "scroll_to_bottom"
+    assert watchdog.check(now=300) == "reopen_chat"
+    assert watchdog.check(now=400) == "recycle_tab"
+    assert watchdog.check(now=500) == "recycle_tab"
+
+    # Eşik altına inince sıfırlanır
+    driver.nodes = 1000
+    assert watchdog.check(now=600) is None
+    driver.heap = 500 * 1024 * 1024
+    assert watchdog.check(now=700) == "scroll_to_bottom"
@@ -0,0 +1,67 @@
+"""
+Test Message Archive
+
+Yerel FTS5 mesaj arşivine toplu yazma, tekilleştirme ve arama testleri.
+"""
+
+import time
+
+from benchmarks.turkish_data import generate_messages, generate_names
+from utils.date_utils import fold_turkish
+from utils.message_archive import MessageArchive, parse_meta
+
+
+def _record(data_id, text, date_str="27.09.2025", meta="[14:02, 27.09.2025] Ahmet Yılmaz: "):
+    return {"id": data_id, "text": text, "meta": meta, "date": date_str}
+
+
+def test_parse_meta():
+    assert parse_meta("[14:02, 27.09.2025] Ayşe Kaya: ") == ("14:02", "Ayşe Kaya")
+    assert parse_meta("[9:05 PM, 9/27/2025] +90 555 000 00 00: ") == ("9:05 PM", "+90 555 000 00 00")
+    assert parse_meta(None) == (None, None)
+
+
+def test_batches_are_deduplicated(tmp_path):
+    archive = MessageArchive(str(tmp_path / "archive.sqlite"))
+    batch = [_record("a1", "Ahmet Yılmaz gidildi"), _record("a2", "Yarın toplantı var"),
+             _record(None, "Tarihsiz mesaj", date_str=None), _record(None, "Metin kimliksiz", meta=None)]
+    assert archive.add_records("Grup", batch) == 3
+    # Sonraki tarama aynı mesajları tekrar okur
+    assert archive.add_records("Grup", batch + [_record("a3", "Yeni mesaj")]) == 1
+    assert archive.add_records("Başka Grup", batch[:1]) == 1
+    assert {row["chat"]: row["messages"] for row in archive.stats()} == {"Başka Grup": 1, "Grup": 4}
+
+
+def test_search_folds_turkish_and_filters(tmp_path):
+    archive = MessageArchive(str(tmp_path / "archive.sqlite"))
+    archive.add_records("Grup", [
+        _record("a1", "IŞIK TOPLANTISI iptal"),
+        _record("a2", "Işık Çelik kaldı", date_str="28.09.2025", meta="[09:00, 28.09.2025] Ayşe Kaya: "),
+        _record("a3", "Bugün hava güzel"),
+    ])
+    results = archive.search("ışık")
+    assert [result["data_id"] for result in results] == ["a2", "a1"]
+    assert results[0]["sender"] == "Ayşe Kaya" and results[0]["date"] == "28.09.2025"
+    assert "[Işık]" in results[0]["snippet"]
+
+    assert [r["data_id"] for r in archive.search("isik toplan")] == ["a1"]
+    assert [r["data_id"] for r in archive.search("ışık", end_date="27.09.2025")] == ["a1"]
+    assert [r["data_id"] for r in archive.search("ışık", sender="Ayşe")] == ["a2"]
+    assert archive.search("ışık", chat="Başka Grup") == []
+    assert archive.search('"hava" OR "celik"', raw=True)[0]["data_id"] == "a2"
+
+
+def test_search_over_large_history_is_fast(tmp_path):
+    archive = MessageArchive(str(tmp_path / "archive.sqlite"))
+    names = generate_names(500, seed=5)
+    samples = generate_messages(names, 50000, seed=5)
+    days = [f"{day:02d}.{month:02d}.2025" for month in range(1, 7) for day in range(1, 29)]
+    for index, day in enumerate(days):
+        batch = samples[index::len(days)]
+        archive.add_records("Grup", (_record(f"{day}-{i}", sample.text, day, None) for i, sample in enumerate(batch)))
+
+    start = time.perf_counter()
+    results = archive.search(names[0], limit=20)
+    assert time.perf_counter() - start < 0.2
+    first = fold_turkish(names[0].split()[0])
+    assert results and all(first in fold_turkish(result["text"]) for result in results)
@@ -0,0 +1,48 @@
+"""
+Test Metrics
+
+Metrik registry ve HTTP endpoint testleri.
+"""
+
+import json
+import urllib.request
+
+from utils.metrics import MetricsRegistry, MetricsServer, MetricsSnapshotWriter
+
+
+def test_prometheus_rendering():
+    registry = MetricsRegistry()
+    registry.inc("notion_retries_total", method="pages.update")
+    registry.inc("notion_retries_total", method="pages.update")
+    registry.set_gauge("scan_interval_seconds", 5)
+    registry.observe("notion_request_seconds", 0.2, method="databases.query")
+
+    text = registry.render_prometheus()
+    assert 'wnb_notion_retries_total{method="pages.update"} 2' in text
+    assert "wnb_scan_interval_seconds 5" in text
+    assert 'wnb_notion_request_seconds_bucket{method="databases.query",le="0.1"} 0' in text
+    assert 'wnb_notion_request_seconds_bucket{method="databases.query",le="0.25"} 1' in text
+    assert 'wnb_notion_request_seconds_count{method="databases.query"} 1' in text
+
+
+def test_timer_and_snapshot(tmp_path):
+    registry = MetricsRegistry()
+    with registry.timer("parser_parse_seconds"):
+        pass
+    writer = MetricsSnapshotWriter(registry, str(tmp_path / "metrics.json"))
+    writer.write()
+
+    data = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert data["histograms"]["parser_parse_seconds"][0]["count"] == 1
+
+
+def test_http_endpoint():
+    registry = MetricsRegistry()
+    registry.inc("scan_cycles_total")
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            assert b"wnb_scan_cycles_total 1" in response.read()
+    finally:
+        server.stop()
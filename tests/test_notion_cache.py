@@ -0,0 +1,119 @@
+"""
+Test Notion Cache
+
+Kalıcı Notion meta veri önbelleği ve NotionClient'ın önbellekle sıcak başlangıç testleri.
+"""
+
+import logging
+from datetime import date
+
+import pytest
+
+from utils.notion_cache import NotionMetadataCache
+
+
+def _row(page_id, name, edited):
+    return {"id": page_id, "last_edited_time": edited,
+            "properties": {"İsim": {"type": "title", "title": [{"plain_text": name}]}}}
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = NotionMetadataCache(path)
+    cache.set_database("parent", "27.09.2025", "db1")
+    cache.set_schema("db1", {"id": "db1", "last_edited_time": "t", "properties": {"Durum": {"type": "status"}}})
+    cache.store_rows("db1", [_row("r1", "Ahmet", "2025-09-27T10:00:00.000Z"),
+                             _row("r2", "Ayşe", "2025-09-27T10:05:00.000Z")], replace=True)
+    cache.close()
+
+    cache = NotionMetadataCache(path)
+    assert cache.get_database("parent", "27.09.2025") == "db1"
+    assert cache.get_schema("db1")["properties"]["Durum"]["type"] == "status"
+    assert [row["id"] for row in cache.get_rows("db1")] == ["r1", "r2"]
+    assert cache.watermark("db1") == "2025-09-27T10:05:00.000Z"
+    assert cache.get_rows("db2") is None and cache.watermark("db2") is None
+
+
+def test_incremental_rows_merge_and_forget(tmp_path):
+    cache = NotionMetadataCache(str(tmp_path / "cache.sqlite"))
+    cache.store_rows("db1", [_row("r1", "Ahmet", "2025-09-27T10:00:00.000Z")], replace=True)
+    cache.store_rows("db1", [_row("r1", "Ahmet Yılmaz", "2025-09-27T11:00:00.000Z"),
+                             _row("r3", "Mehmet", "2025-09-27T11:00:00.000Z")])
+    rows = cache.get_rows("db1")
+    assert [row["id"] for row in rows] == ["r1", "r3"]
+    assert rows[0]["properties"]["İsim"]["title"][0]["plain_text"] == "Ahmet Yılmaz"
+
+    # Kendi yazmamız su seviyesini ilerletmez
+    cache.update_row("db1", _row("r3", "Mehmet", "2025-09-27T12:00:00.000Z"))
+    assert cache.watermark("db1") == "2025-09-27T11:00:00.000Z"
+
+    cache.set_database("parent", "27.09.2025", "db1")
+    cache.forget_database("db1")
+    assert cache.get_rows("db1") is None and cache.get_database("parent", "27.09.2025") is None
+
+
+def test_client_warm_start_skips_discovery(tmp_path, standin):
+    pytest.importorskip("notion_client")
+    from core.message_parser import MessageParser
+    from core.notion_client import NotionClient
+    from core.updater import Updater
+
+    path = str(tmp_path / "cache.sqlite")
+    standin.seed(days=0, extra_pages=120)
+    _, db_id = standin.add_date_page(date(2025, 9, 27), [("Ahmet Yılmaz", None), ("Ayşe Kaya", None)])
+
+    # Soğuk başlangıç: keşif, şema ve satırlar Notion'dan
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url,
+                          cache=NotionMetadataCache(path))
+    updater = Updater(client, MessageParser(), logging.getLogger("test"))
+    assert client.get_database_by_date("27.09.2025") == db_id
+    assert updater.process_text("Ahmet Yılmaz gidildi", db_id) == "updated"
+
+    # Sıcak başlangıç: yeni süreç gibi; sadece pages.update gider
+    standin.reset_counters()
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url,
+                          cache=NotionMetadataCache(path))
+    updater = Updater(client, MessageParser(), logging.getLogger("test"))
+    db = client.get_database_by_date("27.09.2025")
+    assert updater.process_text("Ayşe Kaya iptal", db) == "updated"
+    assert standin.total_requests == 1
+    assert standin.row_status(client.find_row_by_name(db_id, "Ayşe Kaya")) == "Gidilmedi"
+
+    # Sonradan eklenen satır: önbellekte yoksa sadece değişen satırlar çekilir
+    standin.add_row(db_id, "Mehmet Demir")
+    standin.reset_counters()
+    assert client.find_row_by_name(db_id, "Mehmet Demir")
+    assert standin.total_requests == 1
+
+    client.revalidate_cache()
+    assert client.cache.get_database(standin.parent_page_id, "27.09.2025") == db_id
+
+
+@pytest.mark.parametrize("cached", [True, False])
+def test_repeated_status_skips_write(tmp_path, standin, cached):
+    pytest.importorskip("notion_client")
+    from core.message_parser import MessageParser
+    from core.notion_client import NotionClient
+    from core.updater import Updater
+    from utils.metrics import get_metrics
+
+    _, db_id = standin.add_date_page(date(2025, 9, 27), [("Ahmet Yılmaz", None), ("Ayşe Kaya", "Kaldı")])
+    cache = NotionMetadataCache(str(tmp_path / "cache.sqlite")) if cached else None
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url, cache=cache)
+    updater = Updater(client, MessageParser(), logging.getLogger("test"))
+    get_metrics().reset()
+
+    assert updater.process_text("Ahmet Yılmaz gidildi", db_id) == "updated"
+    assert updater.process_text("Ahmet Yılmaz gidildi", db_id) == "unchanged"
+    assert updater.process_text("Ayşe Kaya kaldı", db_id) == "unchanged"
+    assert updater.process_text("Ahmet Yılmaz iptal", db_id) == "updated"
+    assert standin.requests["pages.update"] == 2
+    assert standin.row_status(client.find_row_by_name(db_id, "Ahmet Yılmaz")) == "Gidilmedi"
+
+    avoided = get_metrics().snapshot()["counters"]["updater_writes_avoided_total"]
+    assert sum(entry["value"] for entry in avoided) == 2
+
+    # Eskimiş bilinen değer yazmayı atlatmaz (satır Notion'da elle değiştirilmiş olabilir)
+    client.known_row_max_age = -1
+    assert updater.process_text("Ahmet Yılmaz iptal", db_id) == "updated"
+    assert standin.requests["pages.update"] == 3
@@ -0,0 +1,61 @@
+"""
+Test NotionClient ↔ Stand-in
+
+NotionClient ve Updater'ın yerel Notion stand-in sunucusuna karşı uçtan uca testi.
+"""
+
+import logging
+from datetime import date
+
+import pytest
+
+pytest.importorskip("notion_client")
+
+from core.message_parser import MessageParser
+from core.notion_client import NotionClient
+from core.updater import Updater
+
+
+def test_updater_against_standin(standin):
+    # 150 ek sayfa: tarih sayfası ana sayfanın ikinci sayfasında (sayfalama gerekir)
+    standin.seed(days=0, extra_pages=150)
+    _, db_id = standin.add_date_page(date(2025, 9, 27), [("Ahmet Yılmaz", None), ("Ayşe Kaya", None)])
+
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url)
+    client.max_retries = 3
+    assert client.get_database_by_date("27.09.2025") == db_id
+
+    standin.inject_429()
+    updater = Updater(client, MessageParser(), logging.getLogger("test"))
+    updater.process_text("Ahmet Yılmaz gidildi", db_id)
+
+    row_id = client.find_row_by_name(db_id, "Ahmet Yılmaz")
+    assert standin.row_status(row_id) == "Gidildi"
+    assert standin.requests["rate_limited"] == 1
+
+
+def test_known_rows_survive_concurrent_lookups(standin):
+    import threading
+
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url)
+    client.known_rows_limit = 8
+    errors = []
+
+    # Arama thread'leri yazar, ana thread eskimiş satırları düşürür
+    def churn(offset):
+        try:
+            for i in range(2000):
+                row_id = f"r{(i + offset) % 16}"
+                client._remember_row({"id": row_id, "properties": {}})
+                client._known_row("db", f"r{(i * 7 + offset) % 16}")
+        except Exception as exc:
+            errors.append(exc)
+
+    client.known_row_max_age = -1
+    threads = [threading.Thread(target=churn, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(client._known_rows) <= client.known_rows_limit
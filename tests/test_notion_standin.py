@@ -0,0 +1,56 @@
+"""
+Test Notion Stand-in
+
+Yerel Notion API stand-in sunucusu testleri.
+"""
+
+import json
+import urllib.error
+import urllib.request
+from datetime import date
+
+
+def request(server, verb, path, body=None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(server.base_url + path, data=data, method=verb,
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_children_and_query_are_paginated(standin):
+    standin.seed(days=1, rows_per_day=5, end=date(2025, 9, 27), extra_pages=3)
+
+    status, first = request(standin, "GET", f"/v1/blocks/{standin.parent_page_id}/children?page_size=2")
+    assert status == 200 and first["has_more"] and len(first["results"]) == 2
+    _, rest = request(standin, "GET",
+                      f"/v1/blocks/{standin.parent_page_id}/children?page_size=2&start_cursor={first['next_cursor']}")
+    titles = [b["child_page"]["title"] for b in first["results"] + rest["results"]]
+    assert titles[-1] == "27.09.2025 Cumartesi" and not rest["has_more"]
+
+    db_id = next(iter(standin.databases))
+    _, page = request(standin, "POST", f"/v1/databases/{db_id}/query", {"page_size": 3})
+    _, page2 = request(standin, "POST", f"/v1/databases/{db_id}/query", {"start_cursor": page["next_cursor"]})
+    assert len(page["results"]) + len(page2["results"]) == 5
+
+
+def test_filter_update_and_rate_limit(standin):
+    _, db_id = standin.add_date_page(date(2025, 9, 27), [("Ahmet Yılmaz", None), ("Ayşe Kaya", "Kaldı")])
+
+    _, result = request(standin, "POST", f"/v1/databases/{db_id}/query",
+                        {"filter": {"property": "İsim", "title": {"contains": "ahmet"}}})
+    assert [r["properties"]["İsim"]["title"][0]["plain_text"] for r in result["results"]] == ["Ahmet Yılmaz"]
+    row_id = result["results"][0]["id"]
+
+    standin.inject_429()
+    status, error = request(standin, "PATCH", f"/v1/pages/{row_id}",
+                            {"properties": {"Durum": {"status": {"name": "Gidildi"}}}})
+    assert status == 429 and error["code"] == "rate_limited"
+
+    status, _ = request(standin, "PATCH", f"/v1/pages/{row_id}",
+                        {"properties": {"Durum": {"status": {"name": "Gidildi"}}}})
+    assert status == 200 and standin.row_status(row_id) == "Gidildi"
+    assert standin.requests["pages.update"] == 1 and standin.requests["rate_limited"] == 1
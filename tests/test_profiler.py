@@ -0,0 +1,25 @@
+"""
+Test Profiler
+
+ScanProfiler rapor testleri.
+"""
+
+import time
+
+from utils.profiler import ScanProfiler
+
+
+def test_report_splits_blocking_time(tmp_path):
+    profiler = ScanProfiler("test", output_dir=str(tmp_path))
+    for _ in range(2):
+        profiler.enable()
+        time.sleep(0.01)
+        sum(range(1000))
+        profiler.disable()
+
+    prof_path, summary_path = profiler.write_report(top=5)
+
+    summary = open(summary_path, encoding="utf-8").read()
+    assert "Profil: test (2 döngü)" in summary
+    assert "time.sleep:     0.0" in summary
+    assert (tmp_path / prof_path.split("/")[-1]).exists()
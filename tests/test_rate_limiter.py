@@ -0,0 +1,31 @@
+"""
+Test Rate Limiter
+
+Token bucket ve paylaşılan sınırlayıcı testleri.
+"""
+
+import time
+
+from utils.rate_limiter import RateLimiter, connect_rate_limiter, serve_rate_limiter
+
+
+def test_reserve_spends_burst_then_spaces_requests():
+    limiter = RateLimiter(rate=2, burst=2)
+
+    assert limiter.reserve(now=limiter._updated) == 0
+    assert limiter.reserve(now=limiter._updated) == 0
+    # Kova boş: sıradaki istekler 0.5s aralıklarla
+    assert abs(limiter.reserve(now=limiter._updated) - 0.5) < 1e-9
+    assert abs(limiter.reserve(now=limiter._updated) - 1.0) < 1e-9
+
+
+def test_shared_limiter_over_ipc():
+    limiter = RateLimiter(rate=20, burst=1)
+    address = serve_rate_limiter(limiter, b"test-key")
+    proxy = connect_rate_limiter(address, b"test-key")
+
+    start = time.monotonic()
+    for _ in range(5):
+        proxy.acquire()
+    # İlk istek hemen, sonraki 4 istek 50ms aralıklarla
+    assert time.monotonic() - start >= 0.18
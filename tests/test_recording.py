@@ -0,0 +1,86 @@
+"""
+Test Recording
+
+Oturum kaydı ve kayıttan Notion yanıtlarını oynatma testleri.
+"""
+
+import logging
+from datetime import date
+
+import pytest
+
+from utils.recording import ReplayNotionAPI, SessionRecorder, load_recording
+
+
+def _call(method, kwargs, result=None, error=None):
+    entry = {"type": "notion", "t": 0.0, "method": method, "kwargs": kwargs}
+    if error:
+        entry["error"] = error
+    else:
+        entry["result"] = result
+    return entry
+
+
+def test_replay_answers_identical_calls_in_recorded_order():
+    api = ReplayNotionAPI([
+        _call("databases.query", {"database_id": "db"}, {"results": [1]}),
+        _call("databases.query", {"database_id": "db"}, {"results": [2]}),
+    ])
+
+    assert api.databases.query(database_id="db") == {"results": [1]}
+    assert api.databases.query(database_id="db") == {"results": [2]}
+    # Kayıt bittiyse son yanıt tekrarlanır
+    assert api.databases.query(database_id="db") == {"results": [2]}
+    assert api.calls == 3 and api.misses == 0
+
+
+def test_replay_falls_back_to_latest_response_for_same_target():
+    api = ReplayNotionAPI([
+        _call("blocks.children.list", {"block_id": "page", "page_size": 100}, {"results": ["a"]}),
+    ])
+
+    assert api.blocks.children.list(block_id="page", page_size=100) == {"results": ["a"]}
+    assert api.blocks.children.list(block_id="page", page_size=50) == {"results": ["a"]}
+    assert api.misses == 1
+    with pytest.raises(LookupError):
+        api.blocks.children.list(block_id="other")
+
+
+def test_replay_skips_rate_limits_and_diffs_writes():
+    api = ReplayNotionAPI([
+        _call("pages.update", {"page_id": "p1", "properties": {"S": 1}}, error={"status": 429, "retry_after": "1"}),
+        _call("pages.update", {"page_id": "p1", "properties": {"S": 1}}, {"id": "p1"}),
+        _call("pages.update", {"page_id": "p2", "properties": {"S": 2}}, {"id": "p2"}),
+    ])
+
+    assert api.pages.update(page_id="p1", properties={"S": 1}) == {"id": "p1"}
+    assert api.write_diff() == {"matched": 1, "missing": 1, "extra": 0}
+
+
+def test_record_against_standin_then_replay_offline(tmp_path, standin):
+    pytest.importorskip("notion_client")
+    from core.message_parser import MessageParser
+    from core.notion_client import NotionClient
+    from core.updater import Updater
+    from replay import replay
+
+    path = str(tmp_path / "session.jsonl.gz")
+    _, db_id = standin.add_date_page(date(2025, 9, 27), [("Ahmet Yılmaz", None), ("Ayşe Kaya", None)])
+    recorder = SessionRecorder(path)
+    client = NotionClient("secret_test", standin.parent_page_id, base_url=standin.base_url, recorder=recorder)
+    client.max_retries = 3
+    standin.inject_429()
+    updater = Updater(client, MessageParser(), logging.getLogger("test"), recorder=recorder)
+    for text in ("Ahmet Yılmaz gidildi", "Ayşe Kaya iptal", "Mehmet Demir kaldı", "merhaba"):
+        updater.process_text(text, db_id)
+    recorder.close()
+    # Oynatma ağ olmadan: sunucu kapatılır
+    standin.stop()
+
+    messages, _ = load_recording(path)
+    assert [m["outcome"] for m in messages] == ["updated", "updated", "not_found", "no_status"]
+
+    report = replay(path)
+    assert report["outcome_matches"] == 4 and not report["outcome_mismatches"]
+    assert report["unmatched_calls"] == 0
+    assert report["writes"] == {"matched": 2, "missing": 0, "extra": 0}
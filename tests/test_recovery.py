@@ -0,0 +1,58 @@
+"""
+Test Recovery
+
+Oturum hatası sınıflandırma ve kademeli kurtarma testleri.
+"""
+
+import logging
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+from core.recovery import BROWSER_DEAD, STALE, SessionRecovery, classify_exception
+
+
+class FakeListener:
+    def __init__(self, reload_ok=True):
+        self.current_group = "Grup"
+        self.driver = None
+        self.reload_ok = reload_ok
+        self.calls = []
+
+    def open_group(self, group):
+        self.calls.append(("open_group", group))
+        # Sohbet ancak tarayıcı yeniden başlatıldıktan sonra açılabiliyor
+        return ("restart_browser",) in self.calls
+
+    def reload_page(self):
+        self.calls.append(("reload_page",))
+        return self.reload_ok
+
+    def restart_browser(self):
+        self.calls.append(("restart_browser",))
+
+    def login_to_whatsapp(self):
+        self.calls.append(("login",))
+        return True
+
+
+def test_classify_exception():
+    assert classify_exception(StaleElementReferenceException()) == STALE
+    assert classify_exception(WebDriverException("chrome not reachable")) == BROWSER_DEAD
+    assert classify_exception(ValueError("x")) is None
+
+
+def test_recover_escalates_until_a_step_succeeds():
+    listener = FakeListener(reload_ok=False)
+    recovery = SessionRecovery(listener, logging.getLogger("test"))
+
+    assert recovery.recover(StaleElementReferenceException())
+    assert [call[0] for call in listener.calls] == [
+        "open_group", "reload_page", "restart_browser", "login", "open_group"
+    ]
+    assert recovery.failures == 0
+    assert recovery.backoff() == 0
+    assert [recovery.backoff(n) for n in (1, 2, 4, 10)] == [5, 10, 40, 300]
@@ -0,0 +1,92 @@
+"""
+Test Row Matcher
+
+MessageParser ve satır eşleştirici için sentetik Türkçe veriyle property testleri
+ve sıcak yol hız/bellek eşikleri (benchmarks.parser_bench.GUARDS).
+"""
+
+import random
+import time
+
+from benchmarks.parser_bench import GUARDS, allocations
+from benchmarks.turkish_data import (
+    generate_messages, generate_names, make_rows, make_typo, turkish_upper
+)
+from core.message_parser import MessageParser
+from core.row_matcher import match_row, normalize_name
+
+NAMES = generate_names(300, seed=7)
+ROWS = make_rows(NAMES)
+ROW_IDS = {name: row["id"] for name, row in zip(NAMES, ROWS)}
+SAMPLES = generate_messages(NAMES, 3000, seed=7)
+
+
+def test_parser_finds_status_and_name_for_every_style():
+    parser = MessageParser()
+    for sample in SAMPLES:
+        result = parser.parse_message(sample.text)
+        assert result["status"] == sample.status, sample
+        if sample.status and sample.style in ("normal", "lower", "upper"):
+            assert normalize_name(result["name"]) == normalize_name(sample.name), sample
+
+
+def test_parser_name_never_contains_status_keyword():
+    parser = MessageParser()
+    for sample in SAMPLES:
+        if sample.status:
+            name = normalize_name(parser.parse_message(sample.text)["name"])
+            assert not any(keyword in name for keyword in ("iptal", "ertelendi", "kaldi", "gidildi")), sample
+
+
+def test_matcher_returns_own_row_regardless_of_case():
+    parser = MessageParser()
+    for sample in SAMPLES:
+        if sample.status and sample.style in ("normal", "lower", "upper"):
+            row = match_row(ROWS, parser.parse_message(sample.text)["name"])
+            assert row is not None and row["id"] == ROW_IDS[sample.name], sample
+
+
+def test_matcher_prefers_exact_row_over_longer_name():
+    rows = make_rows(["Yüksel Can Kaya", "Can Kaya"])
+    assert match_row(rows, "CAN KAYA")["id"] == rows[1]["id"]
+    assert match_row(rows, "Yüksel Can")["id"] == rows[0]["id"]
+    assert match_row(rows, "") is None
+    assert match_row(rows, "İLKER") is None
+
+
+def test_matcher_handles_dotted_and_dotless_i():
+    rows = make_rows(["Işıl Işık", "İlker Yıldız"])
+    assert match_row(rows, turkish_upper("Işıl Işık"))["id"] == rows[0]["id"]
+    assert match_row(rows, "ilker yildiz")["id"] == rows[1]["id"]
+
+
+def test_typos_never_raise():
+    rng = random.Random(3)
+    parser = MessageParser()
+    for name in NAMES:
+        row = match_row(ROWS, parser.parse_message(make_typo(name, rng) + " iptal")["name"])
+        assert row is None or row["id"] in ROW_IDS.values()
+
+
+def test_parser_hot_path_guard():
+    parser = MessageParser()
+    texts = [sample.text for sample in generate_messages(NAMES, 10000, seed=1)]
+    start = time.perf_counter()
+    for text in texts:
+        parser.parse_message(text)
+    rate = len(texts) / (time.perf_counter() - start)
+    assert rate >= GUARDS["parse_msg_s"], f"{rate:.0f} msg/s"
+
+    # Tek çağrının geçici belleği; metrik kayıtları yukarıda oluştu
+    assert allocations(parser.parse_message, texts[:2000])["peak_bytes"] <= GUARDS["parse_peak_bytes"]
+
+
+def test_matcher_hot_path_guard():
+    parser = MessageParser()
+    names = [parser.parse_message(sample.text)["name"] for sample in SAMPLES[:1000] if sample.status]
+    start = time.perf_counter()
+    for name in names:
+        match_row(ROWS, name)
+    # GUARDS 500 satır için; burada 300 satır
+    rate = len(names) / (time.perf_counter() - start)
+    assert rate >= GUARDS["match_lookups_s"], f"{rate:.0f} arama/s"
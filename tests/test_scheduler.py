@@ -0,0 +1,51 @@
+"""
+Test Scheduler
+
+ScanScheduler için testler.
+"""
+
+from datetime import datetime
+
+from core.scheduler import ScanScheduler
+
+CONFIG = {
+    "scan_interval": 5,
+    "min_scan_interval": 2,
+    "max_scan_interval": 60,
+    "backoff_factor": 2.0,
+    "off_hours_interval": 600,
+    "working_hours": {"start": "08:00", "end": "20:00"},
+}
+
+NOON = datetime(2025, 9, 27, 12, 0)
+
+
+def test_new_messages_shorten_interval():
+    scheduler = ScanScheduler(CONFIG)
+    assert scheduler.next_interval(3, NOON) == 2
+
+
+def test_idle_backs_off_exponentially_until_max():
+    scheduler = ScanScheduler(CONFIG)
+    intervals = [scheduler.next_interval(0, NOON) for _ in range(6)]
+    assert intervals == [5, 10, 20, 40, 60, 60]
+
+    # Yeni mesaj gelince sıfırlanır
+    assert scheduler.next_interval(1, NOON) == 2
+    assert scheduler.next_interval(0, NOON) == 5
+
+
+def test_off_hours_waits_until_work_start():
+    scheduler = ScanScheduler(CONFIG)
+    assert scheduler.next_interval(0, datetime(2025, 9, 27, 3, 0)) == 600
+    # 07:58 → mesai başlangıcına 2 dakika kaldı
+    assert scheduler.next_interval(0, datetime(2025, 9, 27, 7, 58)) == 120
+    assert scheduler.last_decision["reason"] == "mesai dışı"
+
+
+def test_overnight_working_hours():
+    config = dict(CONFIG, working_hours={"start": "22:00", "end": "06:00"})
+    scheduler = ScanScheduler(config)
+    assert scheduler.is_working_hours(datetime(2025, 9, 27, 23, 0))
+    assert scheduler.is_working_hours(datetime(2025, 9, 27, 5, 0))
+    assert not scheduler.is_working_hours(NOON)
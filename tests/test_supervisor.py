@@ -0,0 +1,53 @@
+"""
+Test Supervisor
+
+Worker konfigürasyon override testleri.
+"""
+
+import json
+import os
+
+import pytest
+
+from supervisor import WorkerSlot, build_worker_overrides, check_worker_profiles
+from utils.config_loader import ConfigLoader
+
+
+def test_worker_overrides_separate_ports_and_logs(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({
+        "session_path": "session",
+        "browser": {"remote_debugging_port": 9222, "text_only": True},
+        "metrics": {"port": 9108}
+    }), encoding="utf-8")
+    config = ConfigLoader(str(path))
+
+    worker = {"session_path": "session_2", "groups": [{"name": "B", "parent_page_id": "p2"}]}
+    overrides = build_worker_overrides(config, 1, worker)
+    merged = ConfigLoader(str(path), overrides)
+
+    assert merged.get("session_path") == "session_2"
+    assert merged.get_groups() == [{"name": "B", "parent_page_id": "p2"}]
+    assert merged.get_browser_config()["remote_debugging_port"] == 9223
+    assert merged.get_browser_config()["text_only"] is True
+    assert merged.get_metrics_config()["port"] == 9109
+    assert merged.get_logging_config()["log_dir"].endswith("worker-2")
+    assert merged.get_recording_config()["path"] == os.path.join("logs", "worker-2", "session_%Y%m%d_%H%M%S.jsonl.gz")
+
+
+def test_workers_never_share_a_chrome_profile(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"session_path": "session"}), encoding="utf-8")
+    config = ConfigLoader(str(path))
+
+    # Profili verilmeyen worker'a kendi klasörü açılır
+    workers = [{"name": "a"}, {"name": "b"}]
+    slots = [WorkerSlot(w["name"], build_worker_overrides(config, i, w)) for i, w in enumerate(workers)]
+    assert [slot.overrides["session_path"] for slot in slots] == ["session_a", "session_b"]
+    check_worker_profiles(slots)
+
+    # Aynı profili açıkça paylaşan worker'lar reddedilir
+    workers = [{"name": "a", "session_path": "shared"}, {"name": "b", "session_path": "./shared"}]
+    slots = [WorkerSlot(w["name"], build_worker_overrides(config, i, w)) for i, w in enumerate(workers)]
+    with pytest.raises(ValueError):
+        check_worker_profiles(slots)
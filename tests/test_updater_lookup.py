@@ -0,0 +1,98 @@
+"""
+Test Updater Lookup
+
+Hedef database'i belli olmayan mesajlar için aday database'lerde (paralel) arama testleri.
+"""
+
+import logging
+import threading
+import time
+
+from core.message_parser import MessageParser
+from core.updater import Updater
+
+
+class FakeNotion:
+    """
+    Database başına sabit gecikmeli ve sabit sonuçlu sahte NotionClient.
+    """
+
+    def __init__(self, tables, delays=None):
+        self.tables = tables
+        self.delays = delays or {}
+        self.lookups = []
+        self.updates = []
+        self._lock = threading.Lock()
+
+    def get_recent_databases(self, days):
+        return list(self.tables)[:days]
+
+    def find_row_match(self, database_id, name):
+        with self._lock:
+            self.lookups.append(database_id)
+        time.sleep(self.delays.get(database_id, 0))
+        return self.tables[database_id].get(name)
+
+    def plan_status_update(self, database_id, row_id, status):
+        return {"status": status, "unchanged": False}
+
+    def apply_status_update(self, database_id, row_id, plan):
+        self.updates.append((database_id, row_id, plan["status"]))
+        return True
+
+
+def _updater(notion, **kwargs):
+    return Updater(notion, MessageParser(), logging.getLogger("test"), **kwargs)
+
+
+def test_name_in_yesterday_costs_one_round_trip():
+    notion = FakeNotion({"today": {}, "yesterday": {"Ayşe Kaya": ("r2", True)}},
+                        delays={"today": 0.2, "yesterday": 0.2})
+    start = time.perf_counter()
+    assert _updater(notion).process_text("Ayşe Kaya gidildi") == "updated"
+    assert time.perf_counter() - start < 0.35
+    assert notion.updates == [("yesterday", "r2", "gidildi")]
+
+
+def test_newer_database_wins_even_if_slower():
+    notion = FakeNotion({"today": {"Can Kaya": ("r1", True)}, "yesterday": {"Can Kaya": ("r9", True)}},
+                        delays={"today": 0.1})
+    _updater(notion).process_text("Can Kaya iptal")
+    assert notion.updates == [("today", "r1", "iptal")]
+
+
+def test_exact_match_beats_earlier_partial_match():
+    notion = FakeNotion({"today": {"Can Kaya": ("r1", False)}, "yesterday": {"Can Kaya": ("r9", True)}})
+    _updater(notion).process_text("Can Kaya iptal")
+    assert notion.updates == [("yesterday", "r9", "iptal")]
+
+
+def test_exact_match_cancels_older_candidates():
+    tables = {f"day{n}": {} for n in range(6)}
+    tables["day0"] = {"Ali Veli": ("r0", True)}
+    notion = FakeNotion(tables, delays={f"day{n}": 0.1 for n in range(1, 6)})
+    _updater(notion, candidate_days=6, max_workers=2).process_text("Ali Veli kaldı")
+    assert notion.updates == [("day0", "r0", "kaldı")]
+    assert len(notion.lookups) < 6
+
+
+def test_sequential_lookup_and_not_found():
+    notion = FakeNotion({"today": {}, "yesterday": {}})
+    assert _updater(notion, parallel_lookup=False).process_text("Mehmet Demir gidildi") == "not_found"
+    assert notion.lookups == ["today", "yesterday"]
+
+
+def test_fallback_only_when_message_day_has_no_match():
+    notion = FakeNotion({"today": {"Ayşe Kaya": ("r1", True)}, "yesterday": {"Ayşe Kaya": ("r2", False)},
+                         "older": {}})
+    # Mesajın gününde kısmi eşleşme var: başka günün tam eşleşmesi yazılmaz, diğer günler aranmaz
+    assert _updater(notion).process_text("Ayşe Kaya gidildi", "yesterday", fallback=True) == "updated"
+    assert notion.updates == [("yesterday", "r2", "gidildi")]
+    assert notion.lookups == ["yesterday"]
+
+    # Mesajın gününde hiç eşleşme yok: son günler aranır
+    assert _updater(notion).process_text("Ayşe Kaya iptal", "older", fallback=True) == "updated"
+    assert notion.updates[-1] == ("today", "r1", "iptal")
+
+    # Fallback kapalıyken sadece mesajın günü aranır
+    assert _updater(notion).process_text("Can Kaya iptal", "yesterday") == "not_found"